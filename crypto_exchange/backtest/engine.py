@@ -0,0 +1,335 @@
+import itertools
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from crypto_exchange.common.indicators import sma
+
+logger = logging.getLogger(__name__)
+
+# Entry order types, per signal bar
+MARKET = 0
+LIMIT = 1
+STOP_MARKET = 2
+
+# Trade exit reasons
+EXIT_SIGNAL = 0
+EXIT_STOP_LOSS = 1
+EXIT_TAKE_PROFIT = 2
+EXIT_END = 3
+
+TRADE_DTYPE = np.dtype([
+    ('entry_time', np.int64),
+    ('exit_time', np.int64),
+    ('side', np.int8),
+    ('qty', np.float64),
+    ('entry_price', np.float64),
+    ('exit_price', np.float64),
+    ('fees', np.float64),
+    ('pnl', np.float64),
+    ('reason', np.int8),
+])
+
+ArrayOrScalar = Union[float, np.ndarray, None]
+
+
+class BacktestResult(NamedTuple):
+    equity: np.ndarray   # account value at every candle close
+    trades: np.ndarray   # TRADE_DTYPE records in time order
+    stats: Dict[str, float]
+
+
+def _per_bar(value: ArrayOrScalar, n: int, dtype=np.float64) -> np.ndarray:
+    if value is None:
+        return np.full(n, np.nan, dtype=dtype)
+    return np.broadcast_to(np.asarray(value, dtype=dtype), (n,))
+
+
+def _first(test: Callable[[int, int], np.ndarray], start: int, n: int) -> int:
+    """
+    Index of the first bar >= start where test is true, or n
+
+    Scans in doubling windows so finding a bar k bars ahead costs O(k)
+    vectorized work, however long the remaining series is.
+    """
+    width = 64
+    while start < n:
+        stop = min(n, start + width)
+        hits = test(start, stop)
+        if hits.any():
+            return start + int(hits.argmax())
+        start = stop
+        width *= 2
+    return n
+
+
+def run_backtest(klines: np.ndarray,
+                 signals: np.ndarray,
+                 order_type: Union[int, np.ndarray] = MARKET,
+                 entry_price: ArrayOrScalar = None,
+                 take_profit: ArrayOrScalar = None,
+                 stop_loss: ArrayOrScalar = None,
+                 take_profit_pct: Optional[float] = None,
+                 stop_loss_pct: Optional[float] = None,
+                 qty: float = 1.0,
+                 taker_fee: float = 0.0004,
+                 maker_fee: float = 0.0002,
+                 slippage: float = 0.0,
+                 order_ttl: int = 1,
+                 initial_cash: float = 10_000.0) -> BacktestResult:
+    """
+    Replay KLINE_DTYPE candles through a one-position fill model
+
+    A non-zero signal on bar i (+1 long, -1 short) places an entry order
+    that is live from bar i + 1, so strategies never see the bar they trade
+    on. Entries are filled as:
+
+    - MARKET: at the next open
+    - LIMIT at entry_price: first bar whose range touches the price within
+      order_ttl bars, at the better of the price and the open (gaps)
+    - STOP_MARKET at entry_price: first bar trading through the stop, at the
+      worse of the stop and the open
+
+    An open position exits on its stop loss (stop-market), its take profit
+    (limit), or at the next open after an opposite signal, which also opens
+    the reverse position. When SL and TP fall in the same candle the SL is
+    assumed to have traded first. Market and stop fills pay taker_fee plus
+    slippage, limit fills pay maker_fee.
+
+    Between events the engine skips ahead with vectorized scans instead of
+    stepping candle by candle.
+
+    Args:
+        klines (np.ndarray): KLINE_DTYPE records sorted by time
+        signals (np.ndarray): int per candle: +1, -1 or 0
+        order_type (int | array): MARKET, LIMIT or STOP_MARKET per signal
+        entry_price (float | array, optional): Limit/stop price per signal
+        take_profit (float | array, optional): Absolute TP price per signal (NaN = none)
+        stop_loss (float | array, optional): Absolute SL price per signal (NaN = none)
+        take_profit_pct (float, optional): TP as a fraction of the fill price (overrides take_profit)
+        stop_loss_pct (float, optional): SL as a fraction of the fill price (overrides stop_loss)
+        qty (float): Position size in base units
+        taker_fee (float): Fee rate for market and stop fills
+        maker_fee (float): Fee rate for limit fills
+        slippage (float): Fractional price penalty on market and stop fills
+        order_ttl (int): Bars a limit/stop entry stays live
+        initial_cash (float): Starting account value
+
+    Returns:
+        BacktestResult: Equity curve, trades and summary statistics
+    """
+    n = len(klines)
+    times = klines['timestamp']
+    opens = np.ascontiguousarray(klines['open'])
+    highs = np.ascontiguousarray(klines['high'])
+    lows = np.ascontiguousarray(klines['low'])
+    closes = np.ascontiguousarray(klines['close'])
+    signals = np.asarray(signals, dtype=np.int8)
+    if len(signals) != n:
+        raise ValueError(f"signals has {len(signals)} entries for {n} candles")
+    order_types = _per_bar(order_type, n, np.int8)
+    entry_prices = _per_bar(entry_price, n)
+    take_profits = _per_bar(take_profit, n)
+    stop_losses = _per_bar(stop_loss, n)
+
+    signal_bars = np.flatnonzero(signals)
+    trades = []
+    next_signal = 0  # signals on bars >= next_signal may open a position
+
+    while True:
+        k = np.searchsorted(signal_bars, next_signal)
+        if k == len(signal_bars) or signal_bars[k] + 1 >= n:
+            break
+        bar = int(signal_bars[k])
+        side = int(signals[bar])
+        start = bar + 1
+        kind = int(order_types[bar])
+
+        # --- entry ---
+        if kind == MARKET:
+            fill_bar = start
+            fill_price = opens[start] * (1 + side * slippage)
+            fee_rate = taker_fee
+        else:
+            price = entry_prices[bar]
+            window_end = min(n, start + order_ttl)
+            if np.isnan(price):
+                raise ValueError(f"Bar {bar}: limit/stop entry without entry_price")
+            touches_below = kind == LIMIT and side > 0 or kind == STOP_MARKET and side < 0
+            if touches_below:
+                fill_bar = _first(lambda a, b: lows[a:b] <= price, start, window_end)
+            else:
+                fill_bar = _first(lambda a, b: highs[a:b] >= price, start, window_end)
+            if fill_bar >= window_end:
+                next_signal = bar + 1
+                continue
+            gap_open = opens[fill_bar]
+            if kind == LIMIT:
+                fill_price = min(price, gap_open) if side > 0 else max(price, gap_open)
+                fee_rate = maker_fee
+            else:
+                fill_price = (max(price, gap_open) if side > 0 else min(price, gap_open)) * (1 + side * slippage)
+                fee_rate = taker_fee
+        entry_fee = fill_price * qty * fee_rate
+
+        tp = fill_price * (1 + side * take_profit_pct) if take_profit_pct is not None else take_profits[bar]
+        sl = fill_price * (1 - side * stop_loss_pct) if stop_loss_pct is not None else stop_losses[bar]
+
+        # --- exit ---
+        # NaN levels never compare true, so missing TP/SL simply never trigger
+        if side > 0:
+            def exit_test(a, b):
+                hits = (lows[a:b] <= sl) | (highs[a:b] >= tp)
+                # an opposite signal on bar j-1 exits at the open of bar j
+                if a > fill_bar:
+                    hits |= signals[a - 1:b - 1] < 0
+                else:
+                    hits[1:] |= signals[a:b - 1] < 0
+                return hits
+        else:
+            def exit_test(a, b):
+                hits = (highs[a:b] >= sl) | (lows[a:b] <= tp)
+                if a > fill_bar:
+                    hits |= signals[a - 1:b - 1] > 0
+                else:
+                    hits[1:] |= signals[a:b - 1] > 0
+                return hits
+
+        exit_bar = _first(exit_test, fill_bar, n)
+        if exit_bar >= n:
+            exit_bar = n - 1
+            exit_price = closes[exit_bar]
+            reason = EXIT_END
+            exit_fee_rate = 0.0
+            next_signal = n
+        elif exit_bar > fill_bar and signals[exit_bar - 1] == -side:
+            exit_price = opens[exit_bar] * (1 - side * slippage)
+            reason = EXIT_SIGNAL
+            exit_fee_rate = taker_fee
+            next_signal = exit_bar - 1  # the reversing signal opens the next trade
+        elif (lows[exit_bar] <= sl) if side > 0 else (highs[exit_bar] >= sl):
+            gap_open = opens[exit_bar] if exit_bar > fill_bar else sl
+            exit_price = (min(sl, gap_open) if side > 0 else max(sl, gap_open)) * (1 - side * slippage)
+            reason = EXIT_STOP_LOSS
+            exit_fee_rate = taker_fee
+            next_signal = exit_bar
+        else:
+            gap_open = opens[exit_bar] if exit_bar > fill_bar else tp
+            exit_price = max(tp, gap_open) if side > 0 else min(tp, gap_open)
+            reason = EXIT_TAKE_PROFIT
+            exit_fee_rate = maker_fee
+            next_signal = exit_bar
+
+        fees = entry_fee + exit_price * qty * exit_fee_rate
+        pnl = side * (exit_price - fill_price) * qty - fees
+        trades.append((times[fill_bar], times[exit_bar], side, qty, fill_price, exit_price, fees, pnl, reason,
+                       fill_bar, exit_bar, entry_fee))
+
+    equity = np.full(n, float(initial_cash))
+    realized = np.zeros(n)
+    for trade in trades:
+        side, fill_price, pnl, fill_bar, exit_bar, entry_fee = trade[2], trade[4], trade[7], trade[9], trade[10], trade[11]
+        realized[exit_bar] += pnl
+        # Mark the open position to each close until the exit candle
+        equity[fill_bar:exit_bar] += side * (closes[fill_bar:exit_bar] - fill_price) * qty - entry_fee
+    equity += np.cumsum(realized)
+
+    records = np.array([trade[:9] for trade in trades], dtype=TRADE_DTYPE)
+    return BacktestResult(equity, records, summarize(equity, records, times))
+
+
+def summarize(equity: np.ndarray, trades: np.ndarray, times: Optional[np.ndarray] = None) -> Dict[str, float]:
+    """Total return, max drawdown, annualized Sharpe, trade count, win rate and profit factor"""
+    stats = {
+        'total_return': float(equity[-1] / equity[0] - 1) if len(equity) else 0.0,
+        'max_drawdown': float((1 - equity / np.maximum.accumulate(equity)).max()) if len(equity) else 0.0,
+        'trades': int(len(trades)),
+        'win_rate': float((trades['pnl'] > 0).mean()) if len(trades) else 0.0,
+        'profit_factor': float('nan'),
+        'sharpe': 0.0,
+    }
+    losses = -trades['pnl'][trades['pnl'] < 0].sum()
+    if losses > 0:
+        stats['profit_factor'] = float(trades['pnl'][trades['pnl'] > 0].sum() / losses)
+    returns = np.diff(equity) / equity[:-1]
+    if len(returns) > 1 and returns.std() > 0:
+        bars_per_year = 365 * 86_400_000 / np.median(np.diff(times)) if times is not None and len(times) > 1 else 1.0
+        stats['sharpe'] = float(returns.mean() / returns.std() * np.sqrt(bars_per_year))
+    return stats
+
+
+# --- parameter sweeps ---
+
+_worker_klines: Optional[np.ndarray] = None
+
+
+def _init_worker(klines: np.ndarray) -> None:
+    # Each worker receives the candles once instead of with every task
+    global _worker_klines
+    _worker_klines = klines
+
+
+def _run_one(args: Tuple[Callable[..., Dict[str, Any]], Dict[str, Any], Dict[str, Any]]) -> Dict[str, float]:
+    strategy, params, backtest_kwargs = args
+    orders = strategy(_worker_klines, **params)
+    return run_backtest(_worker_klines, **{**backtest_kwargs, **orders}).stats
+
+
+def parameter_grid(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Every combination of the values in grid, as keyword dicts"""
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+def sweep(strategy: Callable[..., Dict[str, Any]], klines: np.ndarray, grid: Dict[str, List[Any]],
+          max_workers: Optional[int] = None, **backtest_kwargs) -> List[Tuple[Dict[str, Any], Dict[str, float]]]:
+    """
+    Backtest every parameter combination on a process pool
+
+    Args:
+        strategy (callable): Module-level function strategy(klines, **params)
+            returning run_backtest keyword arguments (at least 'signals')
+        klines (np.ndarray): KLINE_DTYPE candles, e.g. from load_klines()
+        grid (dict): Parameter name -> list of values to try
+        max_workers (int, optional): Worker processes (default: CPU count)
+        **backtest_kwargs: Fixed run_backtest arguments (fees, qty, ...)
+
+    Returns:
+        list: (params, stats) per combination, in grid order
+    """
+    combinations = parameter_grid(grid)
+    max_workers = max_workers or os.cpu_count() or 1
+    tasks = [(strategy, params, backtest_kwargs) for params in combinations]
+    chunksize = max(1, len(tasks) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(klines,)) as executor:
+        results = list(executor.map(_run_one, tasks, chunksize=chunksize))
+    return list(zip(combinations, results))
+
+
+def sma_crossover(klines: np.ndarray, fast: int = 20, slow: int = 50, stop_loss_pct: float = 0.02,
+                  take_profit_pct: float = 0.04) -> Dict[str, Any]:
+    """Example strategy: go long/short when the fast SMA crosses the slow SMA"""
+    close = klines['close']
+    above = sma(close, fast) > sma(close, slow)
+    signals = np.zeros(len(close), dtype=np.int8)
+    crossed = np.flatnonzero(above[1:] != above[:-1]) + 1
+    crossed = crossed[crossed >= slow]
+    signals[crossed] = np.where(above[crossed], 1, -1)
+    return {'signals': signals, 'stop_loss_pct': stop_loss_pct, 'take_profit_pct': take_profit_pct}
+
+
+if __name__ == "__main__":
+    import sys
+
+    from crypto_exchange.binance.backfill_klines_binance import load_klines
+
+    logging.basicConfig(level=logging.INFO)
+    # python -m crypto_exchange.backtest.engine <cache root> BTCUSDT 1m
+    root, symbol, interval = sys.argv[1:4]
+    candles = load_klines(root, symbol, interval)
+    results = sweep(sma_crossover, candles, {'fast': [10, 20, 30], 'slow': [50, 100, 200]})
+    for params, stats in sorted(results, key=lambda item: item[1]['total_return'], reverse=True):
+        print(params, {name: round(value, 4) for name, value in stats.items()})
@@ -0,0 +1,54 @@
+"""
+Backtest throughput: candles per second of run_backtest, and a process-pool sweep
+
+Runs on a synthetic random-walk series in KLINE_DTYPE so no cached data is
+needed; the SMA crossover example strategy trades often enough that entry
+and exit handling dominates, not just the scans between trades.
+
+Usage (from the repository root):
+    python -m crypto_exchange.benchmarks.bench_backtest [candles]
+"""
+import sys
+import time
+
+import numpy as np
+
+from crypto_exchange.backtest.engine import run_backtest, sma_crossover, sweep
+from crypto_exchange.binance.getOHLCV_binance import KLINE_DTYPE
+
+
+def synthetic_klines(n, seed=1):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, n)))
+    klines = np.zeros(n, dtype=KLINE_DTYPE)
+    klines['timestamp'] = np.arange(n, dtype=np.int64) * 60_000
+    klines['open'] = np.concatenate(([close[0]], close[:-1]))
+    klines['close'] = close
+    klines['high'] = np.maximum(klines['open'], close) * (1 + np.abs(rng.normal(0, 0.0005, n)))
+    klines['low'] = np.minimum(klines['open'], close) * (1 - np.abs(rng.normal(0, 0.0005, n)))
+    klines['volume'] = 1.0
+    return klines
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    klines = synthetic_klines(n)
+    orders = sma_crossover(klines, fast=50, slow=200)
+
+    start = time.perf_counter()
+    result = run_backtest(klines, **orders)
+    seconds = time.perf_counter() - start
+    print(f"single run   {n:,} candles, {result.stats['trades']:,} trades: "
+          f"{seconds * 1000:8.1f} ms  ({n / seconds / 1e6:.2f}M candles/s)")
+
+    grid = {'fast': [10, 20, 30, 50], 'slow': [100, 200, 400]}
+    start = time.perf_counter()
+    sweep(sma_crossover, klines, grid)
+    seconds = time.perf_counter() - start
+    runs = len(grid['fast']) * len(grid['slow'])
+    print(f"sweep        {runs} runs on a process pool: "
+          f"{seconds * 1000:8.1f} ms  ({n * runs / seconds / 1e6:.2f}M candles/s)")
+
+
+if __name__ == "__main__":
+    main()
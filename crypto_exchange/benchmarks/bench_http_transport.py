@@ -0,0 +1,104 @@
+"""
+Per-request latency of module-level requests.post vs the pooled keep-alive session
+
+Runs a local HTTPS mock server with a throwaway self-signed certificate
+(requires the openssl CLI) and posts small JSON bodies to it.
+
+Usage (from the repository root):
+    python -m crypto_exchange.benchmarks.bench_http_transport [n_requests]
+"""
+import json
+import os
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from crypto_exchange.common.http_transport import close_sessions, get_session
+
+
+class MockExchangeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        body = json.dumps({"code": "00000", "data": {"orderId": "1"}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_certificate(directory):
+    cert = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", key, "-out", cert, "-days", "1",
+            "-subj", "/CN=localhost",
+            "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True
+    )
+    return cert, key
+
+
+def start_server(cert, key):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockExchangeHandler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def measure(post, url, cert, n):
+    body = {"symbol": "BTCUSDT", "side": "buy", "size": "0.001"}
+    latencies = []
+    for _ in range(n):
+        start = time.perf_counter()
+        post(url, json=body, verify=cert).json()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(name, latencies):
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"{name:<24} mean {statistics.mean(latencies):7.3f} ms   "
+          f"p50 {statistics.median(latencies):7.3f} ms   p99 {p99:7.3f} ms")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = make_certificate(tmp)
+        server = start_server(cert, key)
+        url = f"https://127.0.0.1:{server.server_address[1]}/api/mix/v1/order/placeOrder"
+        try:
+            session = get_session(url)
+            measure(session.post, url, cert, 5)  # warm up the pool
+
+            print(f"{n} POST requests against {url}")
+            report("requests.post (before)", measure(requests.post, url, cert, n))
+            report("pooled session (after)", measure(session.post, url, cert, n))
+        finally:
+            close_sessions()
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Indicators: per-candle Python loops over get_klines dicts vs common.indicators
+
+The naive functions below are the loop-over-dicts style strategies used so
+far; equivalence is covered by crypto_exchange/tests/test_indicators.py.
+
+Usage (from the repository root):
+    python -m crypto_exchange.benchmarks.bench_indicators [candles]
+"""
+import math
+import sys
+import time
+
+import numpy as np
+
+from crypto_exchange.common import indicators
+from crypto_exchange.benchmarks.bench_backtest import synthetic_klines
+
+
+def naive_sma(closes, period):
+    return [sum(closes[i - period + 1:i + 1]) / period if i >= period - 1 else math.nan for i in range(len(closes))]
+
+
+def naive_ema(closes, period):
+    out = [math.nan] * len(closes)
+    start = next((i for i, c in enumerate(closes) if not math.isnan(c)), len(closes))
+    if start + period <= len(closes):
+        value = sum(closes[start:start + period]) / period
+        out[start + period - 1] = value
+        alpha = 2 / (period + 1)
+        for i in range(start + period, len(closes)):
+            value = alpha * closes[i] + (1 - alpha) * value
+            out[i] = value
+    return out
+
+
+def naive_rsi(closes, period=14):
+    out = [math.nan] * len(closes)
+    gains = [max(closes[i] - closes[i - 1], 0) for i in range(1, len(closes))]
+    losses = [max(closes[i - 1] - closes[i], 0) for i in range(1, len(closes))]
+    avg_gain = sum(gains[:period]) / period
+    avg_loss = sum(losses[:period]) / period
+    for i in range(period, len(closes)):
+        if i > period:
+            avg_gain = (avg_gain * (period - 1) + gains[i - 1]) / period
+            avg_loss = (avg_loss * (period - 1) + losses[i - 1]) / period
+        total = avg_gain + avg_loss
+        out[i] = 100 * avg_gain / total if total > 0 else 50.0
+    return out
+
+
+def naive_atr(candles, period=14):
+    out = [math.nan] * len(candles)
+    trs = [max(c['high'] - c['low'], abs(c['high'] - p['close']), abs(c['low'] - p['close']))
+           for p, c in zip(candles, candles[1:])]
+    value = sum(trs[:period]) / period
+    out[period] = value
+    for i in range(period + 1, len(candles)):
+        value = (value * (period - 1) + trs[i - 1]) / period
+        out[i] = value
+    return out
+
+
+def naive_bollinger(closes, period=20, num_std=2.0):
+    upper, lower = [], []
+    for i in range(len(closes)):
+        if i < period - 1:
+            upper.append(math.nan)
+            lower.append(math.nan)
+            continue
+        window = closes[i - period + 1:i + 1]
+        mean = sum(window) / period
+        std = math.sqrt(sum((c - mean) ** 2 for c in window) / period)
+        upper.append(mean + num_std * std)
+        lower.append(mean - num_std * std)
+    return upper, lower
+
+
+def naive_vwap(candles, session_ms=86_400_000):
+    out, session, pv, volume = [], None, 0.0, 0.0
+    for c in candles:
+        if c['timestamp'] // session_ms != session:
+            session, pv, volume = c['timestamp'] // session_ms, 0.0, 0.0
+        pv += (c['high'] + c['low'] + c['close']) / 3 * c['volume']
+        volume += c['volume']
+        out.append(pv / volume)
+    return out
+
+
+def naive_macd(closes, fast=12, slow=26, signal=9):
+    line = [f - s for f, s in zip(naive_ema(closes, fast), naive_ema(closes, slow))]
+    return line, naive_ema(line, signal)
+
+
+def timed(function, repeat=1):
+    seconds = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        seconds = min(seconds, time.perf_counter() - start)
+    return result, seconds
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    klines = synthetic_klines(n)
+    klines['volume'] = np.random.default_rng(2).uniform(1, 100, n)
+    candles = [dict(zip(klines.dtype.names, row)) for row in klines.tolist()]
+    closes = [c['close'] for c in candles]
+    h, l, c, v, t = (klines[name] for name in ('high', 'low', 'close', 'volume', 'timestamp'))
+
+    cases = {
+        'SMA(20)': (lambda: naive_sma(closes, 20), lambda: indicators.sma(c, 20),
+                    lambda: [s.update(x) for s in [indicators.SMA(20)] for x in closes]),
+        'EMA(20)': (lambda: naive_ema(closes, 20), lambda: indicators.ema(c, 20),
+                    lambda: [s.update(x) for s in [indicators.EMA(20)] for x in closes]),
+        'RSI(14)': (lambda: naive_rsi(closes), lambda: indicators.rsi(c),
+                    lambda: [s.update(x) for s in [indicators.RSI()] for x in closes]),
+        'ATR(14)': (lambda: naive_atr(candles), lambda: indicators.atr(h, l, c),
+                    lambda: [s.update(k['high'], k['low'], k['close']) for s in [indicators.ATR()] for k in candles]),
+        'Bollinger(20)': (lambda: naive_bollinger(closes)[0], lambda: indicators.bollinger_bands(c)[1],
+                          lambda: [s.update(x)[1] for s in [indicators.BollingerBands()] for x in closes]),
+        'VWAP(day)': (lambda: naive_vwap(candles), lambda: indicators.vwap(h, l, c, v, t),
+                      lambda: [s.update(k['high'], k['low'], k['close'], k['volume'], k['timestamp'])
+                               for s in [indicators.VWAP()] for k in candles]),
+        'MACD(12,26,9)': (lambda: naive_macd(closes)[1], lambda: indicators.macd(c)[1],
+                          lambda: [s.update(x)[1] for s in [indicators.MACD()] for x in closes]),
+    }
+
+    print(f"{n:,} candles            naive loop   vectorized   speed-up   incremental/candle")
+    for name, (naive, vectorized, incremental) in cases.items():
+        _, naive_seconds = timed(naive)
+        _, vector_seconds = timed(vectorized, repeat=5)
+        _, stream_seconds = timed(incremental)
+        print(f"{name:20s} {naive_seconds * 1000:9.1f} ms {vector_seconds * 1000:9.2f} ms "
+              f"{naive_seconds / vector_seconds:8.0f}x {stream_seconds / n * 1e6:12.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Kline parsing: list-of-dicts (get_klines) vs KLINE_DTYPE arrays (as_arrays=True)
+
+Both paths start from the same raw response body of a 1000-candle fixture,
+so the JSON decode is included in the list-of-dicts timing as in production.
+
+Usage (from the repository root):
+    python -m crypto_exchange.benchmarks.bench_kline_parsing [repeats]
+"""
+import json
+import random
+import sys
+import timeit
+
+import numpy as np
+
+from crypto_exchange.binance.getOHLCV_binance import format_klines, parse_klines_array
+
+
+def make_fixture(n=1000, seed=7):
+    """Raw /api/v3/klines body with n one-minute candles"""
+    rng = random.Random(seed)
+    open_time = 1704067200000
+    price = 42000.0
+    rows = []
+    for _ in range(n):
+        high = price + rng.random() * 50
+        low = price - rng.random() * 50
+        close = rng.uniform(low, high)
+        volume = rng.random() * 100
+        rows.append([
+            open_time, f"{price:.8f}", f"{high:.8f}", f"{low:.8f}", f"{close:.8f}",
+            f"{volume:.8f}", open_time + 59999, f"{volume * close:.8f}",
+            rng.randint(100, 5000), f"{volume / 2:.8f}", f"{volume * close / 2:.8f}", "0"
+        ])
+        open_time += 60000
+        price = close
+    return json.dumps(rows, separators=(',', ':')).encode('utf-8')
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    payload = make_fixture()
+
+    # Both paths must agree before their speed is worth comparing
+    dicts = format_klines(json.loads(payload))
+    records = parse_klines_array(payload)
+    assert len(dicts) == len(records) == 1000
+    assert np.allclose(records['close'], [k['close'] for k in dicts])
+    assert records['timestamp'][0] == int(dicts[0]['timestamp'].timestamp() * 1000)
+
+    as_dicts = min(timeit.repeat(lambda: format_klines(json.loads(payload)), number=repeats, repeat=5))
+    as_arrays = min(timeit.repeat(lambda: parse_klines_array(payload), number=repeats, repeat=5))
+
+    print(f"1000-candle payload ({len(payload)} bytes), best of 5 x {repeats}")
+    print(f"list of dicts : {as_dicts / repeats * 1e6:9.1f} us per payload")
+    print(f"KLINE_DTYPE   : {as_arrays / repeats * 1e6:9.1f} us per payload")
+    print(f"speed-up      : {as_dicts / as_arrays:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
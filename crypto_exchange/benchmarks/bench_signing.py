@@ -0,0 +1,92 @@
+"""
+Request signing: per-call hmac.new (previous _generate_signature bodies) vs HmacSigner
+
+The "before" functions below are the implementations the exchange classes
+used until they switched to the shared signer; both sides are checked to
+produce identical signatures before being timed.
+
+Usage (from the repository root):
+    python -m crypto_exchange.benchmarks.bench_signing [iterations]
+"""
+import base64
+import hashlib
+import hmac
+import sys
+import timeit
+
+from crypto_exchange.common.signing import HmacSigner
+
+SECRET = "kQ2xV8mZp4RtYw7nB1cD5fG9hJ3lN6sA0eU2iO4pX8zC7vB5mN1qW3eR6tY9uI0o"
+PARAMS = {
+    "api_key": "mx0vglBqh6abc123",
+    "symbol": "BTCUSDT",
+    "side": "Buy",
+    "type": "LIMIT",
+    "qty": "0.001",
+    "price": "42000.5",
+    "timeInForce": "GTC",
+    "timestamp": 1704067200000,
+}
+TIMESTAMP = "1704067200000"
+ENDPOINT = "/api/mix/v1/order/placeOrder"
+BODY = '{"symbol":"BTCUSDT_UMCBL","marginCoin":"USDT","size":"0.001","side":"open_long","orderType":"market"}'
+
+
+def bybit_spot_before(params):
+    param_str = ""
+    for key in sorted(params.keys()):
+        param_str += f"{key}={params[key]}&"
+    param_str = param_str[:-1]
+    return hmac.new(SECRET.encode("utf-8"), param_str.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def mexc_before(params):
+    query_string = '&'.join([f"{k}={v}" for k, v in sorted(params.items())])
+    return hmac.new(SECRET.encode('utf-8'), query_string.encode('utf-8'), hashlib.sha256).hexdigest()
+
+
+def bitget_futures_before(timestamp, method, endpoint, body):
+    message = timestamp + method + endpoint + body
+    return hmac.new(SECRET.encode('utf-8'), message.encode('utf-8'), hashlib.sha256).hexdigest()
+
+
+def bitget_spot_before(timestamp, method, endpoint, body):
+    message = timestamp + method.upper() + endpoint + body
+    mac = hmac.new(bytes(SECRET, 'utf-8'), bytes(message, 'utf-8'), hashlib.sha256)
+    return base64.b64encode(mac.digest()).decode('utf-8')
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    signer = HmacSigner(SECRET)
+
+    cases = [
+        ("Bybit spot (sorted params, hex)",
+         lambda: bybit_spot_before(PARAMS),
+         lambda: signer.sign_params_hex(PARAMS)),
+        ("MEXC spot/futures (sorted params, hex)",
+         lambda: mexc_before(PARAMS),
+         lambda: signer.sign_params_hex(PARAMS)),
+        ("Bitget futures (prehash, hex)",
+         lambda: bitget_futures_before(TIMESTAMP, "POST", ENDPOINT, BODY),
+         lambda: signer.sign_hex(TIMESTAMP + "POST" + ENDPOINT + BODY)),
+        ("Bitget spot (prehash, base64)",
+         lambda: bitget_spot_before(TIMESTAMP, "post", ENDPOINT, BODY),
+         lambda: signer.sign_base64(TIMESTAMP + "POST" + ENDPOINT + BODY)),
+    ]
+
+    # Keys longer than the hash block size take the pre-hashed path
+    long_key = "x" * 200
+    assert HmacSigner(long_key).sign_hex(BODY) == hmac.new(long_key.encode(), BODY.encode(), hashlib.sha256).hexdigest()
+
+    print(f"best of 5 x {iterations} signatures")
+    for name, before, after in cases:
+        assert before() == after(), name
+        t_before = min(timeit.repeat(before, number=iterations, repeat=5))
+        t_after = min(timeit.repeat(after, number=iterations, repeat=5))
+        print(f"{name:40s} {iterations / t_before:10,.0f}/s -> {iterations / t_after:10,.0f}/s"
+              f"  ({t_before / t_after:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Startup cost: importing the trading modules and constructing BinanceFuturesTrader
+
+Every scenario runs in a fresh interpreter so module caches and warm
+connections do not carry over. Outbound socket connections are counted to
+show which steps hit the network; nothing is placed or changed on the
+account (the traders are only constructed, never used).
+
+Usage (from the repository root, with the SDKs installed):
+    python -m crypto_exchange.benchmarks.bench_startup [repeats]
+"""
+import json
+import statistics
+import subprocess
+import sys
+
+PROBE = """
+import json, socket, sys, time
+connects = [0]
+_connect = socket.socket.connect
+def counting_connect(self, address):
+    connects[0] += 1
+    return _connect(self, address)
+socket.socket.connect = counting_connect
+start = time.perf_counter()
+{body}
+print(json.dumps({{"seconds": time.perf_counter() - start, "connects": connects[0]}}))
+"""
+
+SCENARIOS = {
+    "import dat_lenh_spot_binance": "import crypto_exchange.binance.dat_lenh_spot_binance",
+    "import get_balance_bitget": "import crypto_exchange.bitget.get_balance_bitget",
+    "import + BinanceFuturesTrader()": (
+        "from crypto_exchange.binance.dat_lenh_futures_binance import BinanceFuturesTrader\n"
+        "BinanceFuturesTrader('bench_key', 'bench_secret')"
+    ),
+}
+
+
+def run(body):
+    process = subprocess.run([sys.executable, "-c", PROBE.format(body=body)], capture_output=True, text=True)
+    if process.returncode:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"median of {repeats} fresh interpreters")
+    for name, body in SCENARIOS.items():
+        try:
+            results = [run(body) for _ in range(repeats)]
+        except RuntimeError as e:
+            print(f"{name:34s} failed: {e}")
+            continue
+        seconds = statistics.median(result["seconds"] for result in results)
+        connects = max(result["connects"] for result in results)
+        print(f"{name:34s} {seconds * 1000:8.1f} ms   {connects} network connection(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from crypto_exchange.binance.getOHLCV_binance import INTERVAL_MS, KLINE_DTYPE, parse_klines_array
+from crypto_exchange.common.http_transport import get_session
+
+logger = logging.getLogger(__name__)
+
+KLINES_URL = "https://api.binance.com/api/v3/klines"
+MAX_LIMIT = 1000
+DAY_MS = 86_400_000
+
+
+def _day_name(day: int) -> str:
+    return datetime.fromtimestamp(day * DAY_MS / 1000, tz=timezone.utc).strftime('%Y-%m-%d')
+
+
+class KlineBackfiller:
+    def __init__(self, root: str, base_url: str = KLINES_URL, pause: float = 0.0):
+        """
+        Paged kline downloader that streams candles into per-day .npy partitions
+
+        Files are laid out as <root>/<symbol>/<interval>/<YYYY-MM-DD>.npy and
+        hold KLINE_DTYPE records sorted by open time.
+
+        Args:
+            root (str): Directory of the on-disk cache
+            base_url (str): Klines endpoint (Binance spot by default)
+            pause (float): Seconds to sleep between pages to spare request weight
+        """
+        self.root = root
+        self.base_url = base_url
+        self.pause = pause
+        self.session = get_session(base_url)
+
+    def _partition_dir(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.root, symbol.upper(), interval)
+
+    def _day_files(self, symbol: str, interval: str,
+                   start_ms: Optional[int] = None, end_ms: Optional[int] = None) -> List[str]:
+        """Day partitions, oldest first, limited to the days touching [start_ms, end_ms]"""
+        directory = self._partition_dir(symbol, interval)
+        if not os.path.isdir(directory):
+            return []
+        first_day = _day_name(start_ms // DAY_MS) if start_ms is not None else ''
+        last_day = _day_name(end_ms // DAY_MS) if end_ms is not None else '9999'
+        return sorted(
+            os.path.join(directory, name)
+            for name in os.listdir(directory)
+            if name.endswith('.npy') and first_day <= name[:10] <= last_day
+        )
+
+    def _stored_timestamps(self, symbol: str, interval: str, start_ms: int, end_ms: int) -> np.ndarray:
+        """Open times already on disk within [start_ms, end_ms]; only the timestamp column is read"""
+        files = self._day_files(symbol, interval, start_ms, end_ms)
+        if not files:
+            return np.empty(0, dtype=np.int64)
+        timestamps = np.concatenate([np.load(f, mmap_mode='r')['timestamp'] for f in files])
+        return timestamps[(timestamps >= start_ms) & (timestamps <= end_ms)]
+
+    def stored_range(self, symbol: str, interval: str) -> Optional[Tuple[int, int]]:
+        """
+        First and last stored open time for a symbol/interval
+
+        Returns:
+            tuple: (first_ms, last_ms), or None when nothing is stored yet
+        """
+        files = self._day_files(symbol, interval)
+        if not files:
+            return None
+        first = np.load(files[0], mmap_mode='r')
+        last = np.load(files[-1], mmap_mode='r')
+        return int(first['timestamp'][0]), int(last['timestamp'][-1])
+
+    def missing_ranges(self, symbol: str, interval: str, start_ms: int, end_ms: int) -> List[Tuple[int, int]]:
+        """
+        Ranges of [start_ms, end_ms] that are not covered by the cache yet
+
+        Gaps are found from the stored open times, so a hole between two
+        earlier backfills is fetched as well as the edges. A hole the
+        exchange itself has no candles for (an outage) costs one empty
+        request per run.
+        """
+        step = INTERVAL_MS[interval]
+        timestamps = self._stored_timestamps(symbol, interval, start_ms, end_ms)
+        if len(timestamps) == 0:
+            return [(start_ms, end_ms)]
+        ranges = []
+        if timestamps[0] - start_ms >= step:
+            ranges.append((start_ms, int(timestamps[0]) - 1))
+        for gap in np.flatnonzero(np.diff(timestamps) > step):
+            ranges.append((int(timestamps[gap]) + step, int(timestamps[gap + 1]) - 1))
+        if end_ms >= timestamps[-1] + step:
+            ranges.append((int(timestamps[-1]) + step, end_ms))
+        return ranges
+
+    def _fetch_pages(self, symbol: str, interval: str, start_ms: int, end_ms: int) -> Iterator[np.ndarray]:
+        step = INTERVAL_MS[interval]
+        cursor = start_ms
+        while cursor <= end_ms:
+            response = self.session.get(self.base_url, params={
+                "symbol": symbol.upper(),
+                "interval": interval,
+                "startTime": cursor,
+                "endTime": end_ms,
+                "limit": MAX_LIMIT
+            })
+            response.raise_for_status()
+            batch = parse_klines_array(response.content)
+            if len(batch) == 0:
+                return
+            yield batch
+            cursor = int(batch['timestamp'][-1]) + step
+            if len(batch) < MAX_LIMIT:
+                return
+            if self.pause:
+                time.sleep(self.pause)
+
+    def _write_day(self, symbol: str, interval: str, day: int, records: np.ndarray) -> int:
+        """Merge records into the day's file; returns how many were new"""
+        directory = self._partition_dir(symbol, interval)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{_day_name(day)}.npy")
+        added = len(records)
+        if os.path.exists(path):
+            existing = np.load(path)
+            records = np.concatenate([existing, records])
+            _, unique = np.unique(records['timestamp'], return_index=True)
+            records = records[unique]
+            added = len(records) - len(existing)
+        # Write next to the target and swap in so readers never see a torn file
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, records)
+        os.replace(tmp_path, path)
+        return added
+
+    def backfill(self, symbol: str, interval: str, start_ms: int, end_ms: Optional[int] = None) -> int:
+        """
+        Download every missing candle between start_ms and end_ms
+
+        Pages are flushed to disk as soon as a day is complete, so memory use
+        stays bounded by one day of candles however long the range is.
+
+        Args:
+            symbol (str): Trading pair (e.g. 'BTCUSDT')
+            interval (str): Kline interval (e.g. '1m')
+            start_ms (int): First open time to cover, in milliseconds
+            end_ms (int, optional): Last open time to cover, defaults to the
+                last closed candle; a candle still forming is never stored
+
+        Returns:
+            int: Number of candles written
+        """
+        if interval not in INTERVAL_MS:
+            raise ValueError(f"Unsupported interval for backfill: {interval}")
+        # A candle opened less than one interval ago is still forming
+        last_closed = int(time.time() * 1000) - INTERVAL_MS[interval]
+        end_ms = last_closed if end_ms is None else min(end_ms, last_closed)
+
+        written = 0
+        for range_start, range_end in self.missing_ranges(symbol, interval, start_ms, end_ms):
+            logger.info(f"Backfilling {symbol} {interval} from {range_start} to {range_end}")
+            pending_day = None
+            pending = []
+            for batch in self._fetch_pages(symbol, interval, range_start, range_end):
+                days = batch['timestamp'] // DAY_MS
+                # Split the page on day boundaries; every finished day is flushed
+                boundaries = np.flatnonzero(np.diff(days)) + 1
+                for chunk in np.split(batch, boundaries):
+                    day = int(chunk['timestamp'][0] // DAY_MS)
+                    if pending_day is not None and day != pending_day:
+                        written += self._write_day(symbol, interval, pending_day, np.concatenate(pending))
+                        pending = []
+                    pending_day = day
+                    pending.append(chunk)
+            if pending:
+                written += self._write_day(symbol, interval, pending_day, np.concatenate(pending))
+        return written
+
+
+def load_klines(root: str, symbol: str, interval: str,
+                start_ms: Optional[int] = None, end_ms: Optional[int] = None) -> np.ndarray:
+    """
+    Read cached candles back as one KLINE_DTYPE array
+
+    Args:
+        root (str): Directory of the on-disk cache
+        symbol (str): Trading pair (e.g. 'BTCUSDT')
+        interval (str): Kline interval (e.g. '1m')
+        start_ms (int, optional): First open time to include
+        end_ms (int, optional): Last open time to include
+
+    Returns:
+        np.ndarray: Candles sorted by open time
+    """
+    files = KlineBackfiller(root)._day_files(symbol, interval, start_ms, end_ms)
+    if not files:
+        return np.empty(0, dtype=KLINE_DTYPE)
+    records = np.concatenate([np.load(f) for f in files])
+    lo = 0 if start_ms is None else np.searchsorted(records['timestamp'], start_ms, side='left')
+    hi = len(records) if end_ms is None else np.searchsorted(records['timestamp'], end_ms, side='right')
+    return records[lo:hi]
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    backfiller = KlineBackfiller("data/klines")
+    start = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+    # Running this again only downloads candles newer than the last stored one
+    count = backfiller.backfill("BTCUSDT", "1m", start)
+    print(f"Wrote {count} candles")
+    print(load_klines("data/klines", "BTCUSDT", "1m")[-5:])
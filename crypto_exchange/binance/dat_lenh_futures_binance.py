@@ -1,37 +1,98 @@
-from binance.client import Client
 from binance.exceptions import BinanceAPIException
 import logging
-from typing import Optional, Literal
+import time
+from typing import Any, Callable, Dict, List, Optional, Literal, Tuple
+
+from crypto_exchange.common.batch_orders import chunked, order_result, run_concurrently
+from crypto_exchange.common.client_registry import get_client
+from crypto_exchange.common.position_settings import get_position_settings
+from crypto_exchange.common.symbol_filters import OrderValidationError, format_decimal, get_symbol_filters
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Maximum orders per /fapi/v1/batchOrders request
+BATCH_ORDER_LIMIT = 5
+
 class BinanceFuturesTrader:
-    def __init__(self, api_key: str, api_secret: str):
+    def __init__(self, api_key: str, api_secret: str, on_alert: Optional[Callable[[str], None]] = None,
+                 default_leverage: Optional[Dict[str, int]] = None):
         """
         Initialize the Binance Futures trader
+
+        Nothing is sent to the exchange here: the client is created on first
+        use and default leverage is applied before the first order on a symbol.
         
         Args:
             api_key (str): Your Binance API key
             api_secret (str): Your Binance API secret
+            on_alert (callable, optional): Called with a message when a position
+                is left without its take profit or stop loss
+            default_leverage (dict, optional): Symbol -> leverage to apply lazily
+                (default: {'BTCUSDT': 1})
         """
-        self.client = Client(api_key, api_secret)
-        self.client.futures_change_leverage(symbol='BTCUSDT', leverage=1)  # Default leverage
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self._client = None
+        self.filters = get_symbol_filters('binance_futures')
+        self.on_alert = on_alert
+        self.default_leverage = {'BTCUSDT': 1} if default_leverage is None else dict(default_leverage)
+        # Leverage and margin type last acknowledged by the exchange, per symbol
+        self.settings = get_position_settings('binance_futures', api_key)
+        # Seconds from sending the entry until every protective leg is acknowledged
+        self.protection_stats = {'count': 0, 'failures': 0, 'last': None, 'max': 0.0, 'total': 0.0}
+
+    @property
+    def client(self):
+        """Shared python-binance client, created on first access"""
+        if self._client is None:
+            self._client = get_client('binance', self.api_key, self.api_secret)
+        return self._client
         
     def set_leverage(self, symbol: str, leverage: int):
         """
         Set leverage for a trading pair
+
+        Only sent when it differs from the leverage last set for the symbol.
         
         Args:
             symbol (str): Trading pair (e.g., 'BTCUSDT')
             leverage (int): Leverage value
         """
         try:
-            self.client.futures_change_leverage(symbol=symbol, leverage=leverage)
-            logger.info(f"Leverage set to {leverage}x for {symbol}")
+            sent = self.settings.update(
+                symbol, 'leverage', leverage,
+                lambda: self.client.futures_change_leverage(symbol=symbol, leverage=leverage)
+            )
+            if sent is not None:
+                logger.info(f"Leverage set to {leverage}x for {symbol}")
         except BinanceAPIException as e:
             logger.error(f"Error setting leverage: {e}")
+
+    def set_margin_type(self, symbol: str, margin_type: Literal['ISOLATED', 'CROSSED']):
+        """
+        Set the margin type for a trading pair, skipping the call when it is already set
+
+        Args:
+            symbol (str): Trading pair (e.g., 'BTCUSDT')
+            margin_type (str): 'ISOLATED' or 'CROSSED'
+        """
+        try:
+            sent = self.settings.update(
+                symbol, 'margin_type', margin_type,
+                lambda: self.client.futures_change_margin_type(symbol=symbol, marginType=margin_type),
+                # -4046: "No need to change margin type."
+                unchanged=lambda e: getattr(e, 'code', None) == -4046
+            )
+            if sent is not None:
+                logger.info(f"Margin type set to {margin_type} for {symbol}")
+        except BinanceAPIException as e:
+            logger.error(f"Error setting margin type: {e}")
+
+    def _apply_default_leverage(self, symbol: str) -> None:
+        if self.settings.get(symbol, 'leverage') is None and symbol in self.default_leverage:
+            self.set_leverage(symbol, self.default_leverage[symbol])
             
     def place_order(self, 
                    symbol: str, 
@@ -41,9 +102,20 @@ class BinanceFuturesTrader:
                    price: Optional[float] = None,
                    stop_price: Optional[float] = None,
                    take_profit: Optional[float] = None,
-                   stop_loss: Optional[float] = None):
+                   stop_loss: Optional[float] = None,
+                   attached_mode: Literal['concurrent', 'batch', 'sequential'] = 'concurrent',
+                   rollback: bool = True):
         """
         Place a futures order
+
+        Quantity and prices are rounded to the symbol's step and tick sizes
+        and checked against its filters before anything is sent.
+
+        Take profit and stop loss are attached once the entry is acknowledged:
+        both legs in flight at once ('concurrent'), in one batchOrders request
+        ('batch'), or one after the other ('sequential'). If a leg fails the
+        position is unwound when rollback is set, and an alert is raised
+        either way.
         
         Args:
             symbol (str): Trading pair (e.g., 'BTCUSDT')
@@ -54,54 +126,228 @@ class BinanceFuturesTrader:
             stop_price (float, optional): Stop price for stop orders
             take_profit (float, optional): Take profit price
             stop_loss (float, optional): Stop loss price
+            attached_mode (str): 'concurrent', 'batch' or 'sequential'
+            rollback (bool): Cancel the entry and close what it filled when a leg fails
+
+        Returns:
+            dict: The entry order, or None on error. When a leg failed it also
+                carries 'protection_error' (the alert message) and 'rolled_back'
+                (True once the entry was cancelled and its fills closed).
         """
         try:
+            self._apply_default_leverage(symbol)
+            quantity, limit_price = self.filters.prepare(
+                symbol, quantity, price if order_type == 'LIMIT' else None
+            )
+
             # Place main order
             order_params = {
                 'symbol': symbol,
                 'side': side,
                 'type': order_type,
-                'quantity': quantity
+                'quantity': format_decimal(quantity)
             }
             
             if order_type == 'LIMIT':
                 order_params['timeInForce'] = 'GTC'
-                order_params['price'] = price
+                order_params['price'] = format_decimal(limit_price)
                 
             if stop_price:
-                order_params['stopPrice'] = stop_price
+                order_params['stopPrice'] = format_decimal(self.filters.round_price(symbol, stop_price))
                 
+            started = time.perf_counter()
             order = self.client.futures_create_order(**order_params)
             logger.info(f"Order placed: {order}")
-            
-            # Place take profit if specified
+
+            legs = []
+            exit_side = 'SELL' if side == 'BUY' else 'BUY'
             if take_profit:
-                tp_order = self.client.futures_create_order(
-                    symbol=symbol,
-                    side='SELL' if side == 'BUY' else 'BUY',
-                    type='TAKE_PROFIT_MARKET',
-                    stopPrice=take_profit,
-                    closePosition=True
-                )
-                logger.info(f"Take profit order placed: {tp_order}")
-                
-            # Place stop loss if specified
+                legs.append(('Take profit', {
+                    'symbol': symbol,
+                    'side': exit_side,
+                    'type': 'TAKE_PROFIT_MARKET',
+                    'stopPrice': format_decimal(self.filters.round_price(symbol, take_profit))
+                }))
             if stop_loss:
-                sl_order = self.client.futures_create_order(
-                    symbol=symbol,
-                    side='SELL' if side == 'BUY' else 'BUY',
-                    type='STOP_MARKET',
-                    stopPrice=stop_loss,
-                    closePosition=True
-                )
-                logger.info(f"Stop loss order placed: {sl_order}")
-                
+                legs.append(('Stop loss', {
+                    'symbol': symbol,
+                    'side': exit_side,
+                    'type': 'STOP_MARKET',
+                    'stopPrice': format_decimal(self.filters.round_price(symbol, stop_loss))
+                }))
+            if legs:
+                self._attach_legs(order, legs, quantity, attached_mode, rollback, started)
+
             return order
             
+        except OrderValidationError as e:
+            logger.error(f"Order rejected locally: {e}")
+            return None
         except BinanceAPIException as e:
             logger.error(f"Error placing order: {e}")
             return None
             
+    def _send_legs(self, legs: List, quantity, attached_mode: str) -> List[Any]:
+        """Send the protective legs; returns each leg's order or exception, in order"""
+        if attached_mode == 'batch':
+            # batchOrders does not take closePosition, so legs reduce the entry quantity instead
+            batch_orders = [dict(params, quantity=format_decimal(quantity), reduceOnly='true') for _, params in legs]
+            try:
+                response = self.client.futures_place_batch_order(batchOrders=batch_orders)
+            except Exception as e:
+                return [e] * len(legs)
+            # Rejected entries come back as {'code': ..., 'msg': ...}
+            return [
+                RuntimeError(f"{placed['code']}: {placed.get('msg')}")
+                if 'code' in placed and 'orderId' not in placed else placed
+                for placed in response
+            ]
+
+        calls = [lambda params=params: self.client.futures_create_order(closePosition=True, **params)
+                 for _, params in legs]
+        if attached_mode == 'concurrent':
+            return run_concurrently(calls)
+        results = []
+        for call in calls:
+            try:
+                results.append(call())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def _attach_legs(self, order: Dict[str, Any], legs: List, quantity, attached_mode: str,
+                     rollback: bool, started: float) -> None:
+        """Place take profit / stop loss for an acknowledged entry, unwinding it if one fails"""
+        symbol = order['symbol']
+        results = self._send_legs(legs, quantity, attached_mode)
+        placed = []
+        failed = []
+        for (name, _), result in zip(legs, results):
+            if isinstance(result, Exception):
+                failed.append(f"{name}: {result}")
+            else:
+                placed.append(result)
+                logger.info(f"{name} order placed: {result}")
+
+        stats = self.protection_stats
+        if not failed:
+            elapsed = time.perf_counter() - started
+            stats['count'] += 1
+            stats['last'] = elapsed
+            stats['max'] = max(stats['max'], elapsed)
+            stats['total'] += elapsed
+            logger.info(f"{symbol} protected {elapsed * 1000:.1f} ms after entry ({attached_mode})")
+            return
+
+        stats['failures'] += 1
+        message = f"{symbol} order {order.get('orderId')} is unprotected: {'; '.join(failed)}"
+        order['rolled_back'] = False
+        if rollback:
+            order['rolled_back'], outcome = self._rollback_entry(order, placed)
+            message += "; " + outcome
+        order['protection_error'] = message
+        logger.critical(message)
+        if self.on_alert is not None:
+            self.on_alert(message)
+
+    def _rollback_entry(self, order: Dict[str, Any], placed: List[Dict[str, Any]]) -> Tuple[bool, str]:
+        """Cancel the legs that did go through and unwind the entry; returns (rolled back, what was done)"""
+        symbol = order['symbol']
+        for leg in placed:
+            try:
+                self.client.futures_cancel_order(symbol=symbol, orderId=leg['orderId'])
+            except BinanceAPIException as e:
+                logger.error(f"Error cancelling leg {leg['orderId']}: {e}")
+        try:
+            # Stop further fills of a resting LIMIT or untriggered STOP entry, then close what filled
+            try:
+                self.client.futures_cancel_order(symbol=symbol, orderId=order['orderId'])
+            except BinanceAPIException:
+                pass  # already filled or no longer open
+            current = self.client.futures_get_order(symbol=symbol, orderId=order['orderId'])
+            filled = float(current.get('executedQty') or 0)
+            if filled:
+                self.client.futures_create_order(
+                    symbol=symbol,
+                    side='SELL' if order['side'] == 'BUY' else 'BUY',
+                    type='MARKET',
+                    quantity=format_decimal(current['executedQty']),
+                    reduceOnly=True
+                )
+            return True, f"rolled back (entry {current.get('status')}, closed {filled})"
+        except BinanceAPIException as e:
+            return False, f"rollback failed: {e}"
+
+    def protection_metrics(self) -> Dict[str, Any]:
+        """Time-to-protected statistics of attached TP/SL orders, in seconds"""
+        stats = dict(self.protection_stats)
+        stats['mean'] = stats['total'] / stats['count'] if stats['count'] else None
+        return stats
+
+    def place_orders(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Place many futures orders through the batchOrders endpoint
+
+        Orders are sent 5 per request (the endpoint limit) with the chunks in
+        flight concurrently, so a 50-order ladder costs 10 parallel round trips.
+
+        Args:
+            batch (list): Order dicts with the place_order argument names:
+                symbol, side, quantity, order_type (default 'MARKET'), price,
+                stop_price, and optionally time_in_force and reduce_only
+
+        Returns:
+            list: One {'index', 'success', 'order', 'error'} dict per order, in batch order
+        """
+        # Entries are rounded and checked like place_order; rejected ones are never sent
+        results: List[Optional[Dict[str, Any]]] = [None] * len(batch)
+        entries = []
+        for index, order in enumerate(batch):
+            order_type = order.get('order_type', 'MARKET')
+            symbol = order['symbol']
+            try:
+                quantity, price = self.filters.prepare(symbol, order['quantity'], order.get('price'))
+            except OrderValidationError as e:
+                results[index] = order_result(index, error=str(e))
+                continue
+            params = {
+                'symbol': symbol,
+                'side': order['side'],
+                'type': order_type,
+                'quantity': format_decimal(quantity)
+            }
+            if price is not None:
+                params['price'] = format_decimal(price)
+                params['timeInForce'] = order.get('time_in_force', 'GTC')
+            if order.get('stop_price') is not None:
+                params['stopPrice'] = format_decimal(self.filters.round_price(symbol, order['stop_price']))
+            if order.get('reduce_only'):
+                params['reduceOnly'] = 'true'
+            entries.append((index, params))
+
+        chunks = list(chunked(entries, BATCH_ORDER_LIMIT))
+        responses = run_concurrently([
+            lambda chunk=chunk: self.client.futures_place_batch_order(batchOrders=[params for _, params in chunk])
+            for chunk in chunks
+        ])
+
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, Exception):
+                logger.error(f"Error placing batch orders: {response}")
+                for index, _ in chunk:
+                    results[index] = order_result(index, error=str(response))
+                continue
+            for (index, _), placed in zip(chunk, response):
+                # Rejected entries come back as {'code': ..., 'msg': ...}
+                if 'code' in placed and 'orderId' not in placed:
+                    results[index] = order_result(index, error=f"{placed['code']}: {placed.get('msg')}")
+                else:
+                    results[index] = order_result(index, placed)
+
+        failed = sum(not result['success'] for result in results)
+        logger.info(f"Batch placed: {len(results) - failed} accepted, {failed} rejected")
+        return results
+
     def close_position(self, symbol: str):
         """
         Close all positions for a symbol
@@ -1,9 +1,10 @@
-from binance.client import Client
 from binance.enums import *
-import config
+from crypto_exchange.binance import config
+from crypto_exchange.common.client_registry import get_client
 
-# Khởi tạo client với API key và secret key
-client = Client(config.API_KEY, config.API_SECRET)
+# Client chỉ được tạo khi dùng lần đầu, để việc import module không tốn request mạng
+def _client():
+    return get_client('binance', config.API_KEY, config.API_SECRET)
 
 def place_buy_order(symbol, quantity, price=None):
     """
@@ -20,7 +21,7 @@ def place_buy_order(symbol, quantity, price=None):
     try:
         if price:
             # Lệnh giới hạn
-            order = client.create_order(
+            order = _client().create_order(
                 symbol=symbol,
                 side=SIDE_BUY,
                 type=ORDER_TYPE_LIMIT,
@@ -30,7 +31,7 @@ def place_buy_order(symbol, quantity, price=None):
             )
         else:
             # Lệnh thị trường
-            order = client.create_order(
+            order = _client().create_order(
                 symbol=symbol,
                 side=SIDE_BUY,
                 type=ORDER_TYPE_MARKET,
@@ -56,7 +57,7 @@ def place_sell_order(symbol, quantity, price=None):
     try:
         if price:
             # Lệnh giới hạn
-            order = client.create_order(
+            order = _client().create_order(
                 symbol=symbol,
                 side=SIDE_SELL,
                 type=ORDER_TYPE_LIMIT,
@@ -66,7 +67,7 @@ def place_sell_order(symbol, quantity, price=None):
             )
         else:
             # Lệnh thị trường
-            order = client.create_order(
+            order = _client().create_order(
                 symbol=symbol,
                 side=SIDE_SELL,
                 type=ORDER_TYPE_MARKET,
@@ -89,7 +90,7 @@ def get_order_status(symbol, order_id):
         dict: Thông tin về trạng thái lệnh
     """
     try:
-        order = client.get_order(symbol=symbol, orderId=order_id)
+        order = _client().get_order(symbol=symbol, orderId=order_id)
         return order
     except Exception as e:
         print(f"Lỗi khi kiểm tra trạng thái lệnh: {e}")
@@ -0,0 +1,124 @@
+from binance import AsyncClient
+from binance.enums import *
+import asyncio
+from crypto_exchange.binance import config
+
+# AsyncClient phải được tạo bên trong event loop nên khởi tạo khi dùng lần đầu
+_client = None
+
+async def get_client():
+    global _client
+    if _client is None:
+        _client = await AsyncClient.create(config.API_KEY, config.API_SECRET)
+    return _client
+
+async def close_client():
+    """Đóng kết nối của AsyncClient"""
+    global _client
+    if _client is not None:
+        await _client.close_connection()
+        _client = None
+
+async def place_buy_order(symbol, quantity, price=None):
+    """
+    Đặt lệnh mua (phiên bản asyncio của place_buy_order)
+
+    Args:
+        symbol (str): Cặp giao dịch (ví dụ: 'BTCUSDT')
+        quantity (float): Số lượng muốn mua
+        price (float, optional): Giá mua. Nếu None sẽ là lệnh thị trường
+
+    Returns:
+        dict: Thông tin về lệnh đã đặt
+    """
+    try:
+        client = await get_client()
+        if price:
+            # Lệnh giới hạn
+            return await client.create_order(
+                symbol=symbol,
+                side=SIDE_BUY,
+                type=ORDER_TYPE_LIMIT,
+                timeInForce=TIME_IN_FORCE_GTC,
+                quantity=quantity,
+                price=price
+            )
+        # Lệnh thị trường
+        return await client.create_order(
+            symbol=symbol,
+            side=SIDE_BUY,
+            type=ORDER_TYPE_MARKET,
+            quantity=quantity
+        )
+    except Exception as e:
+        print(f"Lỗi khi đặt lệnh mua: {e}")
+        return None
+
+async def place_sell_order(symbol, quantity, price=None):
+    """
+    Đặt lệnh bán (phiên bản asyncio của place_sell_order)
+
+    Args:
+        symbol (str): Cặp giao dịch (ví dụ: 'BTCUSDT')
+        quantity (float): Số lượng muốn bán
+        price (float, optional): Giá bán. Nếu None sẽ là lệnh thị trường
+
+    Returns:
+        dict: Thông tin về lệnh đã đặt
+    """
+    try:
+        client = await get_client()
+        if price:
+            # Lệnh giới hạn
+            return await client.create_order(
+                symbol=symbol,
+                side=SIDE_SELL,
+                type=ORDER_TYPE_LIMIT,
+                timeInForce=TIME_IN_FORCE_GTC,
+                quantity=quantity,
+                price=price
+            )
+        # Lệnh thị trường
+        return await client.create_order(
+            symbol=symbol,
+            side=SIDE_SELL,
+            type=ORDER_TYPE_MARKET,
+            quantity=quantity
+        )
+    except Exception as e:
+        print(f"Lỗi khi đặt lệnh bán: {e}")
+        return None
+
+async def get_order_status(symbol, order_id):
+    """
+    Kiểm tra trạng thái lệnh (phiên bản asyncio của get_order_status)
+
+    Args:
+        symbol (str): Cặp giao dịch
+        order_id (str): ID của lệnh cần kiểm tra
+
+    Returns:
+        dict: Thông tin về trạng thái lệnh
+    """
+    try:
+        client = await get_client()
+        return await client.get_order(symbol=symbol, orderId=order_id)
+    except Exception as e:
+        print(f"Lỗi khi kiểm tra trạng thái lệnh: {e}")
+        return None
+
+# Ví dụ sử dụng
+if __name__ == "__main__":
+    async def main():
+        try:
+            # Hai lệnh được gửi đồng thời
+            buy_order, sell_order = await asyncio.gather(
+                place_buy_order('BTCUSDT', 0.001),
+                place_sell_order('BTCUSDT', 0.001, 50000)
+            )
+            print("Lệnh mua:", buy_order)
+            print("Lệnh bán:", sell_order)
+        finally:
+            await close_client()
+
+    asyncio.run(main())
@@ -1,28 +1,42 @@
-import requests
+import json
 from datetime import datetime
 
-def get_klines(symbol, interval='1d', limit=30):
+import numpy as np
+
+from crypto_exchange.common.http_transport import get_session
+
+# Fixed-width record used for klines kept in NumPy arrays and on disk
+# (timestamp is the candle open time in milliseconds since the epoch, UTC)
+KLINE_DTYPE = np.dtype([
+    ('timestamp', np.int64),
+    ('open', np.float64),
+    ('high', np.float64),
+    ('low', np.float64),
+    ('close', np.float64),
+    ('volume', np.float64),
+])
+
+# Interval length in milliseconds (1M is calendar based and not listed)
+INTERVAL_MS = {
+    '1m': 60_000, '3m': 180_000, '5m': 300_000, '15m': 900_000, '30m': 1_800_000,
+    '1h': 3_600_000, '2h': 7_200_000, '4h': 14_400_000, '6h': 21_600_000,
+    '8h': 28_800_000, '12h': 43_200_000, '1d': 86_400_000, '3d': 259_200_000,
+    '1w': 604_800_000,
+}
+
+# Fields per /api/v3/klines row
+KLINE_ROW_WIDTH = 12
+
+def format_klines(data):
     """
-    Get OHLCV data for a cryptocurrency from Binance
-    
+    Convert decoded /api/v3/klines rows into a list of dicts
+
     Args:
-        symbol (str): Trading pair symbol (e.g., 'BTCUSDT')
-        interval (str): Kline interval (1m, 3m, 5m, 15m, 30m, 1h, 2h, 4h, 6h, 8h, 12h, 1d, 3d, 1w, 1M)
-        limit (int): Number of klines to return (max 1000)
-    
+        data (list): Rows as returned by response.json()
+
     Returns:
-        list: List of klines data where each kline is [Open time, Open, High, Low, Close, Volume, ...]
+        list: One dict per kline with a datetime timestamp and float OHLCV
     """
-    url = "https://api.binance.com/api/v3/klines"
-    params = {
-        "symbol": symbol,
-        "interval": interval,
-        "limit": limit
-    }
-    response = requests.get(url, params=params)
-    data = response.json()
-    
-    # Convert timestamp to readable date and format the data
     formatted_data = []
     for kline in data:
         timestamp = datetime.fromtimestamp(kline[0] / 1000)
@@ -38,6 +52,70 @@ def get_klines(symbol, interval='1d', limit=30):
     
     return formatted_data
 
+def parse_klines_array(payload, row_width=KLINE_ROW_WIDTH):
+    """
+    Decode a raw klines JSON payload straight into a KLINE_DTYPE array
+
+    Only the first six columns are converted, in one NumPy cast over the
+    decoded rows instead of a dict per candle; a malformed field raises
+    instead of being skipped.
+
+    Args:
+        payload (bytes | str): Response body of a klines request
+        row_width (int): Number of fields per kline (12 for Binance)
+
+    Returns:
+        np.ndarray: KLINE_DTYPE records, timestamp in milliseconds
+    """
+    rows = json.loads(payload)
+    if isinstance(rows, dict):
+        # Errors come back as {"code": ..., "msg": ...}
+        raise ValueError(f"Klines request failed: {str(rows)[:200]}")
+
+    records = np.empty(len(rows), dtype=KLINE_DTYPE)
+    if not rows:
+        return records
+    table = np.array(rows, dtype=object)
+    if table.ndim != 2 or table.shape[1] != row_width:
+        raise ValueError(f"Klines payload does not split into rows of {row_width} fields")
+    values = table[:, :6].astype(np.float64)
+    # Millisecond timestamps are below 2**53, so the float64 round trip is exact
+    records['timestamp'] = values[:, 0]
+    records['open'] = values[:, 1]
+    records['high'] = values[:, 2]
+    records['low'] = values[:, 3]
+    records['close'] = values[:, 4]
+    records['volume'] = values[:, 5]
+    return records
+
+def get_klines(symbol, interval='1d', limit=30, as_arrays=False):
+    """
+    Get OHLCV data for a cryptocurrency from Binance
+    
+    Args:
+        symbol (str): Trading pair symbol (e.g., 'BTCUSDT')
+        interval (str): Kline interval (1m, 3m, 5m, 15m, 30m, 1h, 2h, 4h, 6h, 8h, 12h, 1d, 3d, 1w, 1M)
+        limit (int): Number of klines to return (max 1000)
+        as_arrays (bool): Return a KLINE_DTYPE NumPy array instead of a list of dicts
+    
+    Returns:
+        list | np.ndarray: List of dicts with timestamp/open/high/low/close/volume,
+            or a KLINE_DTYPE array when as_arrays is True
+    """
+    url = "https://api.binance.com/api/v3/klines"
+    params = {
+        "symbol": symbol,
+        "interval": interval,
+        "limit": limit
+    }
+    response = get_session(url).get(url, params=params)
+
+    if as_arrays:
+        return parse_klines_array(response.content)
+
+    # Convert timestamp to readable date and format the data
+    return format_klines(response.json())
+
 if __name__ == "__main__":
     # Example usage
     klines = get_klines("ETHUSDT", interval='1d', limit=10)
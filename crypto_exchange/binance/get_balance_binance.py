@@ -1,10 +1,11 @@
-from binance.client import Client
 from binance.exceptions import BinanceAPIException
 import pandas as pd
 from datetime import datetime
 import os
 from dotenv import load_dotenv
 
+from crypto_exchange.common.client_registry import get_client
+
 # Load environment variables
 load_dotenv()
 
@@ -51,6 +52,32 @@ def get_futures_balance(client):
         print(f"Error getting futures balance: {e}")
         return None
 
+def get_balance_rows(client, account='spot'):
+    """
+    Get non-zero balances in the portfolio aggregator's row format
+
+    Args:
+        client (Client): Binance client
+        account (str): 'spot' or 'futures'
+
+    Returns:
+        list: Dicts with asset, free, locked and total
+    """
+    rows = []
+    if account == 'spot':
+        for asset in client.get_account()['balances']:
+            free = float(asset['free'])
+            locked = float(asset['locked'])
+            if free + locked > 0:
+                rows.append({'asset': asset['asset'], 'free': free, 'locked': locked, 'total': free + locked})
+    else:
+        for asset in client.futures_account_balance():
+            total = float(asset['balance'])
+            free = float(asset['availableBalance'])
+            if total > 0:
+                rows.append({'asset': asset['asset'], 'free': free, 'locked': total - free, 'total': total})
+    return rows
+
 def main():
     # Get API keys from environment variables
     api_key = os.getenv('BINANCE_API_KEY')
@@ -62,7 +89,7 @@ def main():
     
     try:
         # Initialize Binance client
-        client = Client(api_key, api_secret)
+        client = get_client('binance', api_key, api_secret)
         
         print("\n=== Spot Account Balance ===")
         spot_balance = get_spot_balance(client)
@@ -1,9 +1,16 @@
-import requests
 import time
-import hmac
-import hashlib
 import json
-from typing import Optional, Dict, Any
+import uuid
+from typing import Optional, Dict, Any, List, Tuple
+
+from crypto_exchange.common.batch_orders import chunked, order_result, run_concurrently
+from crypto_exchange.common.http_transport import get_session
+from crypto_exchange.common.position_settings import get_position_settings
+from crypto_exchange.common.signing import HmacSigner
+from crypto_exchange.common.symbol_filters import OrderValidationError, format_decimal, get_symbol_filters
+
+# Maximum orders per /order/batch-orders request
+BATCH_ORDER_LIMIT = 50
 
 class BitgetFuturesAPI:
     def __init__(self, api_key: str, api_secret: str, passphrase: str):
@@ -12,15 +19,13 @@ class BitgetFuturesAPI:
         self.passphrase = passphrase
         self.base_url = "https://api.bitget.com"
         self.futures_url = f"{self.base_url}/api/mix/v1"
+        self.session = get_session(self.base_url)
+        self.signer = HmacSigner(api_secret)
+        self.filters = get_symbol_filters('bitget_mix')
+        self.settings = get_position_settings('bitget', api_key)
 
     def _generate_signature(self, timestamp: str, method: str, endpoint: str, body: str = "") -> str:
-        message = timestamp + method + endpoint + body
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            message.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        return self.signer.sign_hex(timestamp + method + endpoint + body)
 
     def _get_headers(self, method: str, endpoint: str, body: str = "") -> Dict[str, str]:
         timestamp = str(int(time.time() * 1000))
@@ -53,22 +58,28 @@ class BitgetFuturesAPI:
             reduce_only: Whether the order is reduce-only
         
         Returns:
-            Order response from Bitget
+            Order response from Bitget, or {"error": ...} when the size or
+            price breaks the contract's filters
         """
         endpoint = "/order/placeOrder"
         url = f"{self.futures_url}{endpoint}"
+        try:
+            size, _ = self.filters.prepare(symbol, size)
+        except OrderValidationError as e:
+            print(f"Error placing order: {e}")
+            return {"error": str(e)}
         
         body = {
             "symbol": symbol,
             "marginMode": margin_mode,
             "side": side,
             "orderType": "market",
-            "size": str(size),
+            "size": format_decimal(size),
             "reduceOnly": reduce_only
         }
         
         headers = self._get_headers("POST", endpoint, json.dumps(body))
-        response = requests.post(url, headers=headers, json=body)
+        response = self.session.post(url, headers=headers, json=body)
         return response.json()
 
     def place_limit_order(
@@ -92,23 +103,29 @@ class BitgetFuturesAPI:
             reduce_only: Whether the order is reduce-only
         
         Returns:
-            Order response from Bitget
+            Order response from Bitget, or {"error": ...} when the size or
+            price breaks the contract's filters
         """
         endpoint = "/order/placeOrder"
         url = f"{self.futures_url}{endpoint}"
+        try:
+            size, price = self.filters.prepare(symbol, size, price)
+        except OrderValidationError as e:
+            print(f"Error placing order: {e}")
+            return {"error": str(e)}
         
         body = {
             "symbol": symbol,
             "marginMode": margin_mode,
             "side": side,
             "orderType": "limit",
-            "size": str(size),
-            "price": str(price),
+            "size": format_decimal(size),
+            "price": format_decimal(price),
             "reduceOnly": reduce_only
         }
         
         headers = self._get_headers("POST", endpoint, json.dumps(body))
-        response = requests.post(url, headers=headers, json=body)
+        response = self.session.post(url, headers=headers, json=body)
         return response.json()
 
     def place_stop_order(
@@ -132,26 +149,170 @@ class BitgetFuturesAPI:
             reduce_only: Whether the order is reduce-only
         
         Returns:
-            Order response from Bitget
+            Order response from Bitget, or {"error": ...} when the size or
+            price breaks the contract's filters
         """
         endpoint = "/order/placeOrder"
         url = f"{self.futures_url}{endpoint}"
+        try:
+            size, _ = self.filters.prepare(symbol, size)
+            trigger_price = self.filters.round_price(symbol, trigger_price)
+        except OrderValidationError as e:
+            print(f"Error placing order: {e}")
+            return {"error": str(e)}
         
         body = {
             "symbol": symbol,
             "marginMode": margin_mode,
             "side": side,
             "orderType": "market",
-            "size": str(size),
-            "triggerPrice": str(trigger_price),
+            "size": format_decimal(size),
+            "triggerPrice": format_decimal(trigger_price),
             "triggerType": "market_price",
             "reduceOnly": reduce_only
         }
         
         headers = self._get_headers("POST", endpoint, json.dumps(body))
-        response = requests.post(url, headers=headers, json=body)
+        response = self.session.post(url, headers=headers, json=body)
+        return response.json()
+
+    def _place_batch(self, symbol: str, margin_coin: str, order_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        endpoint = "/order/batch-orders"
+        url = f"{self.futures_url}{endpoint}"
+
+        body = {
+            "symbol": symbol,
+            "marginCoin": margin_coin,
+            "orderDataList": order_data
+        }
+
+        headers = self._get_headers("POST", endpoint, json.dumps(body))
+        response = self.session.post(url, headers=headers, json=body)
         return response.json()
 
+    def place_orders(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Place many orders through Bitget's batch order endpoint
+
+        Orders are grouped by symbol (the endpoint takes one symbol per call),
+        sent 50 per request, and the requests run concurrently.
+
+        Args:
+            batch: Order dicts with symbol, side, size and optionally price,
+                order_type ("limit"/"market", default from price) and
+                margin_coin (default "USDT")
+
+        Returns:
+            One {'index', 'success', 'order', 'error'} dict per order, in batch order
+        """
+        results, requests = self._batch_requests(batch)
+        responses = run_concurrently([
+            lambda key=key, chunk=chunk: self._place_batch(key[0], key[1], [data for _, data in chunk])
+            for key, chunk in requests
+        ])
+        return self._batch_results(results, requests, responses)
+
+    def _batch_requests(self, batch: List[Dict[str, Any]]) -> Tuple[List[Optional[Dict[str, Any]]], List[tuple]]:
+        # Entries are rounded and checked like the single-order methods; rejected ones are never sent
+        results: List[Optional[Dict[str, Any]]] = [None] * len(batch)
+        # clientOid ties every entry of the response back to its batch index
+        groups: Dict[tuple, List[tuple]] = {}
+        for index, order in enumerate(batch):
+            try:
+                size, price = self.filters.prepare(order["symbol"], order["size"], order.get("price"))
+            except OrderValidationError as e:
+                results[index] = order_result(index, error=str(e))
+                continue
+            data = {
+                "size": format_decimal(size),
+                "side": order["side"],
+                "orderType": order.get("order_type", "limit" if price is not None else "market"),
+                "timeInForceValue": "normal",
+                "clientOid": uuid.uuid4().hex
+            }
+            if price is not None:
+                data["price"] = format_decimal(price)
+            key = (order["symbol"], order.get("margin_coin", "USDT"))
+            groups.setdefault(key, []).append((index, data))
+
+        requests = [
+            (key, list(chunk))
+            for key, entries in groups.items()
+            for chunk in chunked(entries, BATCH_ORDER_LIMIT)
+        ]
+        return results, requests
+
+    @staticmethod
+    def _batch_results(results: List[Optional[Dict[str, Any]]], requests: List[tuple],
+                       responses: List[Any]) -> List[Dict[str, Any]]:
+        for (_, chunk), response in zip(requests, responses):
+            if isinstance(response, BaseException) or response.get("code") != "00000":
+                error = str(response) if isinstance(response, BaseException) else response.get("msg")
+                for index, _ in chunk:
+                    results[index] = order_result(index, error=error)
+                continue
+            data = response.get("data") or {}
+            accepted = {item["clientOid"]: item for item in data.get("orderInfo", [])}
+            failed = {item["clientOid"]: item for item in data.get("failure", [])}
+            for index, order_data in chunk:
+                client_oid = order_data["clientOid"]
+                if client_oid in accepted:
+                    results[index] = order_result(index, accepted[client_oid])
+                else:
+                    reason = failed.get(client_oid, {}).get("errorMsg", "Not acknowledged")
+                    results[index] = order_result(index, error=reason)
+        return results
+
+    def _post_account(self, endpoint: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        url = f"{self.futures_url}{endpoint}"
+        headers = self._get_headers("POST", endpoint, json.dumps(body))
+        response = self.session.post(url, headers=headers, json=body)
+        return response.json()
+
+    def set_leverage(self, symbol: str, leverage: int, margin_coin: str = "USDT") -> Optional[Dict[str, Any]]:
+        """
+        Set leverage for a contract, skipping the call when it is already set
+        
+        Args:
+            symbol: Trading pair (e.g., "BTCUSDT_UMCBL")
+            leverage: Leverage value
+            margin_coin: Margin coin (default: "USDT")
+        
+        Returns:
+            Response from Bitget, or None when nothing was sent
+        """
+        return self.settings.update(
+            symbol, 'leverage', leverage,
+            lambda: self._post_account("/account/setLeverage", {
+                "symbol": symbol,
+                "marginCoin": margin_coin,
+                "leverage": str(leverage)
+            }),
+            accepted=lambda response: response.get("code") == "00000"
+        )
+
+    def set_margin_mode(self, symbol: str, margin_mode: str, margin_coin: str = "USDT") -> Optional[Dict[str, Any]]:
+        """
+        Set the margin mode for a contract, skipping the call when it is already set
+        
+        Args:
+            symbol: Trading pair (e.g., "BTCUSDT_UMCBL")
+            margin_mode: "isolated" or "cross"
+            margin_coin: Margin coin (default: "USDT")
+        
+        Returns:
+            Response from Bitget, or None when nothing was sent
+        """
+        return self.settings.update(
+            symbol, 'margin_mode', margin_mode,
+            lambda: self._post_account("/account/setMarginMode", {
+                "symbol": symbol,
+                "marginCoin": margin_coin,
+                "marginMode": "fixed" if margin_mode == "isolated" else "crossed"
+            }),
+            accepted=lambda response: response.get("code") == "00000"
+        )
+
     def cancel_order(self, symbol: str, order_id: str) -> Dict[str, Any]:
         """
         Cancel an existing order
@@ -172,7 +333,7 @@ class BitgetFuturesAPI:
         }
         
         headers = self._get_headers("POST", endpoint, json.dumps(body))
-        response = requests.post(url, headers=headers, json=body)
+        response = self.session.post(url, headers=headers, json=body)
         return response.json()
 
     def get_order_status(self, symbol: str, order_id: str) -> Dict[str, Any]:
@@ -195,5 +356,5 @@ class BitgetFuturesAPI:
         }
         
         headers = self._get_headers("GET", endpoint)
-        response = requests.get(url, headers=headers, params=params)
+        response = self.session.get(url, headers=headers, params=params)
         return response.json()
@@ -0,0 +1,240 @@
+import asyncio
+import functools
+import json
+from typing import Dict, Any, List, Optional
+
+from crypto_exchange.bitget.dat_lenh_futures_bitget import BitgetFuturesAPI
+from crypto_exchange.common.async_http_transport import close_async_sessions, get_async_session
+
+class AsyncBitgetFuturesAPI(BitgetFuturesAPI):
+    """asyncio counterpart of BitgetFuturesAPI with the same method surface"""
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        body: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        payload = json.dumps(body) if body is not None else ""
+        headers = self._get_headers(method, endpoint, payload)
+        session = get_async_session(self.base_url)
+        async with session.request(
+            method,
+            f"{self.futures_url}{endpoint}",
+            headers=headers,
+            data=payload or None,
+            params=params
+        ) as response:
+            return await response.json(content_type=None)
+
+    async def place_market_order(
+        self,
+        symbol: str,
+        side: str,
+        size: float,
+        margin_mode: str = "isolated",
+        reduce_only: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Place a market order for futures trading
+
+        Args:
+            symbol: Trading pair (e.g., "BTCUSDT_UMCBL")
+            side: "buy" or "sell"
+            size: Order size
+            margin_mode: "isolated" or "cross"
+            reduce_only: Whether the order is reduce-only
+
+        Returns:
+            Order response from Bitget
+        """
+        body = {
+            "symbol": symbol,
+            "marginMode": margin_mode,
+            "side": side,
+            "orderType": "market",
+            "size": str(size),
+            "reduceOnly": reduce_only
+        }
+        return await self._request("POST", "/order/placeOrder", body)
+
+    async def place_limit_order(
+        self,
+        symbol: str,
+        side: str,
+        size: float,
+        price: float,
+        margin_mode: str = "isolated",
+        reduce_only: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Place a limit order for futures trading
+
+        Args:
+            symbol: Trading pair (e.g., "BTCUSDT_UMCBL")
+            side: "buy" or "sell"
+            size: Order size
+            price: Order price
+            margin_mode: "isolated" or "cross"
+            reduce_only: Whether the order is reduce-only
+
+        Returns:
+            Order response from Bitget
+        """
+        body = {
+            "symbol": symbol,
+            "marginMode": margin_mode,
+            "side": side,
+            "orderType": "limit",
+            "size": str(size),
+            "price": str(price),
+            "reduceOnly": reduce_only
+        }
+        return await self._request("POST", "/order/placeOrder", body)
+
+    async def place_stop_order(
+        self,
+        symbol: str,
+        side: str,
+        size: float,
+        trigger_price: float,
+        margin_mode: str = "isolated",
+        reduce_only: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Place a stop order for futures trading
+
+        Args:
+            symbol: Trading pair (e.g., "BTCUSDT_UMCBL")
+            side: "buy" or "sell"
+            size: Order size
+            trigger_price: Price at which the order will be triggered
+            margin_mode: "isolated" or "cross"
+            reduce_only: Whether the order is reduce-only
+
+        Returns:
+            Order response from Bitget
+        """
+        body = {
+            "symbol": symbol,
+            "marginMode": margin_mode,
+            "side": side,
+            "orderType": "market",
+            "size": str(size),
+            "triggerPrice": str(trigger_price),
+            "triggerType": "market_price",
+            "reduceOnly": reduce_only
+        }
+        return await self._request("POST", "/order/placeOrder", body)
+
+    async def place_orders(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Place many orders through Bitget's batch order endpoint
+
+        Orders are grouped by symbol, sent 50 per request, and the requests
+        run concurrently on the event loop.
+
+        Args:
+            batch: Order dicts with symbol, side, size and optionally price,
+                order_type ("limit"/"market", default from price) and
+                margin_coin (default "USDT")
+
+        Returns:
+            One {'index', 'success', 'order', 'error'} dict per order, in batch order
+        """
+        results, requests = self._batch_requests(batch)
+        responses = await asyncio.gather(*[
+            self._request("POST", "/order/batch-orders", {
+                "symbol": key[0],
+                "marginCoin": key[1],
+                "orderDataList": [data for _, data in chunk]
+            })
+            for key, chunk in requests
+        ], return_exceptions=True)
+        return self._batch_results(results, requests, responses)
+
+    async def set_leverage(self, symbol: str, leverage: int, margin_coin: str = "USDT") -> Optional[Dict[str, Any]]:
+        """
+        Set leverage for a contract, skipping the call when it is already set
+
+        The settings cache takes a blocking sender, so the request runs on
+        the loop's default executor.
+
+        Args:
+            symbol: Trading pair (e.g., "BTCUSDT_UMCBL")
+            leverage: Leverage value
+            margin_coin: Margin coin (default: "USDT")
+
+        Returns:
+            Response from Bitget, or None when nothing was sent
+        """
+        set_leverage = functools.partial(super().set_leverage, symbol, leverage, margin_coin)
+        return await asyncio.get_running_loop().run_in_executor(None, set_leverage)
+
+    async def set_margin_mode(self, symbol: str, margin_mode: str, margin_coin: str = "USDT") -> Optional[Dict[str, Any]]:
+        """
+        Set the margin mode for a contract, skipping the call when it is already set
+
+        Runs on the loop's default executor like set_leverage.
+
+        Args:
+            symbol: Trading pair (e.g., "BTCUSDT_UMCBL")
+            margin_mode: "isolated" or "cross"
+            margin_coin: Margin coin (default: "USDT")
+
+        Returns:
+            Response from Bitget, or None when nothing was sent
+        """
+        set_margin_mode = functools.partial(super().set_margin_mode, symbol, margin_mode, margin_coin)
+        return await asyncio.get_running_loop().run_in_executor(None, set_margin_mode)
+
+    async def cancel_order(self, symbol: str, order_id: str) -> Dict[str, Any]:
+        """
+        Cancel an existing order
+
+        Args:
+            symbol: Trading pair (e.g., "BTCUSDT_UMCBL")
+            order_id: ID of the order to cancel
+
+        Returns:
+            Cancellation response from Bitget
+        """
+        body = {
+            "symbol": symbol,
+            "orderId": order_id
+        }
+        return await self._request("POST", "/order/cancel-order", body)
+
+    async def get_order_status(self, symbol: str, order_id: str) -> Dict[str, Any]:
+        """
+        Get the status of an order
+
+        Args:
+            symbol: Trading pair (e.g., "BTCUSDT_UMCBL")
+            order_id: ID of the order to check
+
+        Returns:
+            Order status from Bitget
+        """
+        params = {
+            "symbol": symbol,
+            "orderId": order_id
+        }
+        return await self._request("GET", "/order/detail", params=params)
+
+# Example usage
+if __name__ == "__main__":
+    async def main():
+        client = AsyncBitgetFuturesAPI("YOUR_API_KEY", "YOUR_API_SECRET", "YOUR_PASSPHRASE")
+        try:
+            # Both orders are in flight at the same time
+            results = await asyncio.gather(
+                client.place_limit_order("BTCUSDT_UMCBL", "open_long", 0.001, 30000),
+                client.place_limit_order("ETHUSDT_UMCBL", "open_long", 0.01, 2000),
+            )
+            print(results)
+        finally:
+            await close_async_sessions()
+
+    asyncio.run(main())
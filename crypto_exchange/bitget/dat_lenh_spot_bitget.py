@@ -1,26 +1,21 @@
-import requests
 import time
-import hmac
-import hashlib
-import base64
 import json
 from typing import Optional, Dict, Any
 
+from crypto_exchange.common.http_transport import get_session
+from crypto_exchange.common.signing import HmacSigner
+
 class BitgetSpotAPI:
     def __init__(self, api_key: str, api_secret: str, passphrase: str):
         self.api_key = api_key
         self.api_secret = api_secret
         self.passphrase = passphrase
         self.base_url = "https://api.bitget.com"
+        self.session = get_session(self.base_url)
+        self.signer = HmacSigner(api_secret)
         
     def _generate_signature(self, timestamp: str, method: str, endpoint: str, body: str = "") -> str:
-        message = timestamp + method.upper() + endpoint + body
-        mac = hmac.new(
-            bytes(self.api_secret, 'utf-8'),
-            bytes(message, 'utf-8'),
-            hashlib.sha256
-        )
-        return base64.b64encode(mac.digest()).decode('utf-8')
+        return self.signer.sign_base64(timestamp + method.upper() + endpoint + body)
     
     def _get_headers(self, method: str, endpoint: str, body: str = "") -> Dict[str, str]:
         timestamp = str(int(time.time() * 1000))
@@ -74,7 +69,7 @@ class BitgetSpotAPI:
         body = json.dumps(order_data)
         headers = self._get_headers("POST", endpoint, body)
         
-        response = requests.post(url, headers=headers, data=body)
+        response = self.session.post(url, headers=headers, data=body)
         return response.json()
     
     def get_order_status(self, order_id: str, symbol: str) -> Dict[str, Any]:
@@ -92,7 +87,7 @@ class BitgetSpotAPI:
         url = self.base_url + endpoint
         
         headers = self._get_headers("GET", endpoint)
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
         return response.json()
 
 # Example usage
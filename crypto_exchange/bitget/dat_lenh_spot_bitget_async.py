@@ -0,0 +1,82 @@
+import asyncio
+import json
+from typing import Optional, Dict, Any
+
+from crypto_exchange.bitget.dat_lenh_spot_bitget import BitgetSpotAPI
+from crypto_exchange.common.async_http_transport import close_async_sessions, get_async_session
+
+class AsyncBitgetSpotAPI(BitgetSpotAPI):
+    """asyncio counterpart of BitgetSpotAPI with the same method surface"""
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        size: float,
+        price: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Place a spot order on Bitget
+
+        Args:
+            symbol: Trading pair (e.g., "BTCUSDT")
+            side: "buy" or "sell"
+            order_type: "limit" or "market"
+            size: Order size
+            price: Price for limit orders (required for limit orders)
+
+        Returns:
+            Dict containing order response
+        """
+        endpoint = "/api/spot/v1/trade/orders"
+
+        order_data = {
+            "symbol": symbol,
+            "side": side,
+            "orderType": order_type,
+            "force": "normal",
+            "size": str(size)
+        }
+
+        if order_type == "limit":
+            if price is None:
+                raise ValueError("Price is required for limit orders")
+            order_data["price"] = str(price)
+
+        body = json.dumps(order_data)
+        headers = self._get_headers("POST", endpoint, body)
+
+        session = get_async_session(self.base_url)
+        async with session.post(self.base_url + endpoint, headers=headers, data=body) as response:
+            return await response.json(content_type=None)
+
+    async def get_order_status(self, order_id: str, symbol: str) -> Dict[str, Any]:
+        """
+        Get the status of an order
+
+        Args:
+            order_id: Order ID to check
+            symbol: Trading pair (e.g., "BTCUSDT")
+
+        Returns:
+            Dict containing order status
+        """
+        endpoint = f"/api/spot/v1/trade/orderInfo?orderId={order_id}&symbol={symbol}"
+        headers = self._get_headers("GET", endpoint)
+
+        session = get_async_session(self.base_url)
+        async with session.get(self.base_url + endpoint, headers=headers) as response:
+            return await response.json(content_type=None)
+
+# Example usage
+if __name__ == "__main__":
+    async def main():
+        client = AsyncBitgetSpotAPI("YOUR_API_KEY", "YOUR_API_SECRET", "YOUR_PASSPHRASE")
+        try:
+            order = await client.place_order("BTCUSDT", "buy", "limit", 0.001, 30000)
+            print("Order placed:", order)
+        finally:
+            await close_async_sessions()
+
+    asyncio.run(main())
@@ -1,22 +1,24 @@
-from bitget import Client
 import os
 from dotenv import load_dotenv
 
+from crypto_exchange.common.client_registry import get_client
+
 # Load environment variables
 load_dotenv()
 
-# Initialize Bitget client
+# Bitget credentials; the client itself is built on first use
 api_key = os.getenv('BITGET_API_KEY')
 api_secret = os.getenv('BITGET_API_SECRET')
 api_passphrase = os.getenv('BITGET_API_PASSPHRASE')
 
-client = Client(api_key, api_secret, api_passphrase)
+def _client():
+    return get_client('bitget', api_key, api_secret, api_passphrase)
 
 def get_spot_balance():
     """Get spot account balance"""
     try:
         # Get spot account assets
-        response = client.get_account_assets('spot')
+        response = _client().get_account_assets('spot')
         print("\n=== Spot Account Balance ===")
         for asset in response['data']:
             if float(asset['available']) > 0 or float(asset['frozen']) > 0:
@@ -32,7 +34,7 @@ def get_futures_balance():
     """Get futures account balance"""
     try:
         # Get futures account assets
-        response = client.get_account_assets('futures')
+        response = _client().get_account_assets('futures')
         print("\n=== Futures Account Balance ===")
         for asset in response['data']:
             if float(asset['available']) > 0 or float(asset['frozen']) > 0:
@@ -44,6 +46,25 @@ def get_futures_balance():
     except Exception as e:
         print(f"Error getting futures balance: {e}")
 
+def get_balance_rows(client, account_type='spot'):
+    """
+    Get non-zero balances in the portfolio aggregator's row format
+
+    Args:
+        client (Client): Bitget client
+        account_type (str): 'spot' or 'futures'
+
+    Returns:
+        list: Dicts with asset, free, locked and total
+    """
+    rows = []
+    for asset in client.get_account_assets(account_type)['data']:
+        free = float(asset['available'])
+        locked = float(asset['frozen'])
+        if free + locked > 0:
+            rows.append({'asset': asset['coin'], 'free': free, 'locked': locked, 'total': free + locked})
+    return rows
+
 if __name__ == "__main__":
     get_spot_balance()
     get_futures_balance()
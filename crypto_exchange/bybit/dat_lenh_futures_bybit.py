@@ -1,6 +1,13 @@
-from pybit.unified_trading import HTTP
 import time
-from typing import Optional, Literal
+from typing import Any, Dict, List, Optional, Literal
+
+from crypto_exchange.common.batch_orders import chunked, order_result, run_concurrently
+from crypto_exchange.common.client_registry import get_client
+from crypto_exchange.common.position_settings import get_position_settings
+from crypto_exchange.common.symbol_filters import OrderValidationError, format_decimal, get_symbol_filters
+
+# Maximum orders per /v5/order/create-batch request for linear contracts
+BATCH_ORDER_LIMIT = 20
 
 class BybitFuturesTrader:
     def __init__(self, api_key: str, api_secret: str, testnet: bool = False):
@@ -12,11 +19,9 @@ class BybitFuturesTrader:
             api_secret (str): Your Bybit API secret
             testnet (bool): Whether to use testnet (default: False)
         """
-        self.session = HTTP(
-            testnet=testnet,
-            api_key=api_key,
-            api_secret=api_secret
-        )
+        self.session = get_client('bybit', api_key, api_secret, testnet=testnet)
+        self.filters = get_symbol_filters('bybit_linear_testnet' if testnet else 'bybit_linear')
+        self.settings = get_position_settings('bybit_testnet' if testnet else 'bybit', api_key)
         
     def place_market_order(
         self,
@@ -40,12 +45,13 @@ class BybitFuturesTrader:
             dict: Order response from Bybit
         """
         try:
+            qty, _ = self.filters.prepare(symbol, qty)
             response = self.session.place_order(
                 category="linear",
                 symbol=symbol,
                 side=side,
                 orderType="Market",
-                qty=str(qty),
+                qty=format_decimal(qty),
                 reduceOnly=reduce_only,
                 closeOnTrigger=close_on_trigger
             )
@@ -80,13 +86,14 @@ class BybitFuturesTrader:
             dict: Order response from Bybit
         """
         try:
+            qty, price = self.filters.prepare(symbol, qty, price)
             response = self.session.place_order(
                 category="linear",
                 symbol=symbol,
                 side=side,
                 orderType="Limit",
-                qty=str(qty),
-                price=str(price),
+                qty=format_decimal(qty),
+                price=format_decimal(price),
                 reduceOnly=reduce_only,
                 closeOnTrigger=close_on_trigger,
                 timeInForce=time_in_force
@@ -120,13 +127,15 @@ class BybitFuturesTrader:
             dict: Order response from Bybit
         """
         try:
+            qty, _ = self.filters.prepare(symbol, qty)
+            stop_price = self.filters.round_price(symbol, stop_price)
             response = self.session.place_order(
                 category="linear",
                 symbol=symbol,
                 side=side,
                 orderType="Market",
-                qty=str(qty),
-                stopPrice=str(stop_price),
+                qty=format_decimal(qty),
+                stopPrice=format_decimal(stop_price),
                 reduceOnly=reduce_only,
                 closeOnTrigger=close_on_trigger,
                 triggerDirection=1 if side == "Buy" else 2
@@ -136,6 +145,66 @@ class BybitFuturesTrader:
             print(f"Error placing stop market order: {e}")
             return None
             
+    def place_orders(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Place many orders through Bybit's batch order endpoint
+
+        Orders are sent 20 per request with the chunks in flight concurrently.
+
+        Args:
+            batch (list): Order dicts with symbol, side, qty and optionally
+                price, order_type ("Market"/"Limit", default from price),
+                reduce_only and time_in_force
+
+        Returns:
+            list: One {'index', 'success', 'order', 'error'} dict per order, in batch order
+        """
+        # Entries are rounded and checked like the single-order methods; rejected ones are never sent
+        results: List[Optional[Dict[str, Any]]] = [None] * len(batch)
+        entries = []
+        for index, order in enumerate(batch):
+            try:
+                qty, price = self.filters.prepare(order['symbol'], order['qty'], order.get('price'))
+            except OrderValidationError as e:
+                results[index] = order_result(index, error=str(e))
+                continue
+            request = {
+                "symbol": order['symbol'],
+                "side": order['side'],
+                "orderType": order.get('order_type', "Limit" if price is not None else "Market"),
+                "qty": format_decimal(qty),
+                "reduceOnly": order.get('reduce_only', False)
+            }
+            if price is not None:
+                request["price"] = format_decimal(price)
+                request["timeInForce"] = order.get('time_in_force', "GTC")
+            entries.append((index, request))
+
+        chunks = list(chunked(entries, BATCH_ORDER_LIMIT))
+        responses = run_concurrently([
+            lambda chunk=chunk: self.session.place_batch_order(
+                category="linear", request=[request for _, request in chunk]
+            )
+            for chunk in chunks
+        ])
+
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, Exception) or response.get('retCode') != 0:
+                error = str(response) if isinstance(response, Exception) else response.get('retMsg')
+                print(f"Error placing batch orders: {error}")
+                for index, _ in chunk:
+                    results[index] = order_result(index, error=error)
+                continue
+            placed = response['result']['list']
+            statuses = response.get('retExtInfo', {}).get('list', [])
+            for i, (index, _) in enumerate(chunk):
+                status = statuses[i] if i < len(statuses) else {"code": 0}
+                if status.get('code') != 0:
+                    results[index] = order_result(index, error=f"{status.get('code')}: {status.get('msg')}")
+                else:
+                    results[index] = order_result(index, placed[i])
+        return results
+
     def cancel_order(self, symbol: str, order_id: str) -> dict:
         """
         Cancel an order
@@ -177,3 +246,62 @@ class BybitFuturesTrader:
         except Exception as e:
             print(f"Error getting position: {e}")
             return None
+
+    def set_leverage(self, symbol: str, leverage: int) -> dict:
+        """
+        Set buy and sell leverage, skipping the call when it is already set
+
+        Args:
+            symbol (str): Trading pair (e.g. "BTCUSDT")
+            leverage (int): Leverage value
+
+        Returns:
+            dict: Response from Bybit, or None when nothing was sent or on error
+        """
+        try:
+            return self.settings.update(
+                symbol, 'leverage', leverage,
+                lambda: self.session.set_leverage(
+                    category="linear",
+                    symbol=symbol,
+                    buyLeverage=str(leverage),
+                    sellLeverage=str(leverage)
+                ),
+                # 110043: leverage not modified
+                unchanged=lambda e: getattr(e, 'status_code', None) == 110043
+            )
+        except Exception as e:
+            print(f"Error setting leverage: {e}")
+            return None
+
+    def set_margin_mode(self, symbol: str, margin_mode: Literal["cross", "isolated"], leverage: int) -> dict:
+        """
+        Switch between cross and isolated margin, skipping the call when already in that mode
+
+        Args:
+            symbol (str): Trading pair (e.g. "BTCUSDT")
+            margin_mode (str): "cross" or "isolated"
+            leverage (int): Leverage to use in the new mode (required by Bybit)
+
+        Returns:
+            dict: Response from Bybit, or None when nothing was sent or on error
+        """
+        try:
+            response = self.settings.update(
+                symbol, 'margin_mode', margin_mode,
+                lambda: self.session.switch_margin_mode(
+                    category="linear",
+                    symbol=symbol,
+                    tradeMode=0 if margin_mode == "cross" else 1,
+                    buyLeverage=str(leverage),
+                    sellLeverage=str(leverage)
+                ),
+                # 110026: cross/isolated margin mode is not modified
+                unchanged=lambda e: getattr(e, 'status_code', None) == 110026
+            )
+            if response is not None:
+                self.settings.record(symbol, 'leverage', leverage)
+            return response
+        except Exception as e:
+            print(f"Error setting margin mode: {e}")
+            return None
@@ -0,0 +1,226 @@
+import asyncio
+import json
+import time
+from typing import Literal, Optional
+from urllib.parse import urlencode
+
+from crypto_exchange.common.async_http_transport import close_async_sessions, get_async_session
+from crypto_exchange.common.signing import HmacSigner
+
+class AsyncBybitFuturesTrader:
+    """
+    asyncio counterpart of BybitFuturesTrader with the same method surface
+
+    pybit only ships a blocking client, so the v5 REST calls are signed here
+    and sent over the shared aiohttp session.
+    """
+
+    RECV_WINDOW = "5000"
+
+    def __init__(self, api_key: str, api_secret: str, testnet: bool = False):
+        """
+        Initialize the async Bybit futures trader
+
+        Args:
+            api_key (str): Your Bybit API key
+            api_secret (str): Your Bybit API secret
+            testnet (bool): Whether to use testnet (default: False)
+        """
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.base_url = "https://api-testnet.bybit.com" if testnet else "https://api.bybit.com"
+        self.signer = HmacSigner(api_secret)
+
+    def _get_headers(self, payload: str) -> dict:
+        timestamp = str(int(time.time() * 1000))
+        signature = self.signer.sign_hex(timestamp + self.api_key + self.RECV_WINDOW + payload)
+        return {
+            "X-BAPI-API-KEY": self.api_key,
+            "X-BAPI-TIMESTAMP": timestamp,
+            "X-BAPI-RECV-WINDOW": self.RECV_WINDOW,
+            "X-BAPI-SIGN": signature,
+            "Content-Type": "application/json"
+        }
+
+    async def _request(self, method: str, endpoint: str, params: dict) -> dict:
+        session = get_async_session(self.base_url)
+        if method == "GET":
+            query = urlencode(params)
+            url = f"{self.base_url}{endpoint}?{query}"
+            request = session.get(url, headers=self._get_headers(query))
+        else:
+            body = json.dumps(params)
+            url = f"{self.base_url}{endpoint}"
+            request = session.post(url, headers=self._get_headers(body), data=body)
+        async with request as response:
+            return await response.json(content_type=None)
+
+    async def place_market_order(
+        self,
+        symbol: str,
+        side: Literal["Buy", "Sell"],
+        qty: float,
+        reduce_only: bool = False,
+        close_on_trigger: bool = False
+    ) -> dict:
+        """
+        Place a market order
+
+        Args:
+            symbol (str): Trading pair (e.g. "BTCUSDT")
+            side (str): "Buy" or "Sell"
+            qty (float): Order quantity
+            reduce_only (bool): Whether to reduce position only
+            close_on_trigger (bool): Whether to close position on trigger
+
+        Returns:
+            dict: Order response from Bybit
+        """
+        try:
+            return await self._request("POST", "/v5/order/create", {
+                "category": "linear",
+                "symbol": symbol,
+                "side": side,
+                "orderType": "Market",
+                "qty": str(qty),
+                "reduceOnly": reduce_only,
+                "closeOnTrigger": close_on_trigger
+            })
+        except Exception as e:
+            print(f"Error placing market order: {e}")
+            return None
+
+    async def place_limit_order(
+        self,
+        symbol: str,
+        side: Literal["Buy", "Sell"],
+        qty: float,
+        price: float,
+        reduce_only: bool = False,
+        close_on_trigger: bool = False,
+        time_in_force: str = "GoodTillCancel"
+    ) -> dict:
+        """
+        Place a limit order
+
+        Args:
+            symbol (str): Trading pair (e.g. "BTCUSDT")
+            side (str): "Buy" or "Sell"
+            qty (float): Order quantity
+            price (float): Order price
+            reduce_only (bool): Whether to reduce position only
+            close_on_trigger (bool): Whether to close position on trigger
+            time_in_force (str): Order time in force (default: "GoodTillCancel")
+
+        Returns:
+            dict: Order response from Bybit
+        """
+        try:
+            return await self._request("POST", "/v5/order/create", {
+                "category": "linear",
+                "symbol": symbol,
+                "side": side,
+                "orderType": "Limit",
+                "qty": str(qty),
+                "price": str(price),
+                "reduceOnly": reduce_only,
+                "closeOnTrigger": close_on_trigger,
+                "timeInForce": time_in_force
+            })
+        except Exception as e:
+            print(f"Error placing limit order: {e}")
+            return None
+
+    async def place_stop_market_order(
+        self,
+        symbol: str,
+        side: Literal["Buy", "Sell"],
+        qty: float,
+        stop_price: float,
+        reduce_only: bool = False,
+        close_on_trigger: bool = False
+    ) -> dict:
+        """
+        Place a stop market order
+
+        Args:
+            symbol (str): Trading pair (e.g. "BTCUSDT")
+            side (str): "Buy" or "Sell"
+            qty (float): Order quantity
+            stop_price (float): Stop price
+            reduce_only (bool): Whether to reduce position only
+            close_on_trigger (bool): Whether to close position on trigger
+
+        Returns:
+            dict: Order response from Bybit
+        """
+        try:
+            return await self._request("POST", "/v5/order/create", {
+                "category": "linear",
+                "symbol": symbol,
+                "side": side,
+                "orderType": "Market",
+                "qty": str(qty),
+                "stopPrice": str(stop_price),
+                "reduceOnly": reduce_only,
+                "closeOnTrigger": close_on_trigger,
+                "triggerDirection": 1 if side == "Buy" else 2
+            })
+        except Exception as e:
+            print(f"Error placing stop market order: {e}")
+            return None
+
+    async def cancel_order(self, symbol: str, order_id: str) -> dict:
+        """
+        Cancel an order
+
+        Args:
+            symbol (str): Trading pair (e.g. "BTCUSDT")
+            order_id (str): Order ID to cancel
+
+        Returns:
+            dict: Cancel response from Bybit
+        """
+        try:
+            return await self._request("POST", "/v5/order/cancel", {
+                "category": "linear",
+                "symbol": symbol,
+                "orderId": order_id
+            })
+        except Exception as e:
+            print(f"Error canceling order: {e}")
+            return None
+
+    async def get_position(self, symbol: str) -> dict:
+        """
+        Get current position information
+
+        Args:
+            symbol (str): Trading pair (e.g. "BTCUSDT")
+
+        Returns:
+            dict: Position information from Bybit
+        """
+        try:
+            return await self._request("GET", "/v5/position/list", {
+                "category": "linear",
+                "symbol": symbol
+            })
+        except Exception as e:
+            print(f"Error getting position: {e}")
+            return None
+
+# Example usage
+if __name__ == "__main__":
+    async def main():
+        trader = AsyncBybitFuturesTrader("YOUR_API_KEY", "YOUR_API_SECRET", testnet=True)
+        try:
+            orders = await asyncio.gather(*[
+                trader.place_limit_order("BTCUSDT", "Buy", 0.001, price)
+                for price in (30000, 29900, 29800)
+            ])
+            print(orders)
+        finally:
+            await close_async_sessions()
+
+    asyncio.run(main())
@@ -1,28 +1,22 @@
-import requests
 import time
-import hmac
-import hashlib
 import json
 from typing import Dict, Optional
 
+from crypto_exchange.common.http_transport import get_session
+from crypto_exchange.common.signing import HmacSigner
+from crypto_exchange.common.symbol_filters import format_decimal
+
 class BybitSpotAPI:
     def __init__(self, api_key: str, api_secret: str, testnet: bool = False):
         self.api_key = api_key
         self.api_secret = api_secret
         self.base_url = "https://api-testnet.bybit.com" if testnet else "https://api.bybit.com"
+        self.session = get_session(self.base_url)
+        self.signer = HmacSigner(api_secret)
         
     def _generate_signature(self, params: Dict) -> str:
         """Generate signature for API request"""
-        param_str = ""
-        for key in sorted(params.keys()):
-            param_str += f"{key}={params[key]}&"
-        param_str = param_str[:-1]
-        signature = hmac.new(
-            self.api_secret.encode("utf-8"),
-            param_str.encode("utf-8"),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        return self.signer.sign_params_hex(params)
 
     def place_order(
         self,
@@ -55,17 +49,17 @@ class BybitSpotAPI:
             "symbol": symbol,
             "side": side,
             "type": order_type,
-            "qty": str(qty),
+            "qty": format_decimal(qty),
             "timeInForce": time_in_force,
             "timestamp": timestamp
         }
         
         if order_type == "LIMIT" and price is not None:
-            params["price"] = str(price)
+            params["price"] = format_decimal(price)
             
         params["sign"] = self._generate_signature(params)
         
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}{endpoint}",
             data=params
         )
@@ -0,0 +1,68 @@
+import asyncio
+import json
+import time
+from typing import Dict, Optional
+
+from crypto_exchange.bybit.dat_lenh_spot_bybit import BybitSpotAPI
+from crypto_exchange.common.async_http_transport import close_async_sessions, get_async_session
+
+class AsyncBybitSpotAPI(BybitSpotAPI):
+    """asyncio counterpart of BybitSpotAPI with the same method surface"""
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        qty: float,
+        price: Optional[float] = None,
+        time_in_force: str = "GTC"
+    ) -> Dict:
+        """
+        Place a spot order on Bybit
+
+        Args:
+            symbol: Trading pair (e.g. "BTCUSDT")
+            side: "Buy" or "Sell"
+            order_type: "LIMIT" or "MARKET"
+            qty: Order quantity
+            price: Order price (required for LIMIT orders)
+            time_in_force: Order time in force (default: "GTC")
+
+        Returns:
+            Dict containing order response
+        """
+        endpoint = "/spot/v3/private/order"
+        timestamp = int(time.time() * 1000)
+
+        params = {
+            "api_key": self.api_key,
+            "symbol": symbol,
+            "side": side,
+            "type": order_type,
+            "qty": str(qty),
+            "timeInForce": time_in_force,
+            "timestamp": timestamp
+        }
+
+        if order_type == "LIMIT" and price is not None:
+            params["price"] = str(price)
+
+        params["sign"] = self._generate_signature(params)
+        form = {key: str(value) for key, value in params.items()}
+
+        session = get_async_session(self.base_url)
+        async with session.post(f"{self.base_url}{endpoint}", data=form) as response:
+            return await response.json(content_type=None)
+
+# Example usage
+if __name__ == "__main__":
+    async def main():
+        client = AsyncBybitSpotAPI("YOUR_API_KEY", "YOUR_API_SECRET", testnet=True)
+        try:
+            response = await client.place_order("BTCUSDT", "Buy", "LIMIT", 0.001, 50000)
+            print("Order response:", json.dumps(response, indent=2))
+        finally:
+            await close_async_sessions()
+
+    asyncio.run(main())
@@ -1,19 +1,16 @@
-from pybit.unified_trading import HTTP
 import os
 from dotenv import load_dotenv
 
+from crypto_exchange.common.client_registry import get_client
+
 # Load environment variables
 load_dotenv()
 
-# Initialize Bybit client
+# Shared Bybit client, created once and reused by every call
 def get_bybit_client():
     api_key = os.getenv('BYBIT_API_KEY')
     api_secret = os.getenv('BYBIT_API_SECRET')
-    return HTTP(
-        testnet=False,
-        api_key=api_key,
-        api_secret=api_secret
-    )
+    return get_client('bybit', api_key, api_secret, testnet=False)
 
 def get_spot_balance():
     """Get spot account balance"""
@@ -47,6 +44,28 @@ def get_futures_balance():
     except Exception as e:
         print(f"Error: {str(e)}")
 
+def get_balance_rows(client, account_type="SPOT"):
+    """
+    Get non-zero balances in the portfolio aggregator's row format
+
+    Args:
+        client (HTTP): pybit unified trading session
+        account_type (str): "SPOT" or "CONTRACT"
+
+    Returns:
+        list: Dicts with asset, free, locked and total
+    """
+    response = client.get_wallet_balance(accountType=account_type)
+    if response['retCode'] != 0:
+        raise RuntimeError(response['retMsg'])
+    rows = []
+    for coin in response['result']['list'][0]['coin']:
+        total = float(coin['walletBalance'])
+        locked = float(coin.get('locked') or 0)
+        if total > 0:
+            rows.append({'asset': coin['coin'], 'free': total - locked, 'locked': locked, 'total': total})
+    return rows
+
 if __name__ == "__main__":
     get_spot_balance()
     get_futures_balance()
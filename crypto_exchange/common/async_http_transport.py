@@ -0,0 +1,122 @@
+import asyncio
+import os
+import weakref
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from crypto_exchange.common.rate_limiter import limiter_for_url
+
+# Defaults can be overridden from the environment or with configure_async_transport()
+_config = {
+    "limit": int(os.getenv("EXCHANGE_ASYNC_HTTP_LIMIT", "512")),
+    "limit_per_host": int(os.getenv("EXCHANGE_ASYNC_HTTP_LIMIT_PER_HOST", "128")),
+    "keepalive_timeout": float(os.getenv("EXCHANGE_ASYNC_HTTP_KEEPALIVE", "30")),
+    "connect_timeout": float(os.getenv("EXCHANGE_HTTP_CONNECT_TIMEOUT", "3.05")),
+    "total_timeout": float(os.getenv("EXCHANGE_HTTP_READ_TIMEOUT", "10")),
+}
+
+# aiohttp sessions are bound to the event loop that created them; keyed by the loop
+# itself, since a later loop can reuse the id of one asyncio.run() already closed
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, aiohttp.ClientSession]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _on_request_start(session, context, params):
+    limiter = limiter_for_url(str(params.url))
+    if limiter is not None:
+        await limiter.acquire_async(params.url.path, params.method)
+
+
+async def _on_request_end(session, context, params):
+    limiter = limiter_for_url(str(params.url))
+    if limiter is not None:
+        limiter.update_from_headers(params.response.headers, params.url.path)
+
+
+def _rate_limit_trace() -> aiohttp.TraceConfig:
+    trace = aiohttp.TraceConfig()
+    trace.on_request_start.append(_on_request_start)
+    trace.on_request_end.append(_on_request_end)
+    return trace
+
+
+def _host_key(base_url: str) -> str:
+    parts = urlsplit(base_url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def configure_async_transport(
+    limit: Optional[int] = None,
+    limit_per_host: Optional[int] = None,
+    keepalive_timeout: Optional[float] = None,
+    connect_timeout: Optional[float] = None,
+    total_timeout: Optional[float] = None
+) -> None:
+    """
+    Change the connector limits and timeouts used for sessions created from now on
+
+    Args:
+        limit (int, optional): Maximum in-flight connections per session
+        limit_per_host (int, optional): Maximum in-flight connections to one host
+        keepalive_timeout (float, optional): Seconds an idle connection is kept open
+        connect_timeout (float, optional): Connect timeout in seconds
+        total_timeout (float, optional): Whole-request timeout in seconds
+    """
+    for name, value in (
+        ("limit", limit),
+        ("limit_per_host", limit_per_host),
+        ("keepalive_timeout", keepalive_timeout),
+        ("connect_timeout", connect_timeout),
+        ("total_timeout", total_timeout),
+    ):
+        if value is not None:
+            _config[name] = value
+
+
+def get_async_session(base_url: str) -> aiohttp.ClientSession:
+    """
+    Get the shared aiohttp session for the host of base_url on the running loop
+
+    Requests wait for their venue's rate limiter before being sent.
+
+    Args:
+        base_url (str): Any URL on the target host
+
+    Returns:
+        aiohttp.ClientSession: Session shared by every async client on this loop
+    """
+    loop = asyncio.get_running_loop()
+    for closed_loop in [other for other in list(_sessions) if other.is_closed()]:
+        # The loop finished without close_async_sessions(); its sessions are unusable
+        _sessions.pop(closed_loop, None)
+    sessions = _sessions.setdefault(loop, {})
+    key = _host_key(base_url)
+    session = sessions.get(key)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=_config["limit"],
+            limit_per_host=_config["limit_per_host"],
+            keepalive_timeout=_config["keepalive_timeout"],
+            ttl_dns_cache=300
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=_config["total_timeout"],
+            connect=_config["connect_timeout"]
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            trace_configs=[_rate_limit_trace()]
+        )
+        sessions[key] = session
+    return session
+
+
+async def close_async_sessions() -> None:
+    """Close every session owned by the running loop"""
+    sessions = _sessions.pop(asyncio.get_running_loop(), {})
+    for session in sessions.values():
+        await session.close()
@@ -0,0 +1,69 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+
+def order_result(index: int, order: Any = None, error: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Per-order outcome returned by every place_orders() implementation
+
+    Args:
+        index (int): Position of the order in the submitted batch
+        order: Exchange response for that order when it was accepted
+        error (str, optional): Rejection reason when it was not
+
+    Returns:
+        dict: {'index', 'success', 'order', 'error'}
+    """
+    return {'index': index, 'success': error is None, 'order': order, 'error': error}
+
+
+def chunked(items: Sequence, size: int) -> Iterator[Sequence]:
+    """Split items into consecutive slices of at most size elements"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def run_concurrently(calls: Sequence[Callable[[], Any]], max_workers: int = 8) -> List[Any]:
+    """
+    Run blocking calls on a thread pool and return their results in order
+
+    Exceptions are returned in place of the result so one failure does not
+    hide the others.
+    """
+    def guarded(call):
+        try:
+            return call()
+        except Exception as e:
+            return e
+
+    if not calls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+        return list(executor.map(guarded, calls))
+
+
+def place_concurrently(place_one: Callable[[Dict[str, Any]], Any], batch: Sequence[Dict[str, Any]],
+                       is_error: Callable[[Any], Optional[str]] = lambda response: None,
+                       max_workers: int = 8) -> List[Dict[str, Any]]:
+    """
+    Fallback for venues without a batch endpoint: one request per order, in parallel
+
+    Args:
+        place_one (callable): Sends a single order given its batch entry
+        batch (list): Order dicts
+        is_error (callable): Returns a rejection reason for a response, or None
+        max_workers (int): Maximum requests in flight
+
+    Returns:
+        list: order_result() dicts in batch order
+    """
+    responses = run_concurrently([lambda order=order: place_one(order) for order in batch], max_workers)
+    results = []
+    for index, response in enumerate(responses):
+        if isinstance(response, Exception):
+            results.append(order_result(index, error=str(response)))
+        elif response is None:
+            results.append(order_result(index, error="No response"))
+        else:
+            results.append(order_result(index, response, is_error(response)))
+    return results
@@ -0,0 +1,406 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Callable, Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+from crypto_exchange.binance.getOHLCV_binance import INTERVAL_MS, KLINE_DTYPE
+
+logger = logging.getLogger(__name__)
+
+BASE_INTERVAL = '1m'
+BASE_MS = INTERVAL_MS[BASE_INTERVAL]
+
+
+class CandleRing:
+    def __init__(self, capacity: int = 1000):
+        """
+        Fixed-size rolling window of KLINE_DTYPE candles
+
+        Every record is written twice, capacity slots apart, so the newest
+        `capacity` candles are always one contiguous slice of the backing
+        array. view() therefore returns a zero-copy array with exactly the
+        layout of load_klines() and get_klines(as_arrays=True), ready for
+        common.indicators or the backtest engine.
+
+        The newest candle may still be forming (kline streams update it until
+        it closes); it is replaced in place until a later open time arrives.
+
+        Args:
+            capacity (int): Number of candles kept
+        """
+        self.capacity = capacity
+        self._buffer = np.zeros(2 * capacity, dtype=KLINE_DTYPE)
+        self.count = 0  # candles ever written
+        self.forming = False
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        return int(self._buffer['timestamp'][(self.count - 1) % self.capacity]) if self.count else None
+
+    def _write(self, slot: int, record) -> None:
+        self._buffer[slot] = record
+        self._buffer[slot + self.capacity] = record
+
+    def upsert(self, timestamp: int, open: float, high: float, low: float, close: float, volume: float,
+               closed: bool = True) -> bool:
+        """
+        Append a candle, or replace the newest one when the open time matches
+
+        Returns:
+            bool: False when the candle is older than the newest one and was ignored
+        """
+        last = self.last_timestamp
+        if last is not None and timestamp < last:
+            return False
+        if timestamp != last:
+            self.count += 1
+        self._write((self.count - 1) % self.capacity, (timestamp, open, high, low, close, volume))
+        self.forming = not closed
+        return True
+
+    def extend(self, klines: np.ndarray) -> None:
+        """Append closed candles newer than the newest one held (e.g. history from load_klines)"""
+        last = self.last_timestamp
+        if last is not None:
+            klines = klines[klines['timestamp'] >= last]
+            if len(klines) and klines['timestamp'][0] == last:
+                self.count -= 1  # the first record replaces the newest one
+        klines = klines[-self.capacity:]
+        for start in range(0, len(klines), self.capacity):
+            chunk = klines[start:start + self.capacity]
+            slots = (self.count + np.arange(len(chunk))) % self.capacity
+            self._buffer[slots] = chunk
+            self._buffer[slots + self.capacity] = chunk
+            self.count += len(chunk)
+        if len(klines):
+            self.forming = False
+
+    def view(self, include_forming: bool = True) -> np.ndarray:
+        """Candles oldest first, as a view into the ring (valid until the next write)"""
+        if self.count < self.capacity:
+            window = self._buffer[:self.count]
+        else:
+            head = self.count % self.capacity
+            window = self._buffer[head:head + self.capacity]
+        return window[:-1] if self.forming and not include_forming else window
+
+
+def resample(klines: np.ndarray, interval: str) -> np.ndarray:
+    """
+    Aggregate candles into a higher timeframe, vectorized
+
+    Buckets start on multiples of the interval since the epoch (UTC), as on
+    the exchanges; a trailing partial bucket is kept.
+
+    Args:
+        klines (np.ndarray): KLINE_DTYPE candles sorted by time (e.g. 1m)
+        interval (str): Target interval ('5m', '1h', '1d', ...)
+
+    Returns:
+        np.ndarray: KLINE_DTYPE candles
+    """
+    if len(klines) == 0:
+        return np.empty(0, dtype=KLINE_DTYPE)
+    step = INTERVAL_MS[interval]
+    buckets = klines['timestamp'] - klines['timestamp'] % step
+    starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+    ends = np.concatenate((starts[1:], [len(klines)])) - 1
+    out = np.empty(len(starts), dtype=KLINE_DTYPE)
+    out['timestamp'] = buckets[starts]
+    out['open'] = klines['open'][starts]
+    out['high'] = np.maximum.reduceat(klines['high'], starts)
+    out['low'] = np.minimum.reduceat(klines['low'], starts)
+    out['close'] = klines['close'][ends]
+    out['volume'] = np.add.reduceat(klines['volume'], starts)
+    return out
+
+
+class CandleSeries:
+    def __init__(self, symbol: str, intervals: Sequence[str] = ('1m',), capacity: int = 1000):
+        """
+        Rolling candles of one symbol on several timeframes, all built from 1m
+
+        Higher timeframes are the closed minutes of the current bucket merged
+        with the forming minute, so repeated updates of a forming 1m candle
+        never double count its volume. A closed minute is merged once; feeding
+        it again (a repeated frame, or history overlapping the stream) only
+        refreshes the 1m candle.
+
+        Args:
+            symbol (str): Venue symbol
+            intervals (sequence): Timeframes to maintain; '1m' is always included
+            capacity (int): Candles kept per timeframe
+        """
+        self.symbol = symbol
+        self.rings: Dict[str, CandleRing] = {BASE_INTERVAL: CandleRing(capacity)}
+        for interval in intervals:
+            if interval not in self.rings:
+                if INTERVAL_MS[interval] % BASE_MS:
+                    raise ValueError(f"{interval} is not a whole number of minutes")
+                self.rings[interval] = CandleRing(capacity)
+        # Per higher timeframe: the bucket aggregated over its closed minutes
+        self._closed_part: Dict[str, Optional[tuple]] = {interval: None for interval in self.rings}
+        self._merged_minute: Optional[int] = None  # newest closed 1m candle merged into them
+        # Trade aggregation state: the forming minute as [ts, o, h, l, c, v]
+        self._minute: Optional[list] = None
+
+    def __getitem__(self, interval: str) -> np.ndarray:
+        return self.rings[interval].view()
+
+    def on_candle(self, timestamp: int, open: float, high: float, low: float, close: float, volume: float,
+                  closed: bool) -> None:
+        """Feed a 1m candle, forming (closed=False) or final"""
+        if not self.rings[BASE_INTERVAL].upsert(timestamp, open, high, low, close, volume, closed):
+            return
+        if self._merged_minute is not None and timestamp <= self._merged_minute:
+            return
+        for interval, ring in self.rings.items():
+            if interval == BASE_INTERVAL:
+                continue
+            step = INTERVAL_MS[interval]
+            bucket = timestamp - timestamp % step
+            part = self._closed_part[interval]
+            if part is None or part[0] != bucket:
+                merged = (bucket, open, high, low, close, volume)
+            else:
+                merged = (bucket, part[1], max(part[2], high), min(part[3], low), close, part[5] + volume)
+            bucket_closed = closed and timestamp + BASE_MS >= bucket + step
+            ring.upsert(*merged, closed=bucket_closed)
+            if closed:
+                self._closed_part[interval] = None if bucket_closed else merged
+        if closed:
+            self._merged_minute = timestamp
+
+    def on_trade(self, timestamp: int, price: float, qty: float) -> None:
+        """Build 1m candles from individual trades (ms timestamp)"""
+        minute = timestamp - timestamp % BASE_MS
+        candle = self._minute
+        if candle is not None and minute > candle[0]:
+            self.on_candle(*candle, closed=True)
+            candle = None
+        if candle is None:
+            candle = self._minute = [minute, price, price, price, price, 0.0]
+        elif minute < candle[0]:
+            return  # late trade of a minute already closed
+        candle[2] = max(candle[2], price)
+        candle[3] = min(candle[3], price)
+        candle[4] = price
+        candle[5] += qty
+        self.on_candle(*candle, closed=False)
+
+    def load_history(self, klines: np.ndarray, now_ms: Optional[int] = None) -> int:
+        """
+        Replay 1m candles newer than the newest one held, e.g. after a reconnect
+
+        A candle whose minute has not ended by now_ms is fed as forming.
+
+        Returns:
+            int: Candles fed
+        """
+        last = self.rings[BASE_INTERVAL].last_timestamp
+        if last is not None:
+            klines = klines[klines['timestamp'] >= last]
+        now_ms = now_ms if now_ms is not None else int(time.time() * 1000)
+        for record in klines.tolist():
+            self.on_candle(*record, closed=record[0] + BASE_MS <= now_ms)
+        return len(klines)
+
+
+class CandleFeed:
+    """
+    Builds CandleSeries for several symbols from one venue WebSocket
+
+    Subclasses translate venue frames into on_candle / on_trade calls.
+    """
+
+    venue = ''
+    ws_url = ''
+    rest_venue = ''  # KLINE_ENDPOINTS key used to fill gaps after reconnects
+
+    def __init__(self, symbols: Iterable[str], intervals: Sequence[str] = ('1m',), capacity: int = 1000):
+        self.series: Dict[str, CandleSeries] = {
+            symbol: CandleSeries(symbol, intervals, capacity) for symbol in symbols
+        }
+        self.messages = 0
+
+    def stream_url(self) -> str:
+        return self.ws_url
+
+    def subscribe_message(self) -> Optional[dict]:
+        return None
+
+    def on_message(self, message: dict) -> Optional[str]:
+        """
+        Feed one decoded WebSocket frame
+
+        Returns:
+            str | None: Symbol whose candles changed
+        """
+        raise NotImplementedError
+
+    def backfill(self, limit: int = 1000) -> None:
+        """Fetch recent 1m candles over REST for every symbol; blocking, run it in an executor"""
+        from crypto_exchange.common.ohlcv import iter_ohlcv
+
+        now_ms = int(time.time() * 1000)
+        pairs = [(symbol, BASE_INTERVAL) for symbol in self.series]
+        for result in iter_ohlcv(pairs, venue=self.rest_venue, limit=limit):
+            if result.error is not None:
+                logger.warning(f"{self.venue} {result.symbol} candle backfill failed: {result.error}")
+                continue
+            self.series[result.symbol].load_history(result.klines, now_ms)
+
+
+class BinanceKlineFeed(CandleFeed):
+    venue = 'binance'
+    rest_venue = 'binance_spot'
+
+    def stream_url(self) -> str:
+        streams = '/'.join(f"{symbol.lower()}@kline_1m" for symbol in self.series)
+        return f"wss://stream.binance.com:9443/stream?streams={streams}"
+
+    def on_message(self, message: dict) -> Optional[str]:
+        data = message.get('data', message)
+        if data.get('e') != 'kline':
+            return None
+        self.messages += 1
+        k = data['k']
+        self.series[data['s']].on_candle(int(k['t']), float(k['o']), float(k['h']), float(k['l']),
+                                         float(k['c']), float(k['v']), bool(k['x']))
+        return data['s']
+
+
+class BinanceTradeFeed(CandleFeed):
+    """Candles from aggregated trades: updates on every trade instead of every 250 ms"""
+
+    venue = 'binance'
+    rest_venue = 'binance_spot'
+
+    def stream_url(self) -> str:
+        streams = '/'.join(f"{symbol.lower()}@aggTrade" for symbol in self.series)
+        return f"wss://stream.binance.com:9443/stream?streams={streams}"
+
+    def on_message(self, message: dict) -> Optional[str]:
+        data = message.get('data', message)
+        if data.get('e') != 'aggTrade':
+            return None
+        self.messages += 1
+        self.series[data['s']].on_trade(int(data['T']), float(data['p']), float(data['q']))
+        return data['s']
+
+
+class BybitKlineFeed(CandleFeed):
+    venue = 'bybit'
+    ws_url = "wss://stream.bybit.com/v5/public/linear"
+    rest_venue = 'bybit_linear'
+
+    def subscribe_message(self) -> Optional[dict]:
+        return {"op": "subscribe", "args": [f"kline.1.{symbol}" for symbol in self.series]}
+
+    def on_message(self, message: dict) -> Optional[str]:
+        topic = message.get('topic', '')
+        if not topic.startswith('kline.'):
+            return None
+        self.messages += 1
+        symbol = topic.rsplit('.', 1)[1]
+        series = self.series[symbol]
+        for k in message['data']:
+            series.on_candle(int(k['start']), float(k['open']), float(k['high']), float(k['low']),
+                             float(k['close']), float(k['volume']), bool(k['confirm']))
+        return symbol
+
+
+class OkxCandleFeed(CandleFeed):
+    venue = 'okx'
+    # Candle channels are served on the business endpoint, not the public one
+    ws_url = "wss://ws.okx.com:8443/ws/v5/business"
+    rest_venue = 'okx'
+
+    def subscribe_message(self) -> Optional[dict]:
+        return {"op": "subscribe", "args": [{"channel": "candle1m", "instId": symbol} for symbol in self.series]}
+
+    def on_message(self, message: dict) -> Optional[str]:
+        arg = message.get('arg', {})
+        if arg.get('channel') != 'candle1m' or 'data' not in message:
+            return None
+        self.messages += 1
+        symbol = arg['instId']
+        series = self.series[symbol]
+        for row in message['data']:
+            series.on_candle(int(row[0]), float(row[1]), float(row[2]), float(row[3]),
+                             float(row[4]), float(row[5]), row[8] == '1')
+        return symbol
+
+
+CANDLE_FEEDS: Dict[str, type] = {
+    'binance': BinanceKlineFeed,
+    'binance_trades': BinanceTradeFeed,
+    'bybit': BybitKlineFeed,
+    'okx': OkxCandleFeed,
+}
+
+
+def _decode(raw) -> Optional[dict]:
+    try:
+        message = json.loads(raw)
+    except ValueError:
+        return None  # plain-text heartbeats such as OKX's "pong"
+    return message if isinstance(message, dict) else None
+
+
+async def run_candle_stream(feed: CandleFeed,
+                            on_update: Optional[Callable[[CandleSeries], None]] = None,
+                            backfill: bool = True,
+                            reconnect_delay: float = 1.0) -> None:
+    """
+    Keep feed.series up to date from the live WebSocket stream until cancelled
+
+    On every (re)connect the candles missed while disconnected are fetched
+    over REST, off the event loop, before live frames are applied.
+
+    Args:
+        feed (CandleFeed): Venue adapter
+        on_update (callable, optional): Called with the CandleSeries after every change
+        backfill (bool): Fill gaps from the venue's REST klines endpoint
+        reconnect_delay (float): Seconds to wait before reconnecting after an error
+    """
+    import websockets
+
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            async with websockets.connect(feed.stream_url(), ping_interval=20) as ws:
+                subscribe = feed.subscribe_message()
+                if subscribe:
+                    await ws.send(json.dumps(subscribe))
+                if backfill and feed.rest_venue:
+                    # Frames queue in the socket meanwhile; upsert drops anything older
+                    await loop.run_in_executor(None, feed.backfill)
+                async for raw in ws:
+                    message = _decode(raw)
+                    if message is None:
+                        continue
+                    symbol = feed.on_message(message)
+                    if symbol is not None and on_update is not None:
+                        on_update(feed.series[symbol])
+        except (OSError, websockets.ConnectionClosed) as e:
+            logger.warning(f"{feed.venue} candle stream dropped: {e}")
+            await asyncio.sleep(reconnect_delay)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    feed = BinanceKlineFeed(["BTCUSDT", "ETHUSDT"], intervals=('1m', '5m', '1h'))
+
+    def show(series: CandleSeries):
+        candles = series['5m']
+        if feed.messages % 20 == 0 and len(candles):
+            print(f"{series.symbol} 5m close {candles['close'][-1]} ({len(candles)} candles)")
+
+    asyncio.run(run_candle_stream(feed, on_update=show))
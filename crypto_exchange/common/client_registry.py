@@ -0,0 +1,178 @@
+import hashlib
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from crypto_exchange.common.http_transport import close_sessions, wrap_sdk_session
+
+logger = logging.getLogger(__name__)
+
+
+def _binance_factory(api_key, api_secret, passphrase, testnet, **options):
+    from binance.client import Client
+    client = Client(api_key, api_secret, testnet=testnet, **options)
+    # Route python-binance through the pooled, rate limited transport
+    client.session = wrap_sdk_session(client.session)
+    return client
+
+
+def _bybit_factory(api_key, api_secret, passphrase, testnet, **options):
+    from pybit.unified_trading import HTTP
+    client = HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret, **options)
+    # pybit keeps its requests.Session in .client
+    client.client = wrap_sdk_session(client.client)
+    return client
+
+
+def _okx_factory(api_key, api_secret, passphrase, testnet, default_type=None, **options):
+    import ccxt
+    config = {
+        'apiKey': api_key,
+        'secret': api_secret,
+        'password': passphrase,
+        'enableRateLimit': True,
+        **options,
+    }
+    if default_type:
+        config.setdefault('options', {})['defaultType'] = default_type
+    exchange = ccxt.okx(config)
+    if testnet:
+        exchange.set_sandbox_mode(True)
+    return exchange
+
+
+def _bitget_factory(api_key, api_secret, passphrase, testnet, **options):
+    from bitget import Client
+    return Client(api_key, api_secret, passphrase, **options)
+
+
+def _close_client(client: Any) -> None:
+    """Close whatever connection pool the SDK client holds"""
+    for name in ('close_connection', 'close'):
+        method = getattr(client, name, None)
+        if callable(method):
+            method()
+            return
+    # pybit keeps its requests.Session in .client, ccxt and python-binance in .session
+    for name in ('session', 'client'):
+        session = getattr(client, name, None)
+        if session is not None and callable(getattr(session, 'close', None)):
+            session.close()
+            return
+
+
+class ClientRegistry:
+    def __init__(self):
+        """
+        Long-lived SDK clients keyed by venue, credentials, testnet flag and options
+
+        Clients are created on first use and then shared, so every balance,
+        order and position helper using the same key reuses the same warm
+        connection pool.
+        """
+        self._factories: Dict[str, Callable[..., Any]] = {
+            'binance': _binance_factory,
+            'bybit': _bybit_factory,
+            'okx': _okx_factory,
+            'bitget': _bitget_factory,
+        }
+        self._clients: Dict[Tuple, Any] = {}
+        self._lock = threading.RLock()
+
+    def register_factory(self, venue: str, factory: Callable[..., Any]) -> None:
+        """
+        Register how to build a client for a venue
+
+        Args:
+            venue (str): Venue name used in get()
+            factory (callable): factory(api_key, api_secret, passphrase, testnet, **options)
+        """
+        self._factories[venue] = factory
+
+    @staticmethod
+    def _key(venue, api_key, api_secret, passphrase, testnet, options) -> Tuple:
+        # Never keep the secrets themselves in the key
+        secret_digest = hashlib.sha256(f"{api_secret}\0{passphrase}".encode('utf-8')).hexdigest()
+        return venue, api_key, secret_digest, bool(testnet), tuple(sorted(options.items()))
+
+    def get(self, venue: str, api_key: Optional[str] = None, api_secret: Optional[str] = None,
+            passphrase: Optional[str] = None, testnet: bool = False, **options) -> Any:
+        """
+        Get the shared client for these credentials, creating it on first use
+
+        Args:
+            venue (str): 'binance', 'bybit', 'okx', 'bitget' or a registered venue
+            api_key (str, optional): API key
+            api_secret (str, optional): API secret
+            passphrase (str, optional): API passphrase (OKX, Bitget)
+            testnet (bool): Whether to use the venue's testnet
+            **options: Extra factory options, part of the key (e.g. default_type='swap')
+
+        Returns:
+            The SDK client
+        """
+        key = self._key(venue, api_key, api_secret, passphrase, testnet, options)
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    if venue not in self._factories:
+                        raise ValueError(f"No client factory registered for {venue}")
+                    client = self._factories[venue](api_key, api_secret, passphrase, testnet, **options)
+                    self._clients[key] = client
+        return client
+
+    def refresh(self, venue: str, api_key: Optional[str] = None, api_secret: Optional[str] = None,
+                passphrase: Optional[str] = None, testnet: bool = False, **options) -> Any:
+        """
+        Close the client for these credentials and build a fresh one
+
+        Use after rotating keys or when a connection pool went bad.
+
+        Returns:
+            The new SDK client
+        """
+        key = self._key(venue, api_key, api_secret, passphrase, testnet, options)
+        with self._lock:
+            old = self._clients.pop(key, None)
+            if old is not None:
+                _close_client(old)
+            return self.get(venue, api_key, api_secret, passphrase, testnet, **options)
+
+    def close(self, venue: Optional[str] = None) -> None:
+        """
+        Close and forget clients
+
+        Args:
+            venue (str, optional): Only close this venue's clients; all when None
+        """
+        with self._lock:
+            keys = [key for key in self._clients if venue is None or key[0] == venue]
+            clients = [self._clients.pop(key) for key in keys]
+        for client in clients:
+            try:
+                _close_client(client)
+            except Exception as e:
+                logger.warning(f"Error closing client: {e}")
+
+
+registry = ClientRegistry()
+
+
+def get_client(venue: str, api_key: Optional[str] = None, api_secret: Optional[str] = None,
+               passphrase: Optional[str] = None, testnet: bool = False, **options) -> Any:
+    """Get a shared client from the default registry (see ClientRegistry.get)"""
+    return registry.get(venue, api_key, api_secret, passphrase, testnet, **options)
+
+
+def refresh_client(venue: str, api_key: Optional[str] = None, api_secret: Optional[str] = None,
+                   passphrase: Optional[str] = None, testnet: bool = False, **options) -> Any:
+    """Rebuild a client in the default registry (see ClientRegistry.refresh)"""
+    return registry.refresh(venue, api_key, api_secret, passphrase, testnet, **options)
+
+
+def close_clients() -> None:
+    """Close every registered SDK client and the pooled REST sessions; call on shutdown"""
+    registry.close()
+    close_sessions()
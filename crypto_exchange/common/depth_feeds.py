@@ -0,0 +1,460 @@
+import asyncio
+import json
+import logging
+import time
+import zlib
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional
+
+from crypto_exchange.common.http_transport import get_session
+from crypto_exchange.common.order_book import OrderBook
+
+logger = logging.getLogger(__name__)
+
+
+class DepthEvent(NamedTuple):
+    """Normalized depth diff: update ids plus absolute levels"""
+    first_id: int
+    last_id: int
+    prev_id: Optional[int]
+    bids: list
+    asks: list
+
+
+class DepthSync:
+    """
+    Keeps an OrderBook in sync with one venue's WebSocket depth stream
+
+    Subclasses translate venue frames; the base class tracks sequence numbers.
+    After a gap the book is cleared and either needs_snapshot (REST snapshot
+    venues) or needs_resubscribe (venues that push snapshots on subscribe) is
+    raised for the stream runner to act on.
+    """
+
+    venue = ''
+    ws_url = ''
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.book = OrderBook(symbol)
+        self.synced = False
+        self.needs_resubscribe = False
+        self.resyncs = 0
+        self.messages = 0
+
+    @property
+    def needs_snapshot(self) -> bool:
+        return False
+
+    def stream_url(self) -> str:
+        return self.ws_url
+
+    def subscribe_message(self) -> Optional[dict]:
+        return None
+
+    def reset(self) -> None:
+        """Drop the book; called on (re)connect and after a sequence gap"""
+        self.book.clear()
+        self.synced = False
+        self.needs_resubscribe = False
+
+    def _gap(self, expected, received) -> None:
+        logger.warning(f"{self.venue} {self.symbol} depth gap: expected {expected}, got {received}; resyncing")
+        self.resyncs += 1
+        self.reset()
+
+    def on_message(self, message: dict) -> bool:
+        """
+        Feed one decoded WebSocket frame
+
+        Returns:
+            bool: True when the book changed
+        """
+        raise NotImplementedError
+
+
+class BufferedDepthSync(DepthSync):
+    """Venues whose stream only carries diffs and needs a REST snapshot (Binance, MEXC)"""
+
+    snapshot_url = ''
+
+    def __init__(self, symbol: str, snapshot_limit: int = 1000):
+        super().__init__(symbol)
+        self.snapshot_limit = snapshot_limit
+        self._buffer = []
+        self._after_snapshot = False
+
+    @property
+    def needs_snapshot(self) -> bool:
+        return not self.synced and bool(self._buffer)
+
+    def reset(self) -> None:
+        super().reset()
+        self._buffer = []
+
+    def parse_event(self, message: dict) -> Optional[DepthEvent]:
+        raise NotImplementedError
+
+    def fetch_snapshot(self) -> dict:
+        """Download the REST depth snapshot ({'lastUpdateId', 'bids', 'asks'})"""
+        response = get_session(self.snapshot_url).get(
+            self.snapshot_url,
+            params={"symbol": self.symbol.upper(), "limit": self.snapshot_limit}
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def load_snapshot(self, snapshot: dict) -> bool:
+        """
+        Seed the book from a REST snapshot and replay the buffered diffs over it
+
+        Returns:
+            bool: True when the book is now in sync
+        """
+        update_id = int(snapshot['lastUpdateId'])
+        buffered = self._buffer
+        if buffered and update_id + 1 < buffered[0].first_id:
+            # Snapshot is older than the first diff we hold; wait for a newer one
+            return False
+
+        self.book.load_snapshot(snapshot['bids'], snapshot['asks'], update_id)
+        self.synced = True
+        self._after_snapshot = True
+        self._buffer = []
+        for event in buffered:
+            self._apply(event)
+            if not self.synced:
+                return False
+        return True
+
+    def _apply(self, event: DepthEvent) -> bool:
+        expected = self.book.update_id + 1
+        if event.last_id < expected:
+            return False  # already contained in the snapshot
+        if event.prev_id is not None and not self._after_snapshot:
+            in_sequence = event.prev_id == self.book.update_id
+        else:
+            in_sequence = event.first_id <= expected <= event.last_id
+        if not in_sequence:
+            self._gap(expected, event.first_id)
+            self._buffer.append(event)
+            return False
+        self._after_snapshot = False
+        self.book.apply(event.bids, event.asks)
+        self.book.update_id = event.last_id
+        return True
+
+    def on_message(self, message: dict) -> bool:
+        event = self.parse_event(message)
+        if event is None:
+            return False
+        self.messages += 1
+        if not self.synced:
+            self._buffer.append(event)
+            return False
+        return self._apply(event)
+
+
+class BinanceDepthSync(BufferedDepthSync):
+    venue = 'binance'
+    snapshot_url = "https://api.binance.com/api/v3/depth"
+
+    def stream_url(self) -> str:
+        return f"wss://stream.binance.com:9443/ws/{self.symbol.lower()}@depth@100ms"
+
+    def parse_event(self, message: dict) -> Optional[DepthEvent]:
+        if message.get('e') != 'depthUpdate':
+            return None
+        # USD-M futures streams also carry pu, the previous event's final id
+        prev_id = message.get('pu')
+        return DepthEvent(message['U'], message['u'], prev_id, message['b'], message['a'])
+
+
+class MexcDepthSync(BufferedDepthSync):
+    venue = 'mexc'
+    ws_url = "wss://wbs.mexc.com/ws"
+    snapshot_url = "https://api.mexc.com/api/v3/depth"
+
+    def subscribe_message(self) -> Optional[dict]:
+        return {"method": "SUBSCRIPTION", "params": [f"spot@public.increase.depth.v3.api@{self.symbol.upper()}"]}
+
+    def parse_event(self, message: dict) -> Optional[DepthEvent]:
+        data = message.get('d')
+        if not data or 'r' not in data:
+            return None
+        version = int(data['r'])
+        bids = [(level['p'], level['v']) for level in data.get('bids', [])]
+        asks = [(level['p'], level['v']) for level in data.get('asks', [])]
+        return DepthEvent(version, version, None, bids, asks)
+
+
+class BybitDepthSync(DepthSync):
+    venue = 'bybit'
+    ws_url = "wss://stream.bybit.com/v5/public/linear"
+
+    def __init__(self, symbol: str, depth: int = 50):
+        super().__init__(symbol)
+        self.depth = depth
+
+    def subscribe_message(self) -> Optional[dict]:
+        return {"op": "subscribe", "args": [f"orderbook.{self.depth}.{self.symbol.upper()}"]}
+
+    def on_message(self, message: dict) -> bool:
+        if not message.get('topic', '').startswith('orderbook.'):
+            return False
+        self.messages += 1
+        data = message['data']
+        update_id = int(data['u'])
+        # u == 1 means the service restarted and this delta is really a snapshot
+        if message.get('type') == 'snapshot' or update_id == 1:
+            self.book.load_snapshot(data['b'], data['a'], update_id)
+            self.synced = True
+            return True
+        if not self.synced:
+            return False
+        if update_id != self.book.update_id + 1:
+            self._gap(self.book.update_id + 1, update_id)
+            self.needs_resubscribe = True
+            return False
+        self.book.apply(data['b'], data['a'])
+        self.book.update_id = update_id
+        return True
+
+
+class OkxDepthSync(DepthSync):
+    venue = 'okx'
+    ws_url = "wss://ws.okx.com:8443/ws/v5/public"
+
+    def subscribe_message(self) -> Optional[dict]:
+        return {"op": "subscribe", "args": [{"channel": "books", "instId": self.symbol}]}
+
+    def on_message(self, message: dict) -> bool:
+        action = message.get('action')
+        if action not in ('snapshot', 'update'):
+            return False
+        self.messages += 1
+        data = message['data'][0]
+        if action == 'snapshot':
+            self.book.load_snapshot(data['bids'], data['asks'], int(data['seqId']))
+            self.synced = True
+            return True
+        if not self.synced:
+            return False
+        if int(data['prevSeqId']) != self.book.update_id:
+            self._gap(self.book.update_id, data['prevSeqId'])
+            self.needs_resubscribe = True
+            return False
+        self.book.apply(data['bids'], data['asks'])
+        self.book.update_id = int(data['seqId'])
+        return True
+
+
+class BitgetDepthSync(DepthSync):
+    venue = 'bitget'
+    ws_url = "wss://ws.bitget.com/v2/ws/public"
+    checksum_depth = 25
+
+    def __init__(self, symbol: str, inst_type: str = 'SPOT'):
+        super().__init__(symbol)
+        self.inst_type = inst_type
+        # price -> (price, size) as sent; the checksum is computed over the original strings
+        self._raw = ({}, {})
+
+    def subscribe_message(self) -> Optional[dict]:
+        return {"op": "subscribe", "args": [{"instType": self.inst_type, "channel": "books", "instId": self.symbol}]}
+
+    def reset(self) -> None:
+        super().reset()
+        self._raw = ({}, {})
+
+    def _store_raw(self, bids, asks) -> None:
+        for side, levels in zip(self._raw, (bids, asks)):
+            for level in levels:
+                if float(level[1]) > 0:
+                    side[float(level[0])] = (level[0], level[1])
+                else:
+                    side.pop(float(level[0]), None)
+
+    def _checksum(self) -> int:
+        """CRC32 of the top levels as 'bidPx:bidSz:askPx:askSz:...', as a signed 32-bit int"""
+        bids, asks = self.book.depth(self.checksum_depth)
+        raw_bids, raw_asks = self._raw
+        fields = []
+        for i in range(max(len(bids), len(asks))):
+            if i < len(bids):
+                fields.extend(raw_bids[bids[i][0]])
+            if i < len(asks):
+                fields.extend(raw_asks[asks[i][0]])
+        checksum = zlib.crc32(':'.join(fields).encode())
+        return checksum - (1 << 32) if checksum >= 1 << 31 else checksum
+
+    def on_message(self, message: dict) -> bool:
+        action = message.get('action')
+        if action not in ('snapshot', 'update'):
+            return False
+        self.messages += 1
+        data = message['data'][0]
+        seq = int(data['seq'])
+        if action == 'snapshot':
+            self.reset()
+            self.book.load_snapshot(data['bids'], data['asks'], seq)
+            self._store_raw(data['bids'], data['asks'])
+            self.synced = True
+            return True
+        if not self.synced:
+            return False
+        # pseq links to the previous update where provided; seq alone only orders frames
+        if 'pseq' in data and int(data['pseq']) != self.book.update_id:
+            self._gap(self.book.update_id, data['pseq'])
+            self.needs_resubscribe = True
+            return False
+        if seq <= self.book.update_id:
+            return False  # replayed frame
+        self.book.apply(data['bids'], data['asks'])
+        self._store_raw(data['bids'], data['asks'])
+        self.book.update_id = seq
+        # Without pseq a lost frame only shows up as a book that no longer matches the checksum
+        if data.get('checksum'):
+            checksum = self._checksum()
+            if int(data['checksum']) != checksum:
+                self._gap(f"checksum {data['checksum']}", f"checksum {checksum}")
+                self.needs_resubscribe = True
+                return False
+        return True
+
+
+DEPTH_SYNCS: Dict[str, type] = {
+    'binance': BinanceDepthSync,
+    'bybit': BybitDepthSync,
+    'okx': OkxDepthSync,
+    'bitget': BitgetDepthSync,
+    'mexc': MexcDepthSync,
+}
+
+
+def _decode(raw) -> Optional[dict]:
+    try:
+        message = json.loads(raw)
+    except ValueError:
+        return None  # plain-text heartbeats such as OKX's "pong"
+    return message if isinstance(message, dict) else None
+
+
+def replay_frames(path: str, sync: DepthSync,
+                  on_update: Optional[Callable[[OrderBook], None]] = None) -> DepthSync:
+    """
+    Drive a DepthSync from a recording made by run_depth_stream(record_path=...)
+
+    Each line is {"t": recv_time, "frame": <ws frame>} or
+    {"t": recv_time, "snapshot": <REST depth snapshot>}.
+
+    Args:
+        path (str): JSON-lines recording
+        sync (DepthSync): Venue adapter to feed
+        on_update (callable, optional): Called with the book after every change
+
+    Returns:
+        DepthSync: The same adapter, for chaining
+    """
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            record = json.loads(line)
+            if 'snapshot' in record:
+                changed = sync.needs_snapshot and sync.load_snapshot(record['snapshot'])
+            else:
+                changed = sync.on_message(record['frame'])
+            if changed and on_update is not None:
+                on_update(sync.book)
+    return sync
+
+
+async def run_depth_stream(sync: DepthSync,
+                           on_update: Optional[Callable[[OrderBook], None]] = None,
+                           record_path: Optional[str] = None,
+                           reconnect_delay: float = 1.0,
+                           snapshot_retry: float = 0.5,
+                           max_snapshot_retry: float = 10.0,
+                           connect: Optional[Callable[[str], Any]] = None) -> None:
+    """
+    Keep sync.book up to date from the live WebSocket stream until cancelled
+
+    Reconnects on errors and whenever the adapter asks for a resubscribe;
+    REST snapshots are fetched off the event loop. A snapshot older than the
+    buffered diffs is retried after snapshot_retry seconds, doubling up to
+    max_snapshot_retry, while frames keep being buffered.
+
+    Args:
+        sync (DepthSync): Venue adapter
+        on_update (callable, optional): Called with the book after every change
+        record_path (str, optional): Append every frame and snapshot here for replay_frames()
+        reconnect_delay (float): Seconds to wait before reconnecting after an error or a server close
+        snapshot_retry (float): Seconds before refetching a stale snapshot
+        max_snapshot_retry (float): Upper bound of the snapshot retry backoff
+        connect (callable, optional): url -> async context manager yielding a
+            connection with send and async iteration; defaults to
+            websockets.connect, override to replay against a local stand-in
+    """
+    reconnect_errors = (OSError,)
+    if connect is None:
+        import websockets
+
+        reconnect_errors += (websockets.ConnectionClosed,)
+
+        def connect(url):
+            return websockets.connect(url, ping_interval=20)
+
+    loop = asyncio.get_running_loop()
+    recorder = open(record_path, 'a', encoding='utf-8') if record_path else None
+
+    def record(kind, payload):
+        if recorder is not None:
+            recorder.write(json.dumps({"t": time.time(), kind: payload}) + "\n")
+
+    try:
+        while True:
+            try:
+                async with connect(sync.stream_url()) as ws:
+                    sync.reset()
+                    retry_delay = snapshot_retry
+                    retry_at = 0.0
+                    subscribe = sync.subscribe_message()
+                    if subscribe:
+                        await ws.send(json.dumps(subscribe))
+                    async for raw in ws:
+                        message = _decode(raw)
+                        if message is None:
+                            continue
+                        record("frame", message)
+                        changed = sync.on_message(message)
+                        if sync.needs_snapshot and loop.time() >= retry_at:
+                            snapshot = await loop.run_in_executor(None, sync.fetch_snapshot)
+                            record("snapshot", snapshot)
+                            changed = sync.load_snapshot(snapshot)
+                            if sync.needs_snapshot:
+                                retry_at = loop.time() + retry_delay
+                                retry_delay = min(retry_delay * 2, max_snapshot_retry)
+                            else:
+                                retry_delay = snapshot_retry
+                        if sync.needs_resubscribe:
+                            break
+                        if changed and on_update is not None:
+                            on_update(sync.book)
+                if sync.needs_resubscribe:
+                    continue
+                logger.warning(f"{sync.venue} depth stream closed by server; reconnecting")
+            except reconnect_errors as e:
+                logger.warning(f"{sync.venue} depth stream dropped: {e}")
+            await asyncio.sleep(reconnect_delay)
+    finally:
+        if recorder is not None:
+            recorder.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    btc = BinanceDepthSync("BTCUSDT")
+
+    def show(book: OrderBook):
+        if btc.messages % 50 == 0:
+            print(f"{book.symbol} bid {book.best_bid()} ask {book.best_ask()} spread {book.spread()}")
+
+    asyncio.run(run_depth_stream(btc, on_update=show, record_path="btcusdt_depth.jsonl"))
@@ -0,0 +1,151 @@
+import os
+import threading
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from crypto_exchange.common.rate_limiter import limiter_for_url
+
+Timeout = Union[float, Tuple[float, float]]
+
+# Defaults can be overridden from the environment or with configure_transport()
+_config = {
+    "pool_connections": int(os.getenv("EXCHANGE_HTTP_POOL_CONNECTIONS", "4")),
+    "pool_maxsize": int(os.getenv("EXCHANGE_HTTP_POOL_MAXSIZE", "32")),
+    "timeout": (
+        float(os.getenv("EXCHANGE_HTTP_CONNECT_TIMEOUT", "3.05")),
+        float(os.getenv("EXCHANGE_HTTP_READ_TIMEOUT", "10")),
+    ),
+}
+
+_sessions: Dict[str, "PooledSession"] = {}
+_lock = threading.Lock()
+
+
+class PooledSession(requests.Session):
+    def __init__(self, pool_connections: int, pool_maxsize: int, timeout: Timeout,
+                 rate_limited: bool = True):
+        """
+        requests.Session with a sized connection pool, keep-alive and a default timeout
+
+        Requests to hosts listed in rate_limiter.HOST_VENUES wait for their
+        venue's rate limiter before being sent.
+
+        Args:
+            pool_connections (int): Number of host pools to cache
+            pool_maxsize (int): Maximum number of kept-alive connections per host
+            timeout (float | tuple): Default (connect, read) timeout in seconds
+            rate_limited (bool): Apply the shared per-venue rate limiters
+        """
+        super().__init__()
+        # Orders are not idempotent, so never retry at the transport level
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=0
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        self.headers["Connection"] = "keep-alive"
+        self.timeout = timeout
+        self.rate_limited = rate_limited
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+    def send(self, request, **kwargs):
+        # SDKs such as pybit call send() directly, so limit here rather than in request()
+        limiter = limiter_for_url(request.url) if self.rate_limited else None
+        if limiter is None:
+            return super().send(request, **kwargs)
+        kwargs.setdefault("timeout", self.timeout)
+        path = urlsplit(request.url).path
+        limiter.acquire(path, request.method)
+        response = super().send(request, **kwargs)
+        limiter.update_from_headers(response.headers, path)
+        return response
+
+
+def _host_key(base_url: str) -> str:
+    parts = urlsplit(base_url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def configure_transport(
+    pool_connections: Optional[int] = None,
+    pool_maxsize: Optional[int] = None,
+    timeout: Optional[Timeout] = None
+) -> None:
+    """
+    Change the pool sizes and timeout used for sessions created from now on
+
+    Existing sessions keep their settings; call close_sessions() to rebuild them.
+
+    Args:
+        pool_connections (int, optional): Number of host pools to cache
+        pool_maxsize (int, optional): Maximum kept-alive connections per host
+        timeout (float | tuple, optional): Default (connect, read) timeout in seconds
+    """
+    with _lock:
+        if pool_connections is not None:
+            _config["pool_connections"] = pool_connections
+        if pool_maxsize is not None:
+            _config["pool_maxsize"] = pool_maxsize
+        if timeout is not None:
+            _config["timeout"] = timeout
+
+
+def get_session(base_url: str) -> PooledSession:
+    """
+    Get the shared keep-alive session for the host of base_url
+
+    Args:
+        base_url (str): Any URL on the target host (e.g. 'https://api.bybit.com')
+
+    Returns:
+        PooledSession: Session shared by every client talking to that host
+    """
+    key = _host_key(base_url)
+    session = _sessions.get(key)
+    if session is None:
+        with _lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = PooledSession(
+                    _config["pool_connections"],
+                    _config["pool_maxsize"],
+                    _config["timeout"]
+                )
+                _sessions[key] = session
+    return session
+
+
+def wrap_sdk_session(session: requests.Session) -> PooledSession:
+    """
+    Pooled, rate limited replacement for an SDK client's own requests.Session
+
+    The SDK's headers (API key, user agent) are carried over, so the result
+    must stay private to that client rather than be shared per host.
+
+    Args:
+        session (requests.Session): Session created by the SDK
+
+    Returns:
+        PooledSession: Drop-in replacement to assign back onto the client
+    """
+    pooled = PooledSession(_config["pool_connections"], _config["pool_maxsize"], _config["timeout"])
+    pooled.headers.update(session.headers)
+    session.close()
+    return pooled
+
+
+def close_sessions() -> None:
+    """Close every pooled session and drop their connections"""
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
@@ -0,0 +1,348 @@
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Vectorized indicators take 1-D float arrays (e.g. klines['close'] of a
+# KLINE_DTYPE array) and return arrays of the same length, NaN until enough
+# candles are available. Seeding follows TA-Lib: EMA starts from the SMA of
+# its first period, RSI and ATR use Wilder smoothing seeded the same way.
+#
+# The classes at the bottom compute the same values one closed candle at a
+# time in O(1), for live streams.
+
+
+def _as_float(values) -> np.ndarray:
+    # Fields of a structured kline array are strided views; copy once so the
+    # arithmetic below runs on contiguous memory
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _first_valid(x: np.ndarray) -> int:
+    valid = ~np.isnan(x)
+    return int(valid.argmax()) if valid.any() else len(x)
+
+
+def _linear_filter(x: np.ndarray, alpha: float, init: float) -> np.ndarray:
+    """
+    y[t] = alpha * x[t] + (1 - alpha) * y[t - 1], with y[-1] = init
+
+    The recurrence is solved in fixed-size blocks: inside a block it is a
+    rescaled cumulative sum, and only one carry per block is propagated in
+    Python. Blocks are sized so the rescaling stays below 1e3 and costs at
+    most three digits of precision.
+    """
+    n = len(x)
+    decay = 1.0 - alpha
+    if n == 0:
+        return np.empty(0)
+    if decay == 0.0:
+        return x.copy()
+    block = max(1, min(n, int(math.log(1e3) / -math.log(decay))))
+    blocks = -(-n // block)
+    padded = np.zeros(blocks * block)
+    padded[:n] = x
+    padded = padded.reshape(blocks, block)
+
+    steps = np.arange(block)
+    partial = np.cumsum(padded * (alpha * decay ** -steps), axis=1) * decay ** steps
+    block_decay = decay ** block
+    carries = np.empty(blocks)
+    carry = init
+    for k, end in enumerate(partial[:, -1].tolist()):
+        carries[k] = carry
+        carry = block_decay * carry + end
+    partial += carries[:, None] * decay ** (steps + 1)
+    return partial.ravel()[:n]
+
+
+def sma(values, period: int) -> np.ndarray:
+    """Simple moving average"""
+    x = _as_float(values)
+    out = np.full(len(x), np.nan)
+    if len(x) >= period:
+        cumulative = np.cumsum(x)
+        out[period - 1] = cumulative[period - 1]
+        out[period:] = cumulative[period:] - cumulative[:-period]
+        out[period - 1:] /= period
+    return out
+
+
+def ema(values, period: int) -> np.ndarray:
+    """Exponential moving average, alpha = 2 / (period + 1), seeded with the SMA of the first period"""
+    x = _as_float(values)
+    out = np.full(len(x), np.nan)
+    start = _first_valid(x)  # lets ema() run on indicator output with a NaN warm-up
+    seed_at = start + period - 1
+    if seed_at < len(x):
+        out[seed_at] = x[start:seed_at + 1].mean()
+        out[seed_at + 1:] = _linear_filter(x[seed_at + 1:], 2.0 / (period + 1), out[seed_at])
+    return out
+
+
+def _wilder(values: np.ndarray, period: int) -> np.ndarray:
+    # values[0] is the first period's element; output aligned with values
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        out[period - 1] = values[:period].mean()
+        out[period:] = _linear_filter(values[period:], 1.0 / period, out[period - 1])
+    return out
+
+
+def rsi(close, period: int = 14) -> np.ndarray:
+    """Relative Strength Index (Wilder); 50 when the window is flat"""
+    x = _as_float(close)
+    out = np.full(len(x), np.nan)
+    if len(x) > period:
+        delta = np.diff(x)
+        avg_gain = _wilder(np.maximum(delta, 0.0), period)
+        avg_loss = _wilder(np.maximum(-delta, 0.0), period)
+        total = avg_gain + avg_loss
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out[1:] = np.where(total > 0, 100.0 * avg_gain / total, 50.0)
+        out[:period] = np.nan
+    return out
+
+
+def true_range(high, low, close) -> np.ndarray:
+    """True range; the first candle has no previous close and uses high - low"""
+    high, low, close = _as_float(high), _as_float(low), _as_float(close)
+    tr = high - low
+    if len(tr) > 1:
+        previous = close[:-1]
+        tr[1:] = np.maximum(tr[1:], np.maximum(np.abs(high[1:] - previous), np.abs(low[1:] - previous)))
+    return tr
+
+
+def atr(high, low, close, period: int = 14) -> np.ndarray:
+    """Average True Range (Wilder), first value on candle `period`"""
+    tr = true_range(high, low, close)
+    out = np.full(len(tr), np.nan)
+    if len(tr) > period:
+        out[1:] = _wilder(tr[1:], period)
+    return out
+
+
+def bollinger_bands(close, period: int = 20, num_std: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bollinger Bands with population standard deviation
+
+    Returns:
+        tuple: (middle, upper, lower)
+    """
+    x = _as_float(close)
+    middle = sma(x, period)
+    std = np.full(len(x), np.nan)
+    if len(x) >= period:
+        # Exact per-window std; a running sum of squares cancels badly at BTC price levels
+        std[period - 1:] = sliding_window_view(x, period).std(axis=1)
+    return middle, middle + num_std * std, middle - num_std * std
+
+
+def vwap(high, low, close, volume, timestamps=None, session_ms: Optional[int] = 86_400_000) -> np.ndarray:
+    """
+    Volume-weighted average of the typical price (h + l + c) / 3
+
+    Args:
+        timestamps (array, optional): Open times in ms; with session_ms the
+            average restarts every session (UTC day by default)
+        session_ms (int, optional): Session length; None for one running VWAP
+    """
+    typical = (_as_float(high) + _as_float(low) + _as_float(close)) / 3.0
+    volume = _as_float(volume)
+    cum_pv = np.cumsum(typical * volume)
+    cum_volume = np.cumsum(volume)
+    if timestamps is not None and session_ms and len(volume):
+        session = np.asarray(timestamps) // session_ms
+        is_start = np.concatenate(([True], session[1:] != session[:-1]))
+        # Subtract the running totals as they stood before each session began
+        session_start = np.maximum.accumulate(np.where(is_start, np.arange(len(volume)), 0))
+        before = session_start - 1
+        cum_pv = cum_pv - np.where(before >= 0, cum_pv[before], 0.0)
+        cum_volume = cum_volume - np.where(before >= 0, cum_volume[before], 0.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(cum_volume > 0, cum_pv / cum_volume, np.nan)
+
+
+def macd(close, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Moving Average Convergence Divergence
+
+    Returns:
+        tuple: (macd line, signal line, histogram)
+    """
+    x = _as_float(close)
+    line = ema(x, fast) - ema(x, slow)
+    signal_line = ema(line, signal)
+    return line, signal_line, line - signal_line
+
+
+# --- incremental (one closed candle per update) ---
+
+class SMA:
+    def __init__(self, period: int):
+        """Rolling mean over a ring buffer; the sum is re-added exactly once per lap to stop drift"""
+        self.period = period
+        self._buffer = [0.0] * period
+        self._index = 0
+        self._count = 0
+        self._sum = 0.0
+        self.value = math.nan
+
+    def update(self, x: float) -> float:
+        if self._count == self.period:
+            self._sum -= self._buffer[self._index]
+        else:
+            self._count += 1
+        self._buffer[self._index] = x
+        self._sum += x
+        self._index = (self._index + 1) % self.period
+        if self._index == 0:
+            self._sum = math.fsum(self._buffer)
+        if self._count == self.period:
+            self.value = self._sum / self.period
+        return self.value
+
+
+class EMA:
+    def __init__(self, period: int, alpha: Optional[float] = None):
+        """Exponential moving average seeded with the SMA of the first period"""
+        self.period = period
+        self.alpha = alpha if alpha is not None else 2.0 / (period + 1)
+        self._seed = 0.0
+        self._count = 0
+        self.value = math.nan
+
+    def update(self, x: float) -> float:
+        if self._count < self.period:
+            self._count += 1
+            self._seed += x
+            if self._count == self.period:
+                self.value = self._seed / self.period
+        else:
+            self.value += self.alpha * (x - self.value)
+        return self.value
+
+
+def _wilder_average(period: int) -> EMA:
+    return EMA(period, alpha=1.0 / period)
+
+
+class RSI:
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._gain = _wilder_average(period)
+        self._loss = _wilder_average(period)
+        self._previous: Optional[float] = None
+        self.value = math.nan
+
+    def update(self, close: float) -> float:
+        if self._previous is not None:
+            delta = close - self._previous
+            gain = self._gain.update(max(delta, 0.0))
+            loss = self._loss.update(max(-delta, 0.0))
+            if not math.isnan(gain):
+                total = gain + loss
+                self.value = 100.0 * gain / total if total > 0 else 50.0
+        self._previous = close
+        return self.value
+
+
+class ATR:
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._average = _wilder_average(period)
+        self._previous: Optional[float] = None
+        self.value = math.nan
+
+    def update(self, high: float, low: float, close: float) -> float:
+        if self._previous is not None:
+            previous = self._previous
+            tr = max(high - low, abs(high - previous), abs(low - previous))
+            self.value = self._average.update(tr)
+        self._previous = close
+        return self.value
+
+
+class BollingerBands:
+    def __init__(self, period: int = 20, num_std: float = 2.0):
+        """
+        Rolling mean and population std over a ring buffer
+
+        Sums are kept relative to a shift close to the prices so the
+        variance does not cancel; shift and sums are rebuilt exactly once
+        per lap of the buffer.
+        """
+        self.period = period
+        self.num_std = num_std
+        self._buffer = [0.0] * period
+        self._index = 0
+        self._count = 0
+        self._shift: Optional[float] = None
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self.value: Tuple[float, float, float] = (math.nan, math.nan, math.nan)
+
+    def update(self, close: float) -> Tuple[float, float, float]:
+        """Returns (middle, upper, lower)"""
+        if self._shift is None:
+            self._shift = close
+        if self._count == self.period:
+            old = self._buffer[self._index] - self._shift
+            self._sum -= old
+            self._sum_sq -= old * old
+        else:
+            self._count += 1
+        self._buffer[self._index] = close
+        value = close - self._shift
+        self._sum += value
+        self._sum_sq += value * value
+        self._index = (self._index + 1) % self.period
+        if self._index == 0:
+            self._shift = math.fsum(self._buffer) / self.period
+            shifted = [b - self._shift for b in self._buffer]
+            self._sum = math.fsum(shifted)
+            self._sum_sq = math.fsum(s * s for s in shifted)
+        if self._count == self.period:
+            mean = self._sum / self.period
+            std = math.sqrt(max(self._sum_sq / self.period - mean * mean, 0.0))
+            middle = self._shift + mean
+            self.value = (middle, middle + self.num_std * std, middle - self.num_std * std)
+        return self.value
+
+
+class VWAP:
+    def __init__(self, session_ms: Optional[int] = 86_400_000):
+        self.session_ms = session_ms
+        self._session: Optional[int] = None
+        self._pv = 0.0
+        self._volume = 0.0
+        self.value = math.nan
+
+    def update(self, high: float, low: float, close: float, volume: float, timestamp: Optional[int] = None) -> float:
+        if self.session_ms and timestamp is not None:
+            session = timestamp // self.session_ms
+            if session != self._session:
+                self._session = session
+                self._pv = self._volume = 0.0
+        self._pv += (high + low + close) / 3.0 * volume
+        self._volume += volume
+        self.value = self._pv / self._volume if self._volume > 0 else math.nan
+        return self.value
+
+
+class MACD:
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self._fast = EMA(fast)
+        self._slow = EMA(slow)
+        self._signal = EMA(signal)
+        self.value: Tuple[float, float, float] = (math.nan, math.nan, math.nan)
+
+    def update(self, close: float) -> Tuple[float, float, float]:
+        """Returns (macd line, signal line, histogram)"""
+        line = self._fast.update(close) - self._slow.update(close)
+        if not math.isnan(line):
+            signal = self._signal.update(line)
+            self.value = (line, signal, line - signal)
+        return self.value
@@ -0,0 +1,259 @@
+import logging
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from crypto_exchange.binance.getOHLCV_binance import KLINE_DTYPE
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'KLN1'
+HEADER_SIZE = 64
+# count is the number of committed records; everything past it may be half written
+HEADER_DTYPE = np.dtype([('magic', 'S4'), ('record_size', '<u4'), ('count', '<u8')])
+MIN_GROWTH = 16_384  # records added to the file at a time
+# Byte range locked by writers on Windows; past any header field, and mapped views ignore locks
+_WINDOWS_LOCK_OFFSET = 0x7FFFFFFF
+
+
+def _lock_writer(fd: int) -> None:
+    """Serialize writers across processes (flock on POSIX, a byte-range lock on Windows)"""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        return
+    os.lseek(fd, _WINDOWS_LOCK_OFFSET, os.SEEK_SET)
+    while True:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            return
+        except OSError:  # LK_LOCK gives up after 10 seconds; keep waiting like flock
+            continue
+
+
+def _unlock_writer(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        return
+    os.lseek(fd, _WINDOWS_LOCK_OFFSET, os.SEEK_SET)
+    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+class KlineFile:
+    def __init__(self, path: str):
+        """
+        One symbol/interval as fixed-width KLINE_DTYPE records in a memory-mapped file
+
+        Layout: a 64-byte header holding the committed record count, then
+        records sorted by open time. The file is grown ahead of the data, so
+        existing mappings stay valid while it fills up.
+
+        Appends write the records first and publish them by bumping the
+        count afterwards, so readers in any process - which never look past
+        the count - cannot observe a partial record, and need no lock.
+        Writers take an exclusive file lock, so several processes may append.
+
+        On Windows a file cannot be resized while any process maps it: the
+        writer drops its own mappings before growing, but views held by
+        readers block the grow. Growth doubles the capacity, so it happens
+        rarely.
+
+        Args:
+            path (str): File location; created on the first append
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._header: Optional[np.memmap] = None
+        self._records: Optional[np.memmap] = None
+        self._capacity = 0
+        self._writable = False
+
+    def _map(self, writable: bool) -> bool:
+        if not os.path.exists(self.path):
+            return False
+        size = os.path.getsize(self.path)
+        if size < HEADER_SIZE:
+            return False  # being created by a writer right now
+        mode = 'r+' if writable else 'r'
+        header = np.memmap(self.path, dtype=HEADER_DTYPE, mode=mode, shape=())
+        if header['magic'] != MAGIC or header['record_size'] != KLINE_DTYPE.itemsize:
+            raise ValueError(f"{self.path} is not a KLINE_DTYPE store file")
+        self._capacity = (size - HEADER_SIZE) // KLINE_DTYPE.itemsize
+        self._header = header
+        self._records = np.memmap(self.path, dtype=KLINE_DTYPE, mode=mode, offset=HEADER_SIZE,
+                                  shape=(self._capacity,)) if self._capacity else None
+        self._writable = writable
+        return True
+
+    def __len__(self) -> int:
+        if self._header is None and not self._map(False):
+            return 0
+        return int(self._header['count'])
+
+    def records(self) -> np.ndarray:
+        """Every committed record, as a read-only zero-copy view"""
+        count = len(self)
+        if count > self._capacity:
+            self._map(self._writable)  # the writer grew the file since it was mapped
+        if not count:
+            return np.empty(0, dtype=KLINE_DTYPE)
+        view = self._records[:count].view(np.ndarray)
+        view.flags.writeable = False
+        return view
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        records = self.records()
+        return int(records['timestamp'][-1]) if len(records) else None
+
+    def read(self, start_ms: Optional[int] = None, end_ms: Optional[int] = None) -> np.ndarray:
+        """
+        Candles with start_ms <= open time <= end_ms, as a zero-copy view
+
+        The bounds are found by binary search over the timestamp column, so
+        only O(log n) pages of the file are touched besides the result.
+        """
+        records = self.records()
+        timestamps = records['timestamp']
+        lo = 0 if start_ms is None else int(np.searchsorted(timestamps, start_ms, side='left'))
+        hi = len(records) if end_ms is None else int(np.searchsorted(timestamps, end_ms, side='right'))
+        return records[lo:hi]
+
+    def _unmap(self) -> None:
+        self._header = None
+        self._records = None
+        self._capacity = 0
+        self._writable = False
+
+    def _create(self, fd: int) -> None:
+        header = np.zeros((), dtype=HEADER_DTYPE)
+        header['magic'] = MAGIC
+        header['record_size'] = KLINE_DTYPE.itemsize
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, header.tobytes().ljust(HEADER_SIZE, b'\0'))
+
+    def _grow(self, fd: int, needed: int) -> None:
+        capacity = max(needed, self._capacity * 2, MIN_GROWTH)
+        # Windows refuses to resize a file this process still maps
+        self._unmap()
+        os.ftruncate(fd, HEADER_SIZE + capacity * KLINE_DTYPE.itemsize)
+        self._map(True)
+
+    def append(self, klines: np.ndarray, sync: bool = False) -> int:
+        """
+        Append candles newer than the last stored one
+
+        Candles at or before the stored end are dropped, so overlapping
+        fetches can be appended as they are. Only closed candles belong
+        here; a forming candle would be frozen at its partial values.
+
+        Args:
+            klines (np.ndarray): KLINE_DTYPE candles (e.g. get_klines(as_arrays=True))
+            sync (bool): fsync before returning
+
+        Returns:
+            int: Number of candles written
+        """
+        klines = np.asarray(klines, dtype=KLINE_DTYPE)
+        if len(klines) > 1 and not np.all(np.diff(klines['timestamp']) > 0):
+            _, unique = np.unique(klines['timestamp'], return_index=True)
+            klines = klines[unique]
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+            try:
+                _lock_writer(fd)  # one writer across processes
+                try:
+                    if os.fstat(fd).st_size < HEADER_SIZE:
+                        self._create(fd)
+                    if not self._writable or os.fstat(fd).st_size != HEADER_SIZE + self._capacity * KLINE_DTYPE.itemsize:
+                        self._map(True)
+                    count = int(self._header['count'])
+                    if count:
+                        klines = klines[klines['timestamp'] > self._records['timestamp'][count - 1]]
+                    if not len(klines):
+                        return 0
+                    if count + len(klines) > self._capacity:
+                        self._grow(fd, count + len(klines))
+                    self._records[count:count + len(klines)] = klines
+                    if sync:
+                        self._records.flush()
+                    # Publish only after the records are in place
+                    self._header['count'] = count + len(klines)
+                    if sync:
+                        self._header.flush()
+                    return len(klines)
+                finally:
+                    _unlock_writer(fd)
+            finally:
+                os.close(fd)
+
+
+class KlineStore:
+    def __init__(self, root: str):
+        """
+        Directory of KlineFiles laid out as <root>/<SYMBOL>/<interval>.klines
+
+        Args:
+            root (str): Base directory
+        """
+        self.root = root
+        self._files: Dict[Tuple[str, str], KlineFile] = {}
+        self._lock = threading.Lock()
+
+    def file(self, symbol: str, interval: str) -> KlineFile:
+        key = (symbol.upper(), interval)
+        kline_file = self._files.get(key)
+        if kline_file is None:
+            with self._lock:
+                kline_file = self._files.get(key)
+                if kline_file is None:
+                    path = os.path.join(self.root, key[0], f"{interval}.klines")
+                    kline_file = self._files[key] = KlineFile(path)
+        return kline_file
+
+    def append(self, symbol: str, interval: str, klines: np.ndarray, sync: bool = False) -> int:
+        """Append candles newer than the stored end; returns the number written"""
+        return self.file(symbol, interval).append(klines, sync)
+
+    def read(self, symbol: str, interval: str,
+             start_ms: Optional[int] = None, end_ms: Optional[int] = None) -> np.ndarray:
+        """
+        Candles in [start_ms, end_ms] as a read-only view into the file
+
+        Args:
+            symbol (str): Trading pair (e.g. 'BTCUSDT')
+            interval (str): Kline interval (e.g. '1m')
+            start_ms (int, optional): First open time to include
+            end_ms (int, optional): Last open time to include
+
+        Returns:
+            np.ndarray: KLINE_DTYPE candles sorted by open time
+        """
+        return self.file(symbol, interval).read(start_ms, end_ms)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from crypto_exchange.binance.backfill_klines_binance import load_klines
+
+    logging.basicConfig(level=logging.INFO)
+    # python -m crypto_exchange.common.kline_store <npy cache root> <store root> BTCUSDT 1m
+    cache_root, store_root, symbol, interval = sys.argv[1:5]
+    store = KlineStore(store_root)
+    written = store.append(symbol, interval, load_klines(cache_root, symbol, interval))
+    print(f"Imported {written} candles")
+    end = store.file(symbol, interval).last_timestamp
+    start = time.perf_counter()
+    last_day = store.read(symbol, interval, end - 86_400_000, end)
+    print(f"{len(last_day)} candles of the last day in {(time.perf_counter() - start) * 1e6:.0f} us")
@@ -0,0 +1,247 @@
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import AsyncIterator, Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from crypto_exchange.binance.getOHLCV_binance import INTERVAL_MS, KLINE_DTYPE, parse_klines_array
+from crypto_exchange.common.http_transport import get_session
+
+logger = logging.getLogger(__name__)
+
+
+class OHLCVResult(NamedTuple):
+    symbol: str
+    interval: str
+    klines: Optional[np.ndarray]  # KLINE_DTYPE, oldest first; None when the request failed
+    error: Optional[Exception] = None
+
+
+class KlineEndpoint(NamedTuple):
+    """How one venue serves candles; intervals are given in Binance notation ('1m', '4h', '1d')"""
+    url: str  # may contain {symbol}
+    params: Callable[[str, str, int], Dict[str, str]]
+    parse: Callable[[bytes], np.ndarray]
+    max_limit: int
+
+
+def _rows_to_klines(rows, newest_first: bool = False) -> np.ndarray:
+    # Rows are [open time ms, open, high, low, close, volume, ...] as numbers or strings
+    records = np.empty(len(rows), dtype=KLINE_DTYPE)
+    if len(rows):
+        values = np.asarray([row[:6] for row in rows], dtype=np.float64)
+        for column, name in enumerate(KLINE_DTYPE.names):
+            records[name] = values[:, column]
+    return records[::-1].copy() if newest_first else records
+
+
+def _window(interval: str, limit: int) -> Tuple[int, int]:
+    # For venues that want an explicit time range instead of a count
+    end = int(time.time() * 1000)
+    return end - INTERVAL_MS[interval] * limit, end
+
+
+def _parse_bybit(payload: bytes) -> np.ndarray:
+    body = json.loads(payload)
+    if body.get('retCode') != 0:
+        raise ValueError(f"Bybit klines request failed: {body.get('retMsg')}")
+    return _rows_to_klines(body['result']['list'], newest_first=True)
+
+
+def _parse_okx(payload: bytes) -> np.ndarray:
+    body = json.loads(payload)
+    if body.get('code') != '0':
+        raise ValueError(f"OKX candles request failed: {body.get('msg')}")
+    return _rows_to_klines(body['data'], newest_first=True)
+
+
+def _parse_bitget(payload: bytes) -> np.ndarray:
+    body = json.loads(payload)
+    if isinstance(body, dict):
+        if body.get('code') != '00000':
+            raise ValueError(f"Bitget candles request failed: {body.get('msg')}")
+        body = body['data']
+    return _rows_to_klines(body)
+
+
+def _parse_mexc_futures(payload: bytes) -> np.ndarray:
+    body = json.loads(payload)
+    if not body.get('success'):
+        raise ValueError(f"MEXC contract klines request failed: {body.get('message', body.get('code'))}")
+    data = body['data']
+    records = np.empty(len(data['time']), dtype=KLINE_DTYPE)
+    records['timestamp'] = np.asarray(data['time'], dtype=np.int64) * 1000
+    for name, key in (('open', 'open'), ('high', 'high'), ('low', 'low'), ('close', 'close'), ('volume', 'vol')):
+        records[name] = data[key]
+    return records
+
+
+_BYBIT_INTERVALS = {'1m': '1', '3m': '3', '5m': '5', '15m': '15', '30m': '30', '1h': '60', '2h': '120',
+                    '4h': '240', '6h': '360', '12h': '720', '1d': 'D', '1w': 'W'}
+# The *utc bars start at 00:00 UTC like every other venue here
+_OKX_BARS = {'1m': '1m', '3m': '3m', '5m': '5m', '15m': '15m', '30m': '30m', '1h': '1H', '2h': '2H',
+             '4h': '4H', '6h': '6Hutc', '12h': '12Hutc', '1d': '1Dutc', '1w': '1Wutc'}
+_BITGET_GRANULARITY = {'1m': '1m', '3m': '3m', '5m': '5m', '15m': '15m', '30m': '30m', '1h': '1H', '2h': '2H',
+                       '4h': '4H', '6h': '6H', '12h': '12H', '1d': '1D', '1w': '1W'}
+_MEXC_SPOT_INTERVALS = {'1m': '1m', '5m': '5m', '15m': '15m', '30m': '30m', '1h': '60m', '4h': '4h',
+                        '1d': '1d', '1w': '1W'}
+_MEXC_FUTURES_INTERVALS = {'1m': 'Min1', '5m': 'Min5', '15m': 'Min15', '30m': 'Min30', '1h': 'Min60',
+                           '4h': 'Hour4', '8h': 'Hour8', '1d': 'Day1', '1w': 'Week1'}
+
+
+def _bitget_params(symbol: str, interval: str, limit: int) -> Dict[str, str]:
+    start, end = _window(interval, limit)
+    return {'symbol': symbol, 'granularity': _BITGET_GRANULARITY[interval],
+            'startTime': str(start), 'endTime': str(end), 'limit': str(limit)}
+
+
+def _mexc_futures_params(symbol: str, interval: str, limit: int) -> Dict[str, str]:
+    start, end = _window(interval, limit)
+    return {'interval': _MEXC_FUTURES_INTERVALS[interval], 'start': str(start // 1000), 'end': str(end // 1000)}
+
+
+# Symbols are in each venue's own notation: BTCUSDT, BTC-USDT-SWAP, BTCUSDT_UMCBL, BTC_USDT
+KLINE_ENDPOINTS: Dict[str, KlineEndpoint] = {
+    'binance_spot': KlineEndpoint(
+        "https://api.binance.com/api/v3/klines",
+        lambda symbol, interval, limit: {'symbol': symbol, 'interval': interval, 'limit': str(limit)},
+        parse_klines_array, 1000),
+    'binance_futures': KlineEndpoint(
+        "https://fapi.binance.com/fapi/v1/klines",
+        lambda symbol, interval, limit: {'symbol': symbol, 'interval': interval, 'limit': str(limit)},
+        parse_klines_array, 1500),
+    'bybit_linear': KlineEndpoint(
+        "https://api.bybit.com/v5/market/kline",
+        lambda symbol, interval, limit: {'category': 'linear', 'symbol': symbol,
+                                         'interval': _BYBIT_INTERVALS[interval], 'limit': str(limit)},
+        _parse_bybit, 1000),
+    'bybit_spot': KlineEndpoint(
+        "https://api.bybit.com/v5/market/kline",
+        lambda symbol, interval, limit: {'category': 'spot', 'symbol': symbol,
+                                         'interval': _BYBIT_INTERVALS[interval], 'limit': str(limit)},
+        _parse_bybit, 1000),
+    'okx': KlineEndpoint(
+        "https://www.okx.com/api/v5/market/candles",
+        lambda symbol, interval, limit: {'instId': symbol, 'bar': _OKX_BARS[interval], 'limit': str(limit)},
+        _parse_okx, 300),
+    'bitget_mix': KlineEndpoint(
+        "https://api.bitget.com/api/mix/v1/market/candles", _bitget_params, _parse_bitget, 1000),
+    'mexc_spot': KlineEndpoint(
+        "https://api.mexc.com/api/v3/klines",
+        lambda symbol, interval, limit: {'symbol': symbol, 'interval': _MEXC_SPOT_INTERVALS[interval],
+                                         'limit': str(limit)},
+        lambda payload: parse_klines_array(payload, row_width=8), 1000),
+    'mexc_futures': KlineEndpoint(
+        "https://contract.mexc.com/api/v1/contract/kline/{symbol}", _mexc_futures_params, _parse_mexc_futures, 2000),
+}
+
+
+def _request(venue: str, symbol: str, interval: str, limit: int) -> Tuple[str, Dict[str, str], KlineEndpoint]:
+    endpoint = KLINE_ENDPOINTS[venue]
+    if limit > endpoint.max_limit:
+        raise ValueError(f"{venue} returns at most {endpoint.max_limit} candles per request")
+    return endpoint.url.format(symbol=symbol), endpoint.params(symbol, interval, limit), endpoint
+
+
+def fetch_ohlcv(venue: str, symbol: str, interval: str, limit: int = 500) -> np.ndarray:
+    """
+    Latest candles of one symbol as a KLINE_DTYPE array, oldest first
+
+    Args:
+        venue (str): Key of KLINE_ENDPOINTS (e.g. 'binance_spot', 'okx')
+        symbol (str): Symbol in the venue's notation
+        interval (str): Binance-style interval ('1m', '1h', '1d', ...)
+        limit (int): Number of candles
+
+    Returns:
+        np.ndarray: KLINE_DTYPE records
+    """
+    url, params, endpoint = _request(venue, symbol, interval, limit)
+    return endpoint.parse(get_session(url).get(url, params=params).content)
+
+
+def iter_ohlcv(pairs: Iterable[Tuple[str, str]], venue: str = 'binance_spot', limit: int = 500,
+               max_workers: int = 16) -> Iterator[OHLCVResult]:
+    """
+    Fetch many (symbol, interval) pairs concurrently and yield them as they complete
+
+    Requests share the venue's pooled session, so they reuse connections and
+    queue on its rate limiter instead of tripping the exchange's. A failed
+    pair is yielded with its exception rather than stopping the others.
+
+    Args:
+        pairs (iterable): (symbol, interval) tuples
+        venue (str): Key of KLINE_ENDPOINTS
+        limit (int): Candles per pair
+        max_workers (int): Requests in flight
+
+    Yields:
+        OHLCVResult: In completion order
+    """
+    def fetch(symbol, interval):
+        try:
+            return OHLCVResult(symbol, interval, fetch_ohlcv(venue, symbol, interval, limit))
+        except Exception as e:
+            return OHLCVResult(symbol, interval, None, e)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{venue}-ohlcv")
+    try:
+        futures = [executor.submit(fetch, symbol, interval) for symbol, interval in pairs]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # A consumer that stops early should not keep spending request weight
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_ohlcv(pairs: Iterable[Tuple[str, str]], venue: str = 'binance_spot', limit: int = 500,
+                      concurrency: int = 32) -> AsyncIterator[OHLCVResult]:
+    """
+    asyncio version of iter_ohlcv() on the shared aiohttp session of the venue
+
+    Args:
+        pairs (iterable): (symbol, interval) tuples
+        venue (str): Key of KLINE_ENDPOINTS
+        limit (int): Candles per pair
+        concurrency (int): Requests in flight
+
+    Yields:
+        OHLCVResult: In completion order
+    """
+    # Imported here so the blocking API does not require aiohttp
+    from crypto_exchange.common.async_http_transport import get_async_session
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(symbol, interval):
+        try:
+            url, params, endpoint = _request(venue, symbol, interval, limit)
+            async with semaphore:
+                async with get_async_session(url).get(url, params=params) as response:
+                    payload = await response.read()
+            return OHLCVResult(symbol, interval, endpoint.parse(payload))
+        except Exception as e:
+            return OHLCVResult(symbol, interval, None, e)
+
+    tasks = [asyncio.ensure_future(fetch(symbol, interval)) for symbol, interval in pairs]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    watchlist = [(symbol, '1m') for symbol in ("BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT")]
+    start = time.perf_counter()
+    for result in iter_ohlcv(watchlist, venue='binance_spot', limit=100):
+        if result.error is not None:
+            print(f"{result.symbol} {result.interval}: {result.error}")
+        else:
+            print(f"{result.symbol} {result.interval}: {len(result.klines)} candles, last close {result.klines['close'][-1]}")
+    print(f"{len(watchlist)} pairs in {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,129 @@
+from bisect import bisect_left
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+Level = Tuple[float, float]
+
+
+class BookSide:
+    __slots__ = ('_keys', '_sizes', '_sign')
+
+    def __init__(self, descending: bool):
+        """
+        One side of an L2 book kept as two parallel sorted lists
+
+        Keys are stored ascending (bids use -price), so the best level is
+        always index 0 and bisect gives O(log n) lookups.
+
+        Args:
+            descending (bool): True for bids, False for asks
+        """
+        self._keys: List[float] = []
+        self._sizes: List[float] = []
+        self._sign = -1.0 if descending else 1.0
+
+    def __len__(self):
+        return len(self._keys)
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._sizes.clear()
+
+    def set(self, price: float, size: float) -> None:
+        """Set the size at a price level; size 0 removes the level"""
+        key = price * self._sign
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            if size > 0:
+                self._sizes[index] = size
+            else:
+                del self._keys[index]
+                del self._sizes[index]
+        elif size > 0:
+            self._keys.insert(index, key)
+            self._sizes.insert(index, size)
+
+    def best(self) -> Optional[Level]:
+        if not self._keys:
+            return None
+        return self._keys[0] * self._sign, self._sizes[0]
+
+    def levels(self, n: Optional[int] = None) -> List[Level]:
+        """Top n levels as (price, size), best first"""
+        keys = self._keys if n is None else self._keys[:n]
+        return [(key * self._sign, size) for key, size in zip(keys, self._sizes)]
+
+    def size_at(self, price: float) -> float:
+        key = price * self._sign
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            return self._sizes[index]
+        return 0.0
+
+    def volume(self, n: int) -> float:
+        """Total size in the top n levels"""
+        return sum(self._sizes[:n])
+
+
+class OrderBook:
+    def __init__(self, symbol: str):
+        """
+        In-memory L2 order book for one symbol
+
+        Args:
+            symbol (str): Trading pair (e.g. 'BTCUSDT')
+        """
+        self.symbol = symbol
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        self.update_id = 0
+        self.timestamp = 0
+
+    def clear(self) -> None:
+        self.bids.clear()
+        self.asks.clear()
+        self.update_id = 0
+
+    def apply(self, bids: Iterable[Sequence], asks: Iterable[Sequence]) -> None:
+        """
+        Apply absolute price levels as sent by the exchanges
+
+        Args:
+            bids (iterable): [price, size, ...] entries, strings or numbers
+            asks (iterable): [price, size, ...] entries, strings or numbers
+        """
+        for level in bids:
+            self.bids.set(float(level[0]), float(level[1]))
+        for level in asks:
+            self.asks.set(float(level[0]), float(level[1]))
+
+    def load_snapshot(self, bids: Iterable[Sequence], asks: Iterable[Sequence], update_id: int = 0) -> None:
+        """Replace the whole book with a snapshot"""
+        self.clear()
+        self.apply(bids, asks)
+        self.update_id = update_id
+
+    def best_bid(self) -> Optional[Level]:
+        return self.bids.best()
+
+    def best_ask(self) -> Optional[Level]:
+        return self.asks.best()
+
+    def mid_price(self) -> Optional[float]:
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
+
+    def spread(self) -> Optional[float]:
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return ask[0] - bid[0]
+
+    def depth(self, n: int = 10) -> Tuple[List[Level], List[Level]]:
+        """Top n bid and ask levels, best first"""
+        return self.bids.levels(n), self.asks.levels(n)
+
+    def is_crossed(self) -> bool:
+        bid, ask = self.bids.best(), self.asks.best()
+        return bid is not None and ask is not None and bid[0] >= ask[0]
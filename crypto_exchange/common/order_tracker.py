@@ -0,0 +1,613 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from crypto_exchange.common.client_registry import get_client
+from crypto_exchange.common.signing import HmacSigner
+
+logger = logging.getLogger(__name__)
+
+# Normalized order states
+NEW = 'NEW'
+PARTIALLY_FILLED = 'PARTIALLY_FILLED'
+FILLED = 'FILLED'
+CANCELED = 'CANCELED'
+REJECTED = 'REJECTED'
+EXPIRED = 'EXPIRED'
+
+TERMINAL_STATES = frozenset((FILLED, CANCELED, REJECTED, EXPIRED))
+
+# Position of each state in the order life cycle; updates never move an order backwards
+_STATE_RANK = {NEW: 0, PARTIALLY_FILLED: 1, FILLED: 2, CANCELED: 2, REJECTED: 2, EXPIRED: 2}
+
+
+def _float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class OrderUpdate(NamedTuple):
+    """Normalized order event from a private stream or a REST lookup"""
+    order_id: str
+    status: str
+    filled_qty: float = 0.0
+    avg_price: float = 0.0
+    symbol: str = ''
+    client_order_id: str = ''
+    timestamp: int = 0
+    raw: Optional[dict] = None
+
+
+class TrackedOrder:
+    def __init__(self, order_id: str, symbol: str = ''):
+        """
+        Last known state of one order
+
+        Args:
+            order_id (str): Venue order id
+            symbol (str): Symbol in the venue's REST format, used for reconciliation
+        """
+        self.order_id = order_id
+        self.symbol = symbol
+        self.client_order_id = ''
+        self.status = NEW
+        self.filled_qty = 0.0
+        self.avg_price = 0.0
+        self.updated = 0
+        self.raw: Optional[dict] = None
+        self._done: Optional[asyncio.Event] = None
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in TERMINAL_STATES
+
+    def apply(self, update: OrderUpdate) -> bool:
+        """
+        Move to the state carried by update if it is newer
+
+        Terminal states are final, and stale or reordered events (a REST
+        answer racing the stream, a delayed partial fill) are ignored.
+
+        Returns:
+            bool: True when the order changed
+        """
+        if self.is_terminal:
+            return False
+        rank, current = _STATE_RANK[update.status], _STATE_RANK[self.status]
+        if rank < current or (rank == current and update.filled_qty <= self.filled_qty and self.raw is not None):
+            return False
+        self.status = update.status
+        self.filled_qty = max(self.filled_qty, update.filled_qty)
+        if update.avg_price:
+            self.avg_price = update.avg_price
+        self.updated = update.timestamp or self.updated
+        self.symbol = self.symbol or update.symbol
+        self.client_order_id = self.client_order_id or update.client_order_id
+        self.raw = update.raw
+        if self.is_terminal and self._done is not None:
+            self._done.set()
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'order_id': self.order_id,
+            'client_order_id': self.client_order_id,
+            'symbol': self.symbol,
+            'status': self.status,
+            'filled_qty': self.filled_qty,
+            'avg_price': self.avg_price,
+            'updated': self.updated,
+        }
+
+
+class OrderTracker:
+    def __init__(self, on_change: Optional[Callable[[TrackedOrder], None]] = None):
+        """
+        In-memory order state fed by a private WebSocket stream
+
+        Must be used from a single event loop: updates are applied by
+        run_user_stream() and waiters are woken without any polling.
+
+        Args:
+            on_change (callable, optional): Called with the order after every change
+        """
+        self.orders: Dict[str, TrackedOrder] = {}
+        self.on_change = on_change
+
+    def track(self, order_id, symbol: str = '') -> TrackedOrder:
+        """Start tracking an order returned by place_order (idempotent)"""
+        order_id = str(order_id)
+        order = self.orders.get(order_id)
+        if order is None:
+            order = self.orders[order_id] = TrackedOrder(order_id, symbol)
+        elif symbol and not order.symbol:
+            order.symbol = symbol
+        return order
+
+    def get(self, order_id) -> Optional[TrackedOrder]:
+        return self.orders.get(str(order_id))
+
+    def forget(self, order_id) -> None:
+        self.orders.pop(str(order_id), None)
+
+    def apply(self, update: OrderUpdate) -> bool:
+        """
+        Apply one normalized update; orders seen for the first time are tracked too
+
+        Returns:
+            bool: True when the order changed
+        """
+        order = self.track(update.order_id)
+        changed = order.apply(update)
+        if changed and self.on_change is not None:
+            self.on_change(order)
+        return changed
+
+    def open_orders(self) -> List[TrackedOrder]:
+        return [order for order in self.orders.values() if not order.is_terminal]
+
+    async def wait(self, order_id, timeout: Optional[float] = None) -> TrackedOrder:
+        """
+        Wait until the order is filled, canceled, rejected or expired
+
+        Args:
+            order_id: Venue order id
+            timeout (float, optional): Seconds before asyncio.TimeoutError
+
+        Returns:
+            TrackedOrder: The order in its terminal state
+        """
+        order = self.track(order_id)
+        if not order.is_terminal:
+            if order._done is None:
+                order._done = asyncio.Event()
+            await asyncio.wait_for(order._done.wait(), timeout)
+        return order
+
+
+class UserStream:
+    """
+    One venue's private order stream
+
+    Subclasses know the URL, the login/subscribe handshake, how to parse
+    order frames and how to look an order up over REST for reconciliation.
+    """
+
+    venue = ''
+    ws_url = ''
+    ping_message: Optional[str] = None
+    ping_interval = 20.0
+
+    def stream_url(self) -> str:
+        return self.ws_url
+
+    async def handshake(self, ws) -> None:
+        """Log in and subscribe on a freshly opened connection"""
+
+    def parse(self, message: dict) -> List[OrderUpdate]:
+        raise NotImplementedError
+
+    def fetch_order(self, order: TrackedOrder) -> Optional[OrderUpdate]:
+        """Blocking REST lookup of one order, run in an executor"""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release anything the stream created (e.g. listen keys)"""
+
+
+async def _expect(ws, event_key: str, event_value: str) -> dict:
+    """Read frames until the venue acknowledges the login"""
+    while True:
+        message = _decode(await ws.recv())
+        if message is None:
+            continue
+        if message.get('event') == 'error' or message.get('channel') == 'rs.error' or message.get('success') is False:
+            raise ConnectionError(f"Login rejected: {message}")
+        if message.get(event_key) == event_value:
+            return message
+
+
+class BinanceUserStream(UserStream):
+    venue = 'binance'
+
+    STATUSES = {
+        'NEW': NEW, 'PARTIALLY_FILLED': PARTIALLY_FILLED, 'FILLED': FILLED,
+        'CANCELED': CANCELED, 'PENDING_CANCEL': NEW, 'REJECTED': REJECTED,
+        'EXPIRED': EXPIRED, 'EXPIRED_IN_MATCH': EXPIRED,
+    }
+
+    def __init__(self, api_key: str, api_secret: str, keepalive_interval: float = 1800.0):
+        """
+        Spot user data stream (executionReport events)
+
+        Args:
+            api_key (str): Binance API key
+            api_secret (str): Binance API secret
+            keepalive_interval (float): Seconds between listen key keepalives
+        """
+        self.client = get_client('binance', api_key, api_secret)
+        self.keepalive_interval = keepalive_interval
+        self.listen_key: Optional[str] = None
+        self._keepalive: Optional[asyncio.Task] = None
+
+    def stream_url(self) -> str:
+        self.listen_key = self.client.stream_get_listen_key()
+        return f"wss://stream.binance.com:9443/ws/{self.listen_key}"
+
+    async def handshake(self, ws) -> None:
+        if self._keepalive is None or self._keepalive.done():
+            self._keepalive = asyncio.ensure_future(self._keep_listen_key_alive())
+
+    async def _keep_listen_key_alive(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            try:
+                await loop.run_in_executor(None, self.client.stream_keepalive, self.listen_key)
+            except Exception as e:
+                logger.warning(f"Binance listen key keepalive failed: {e}")
+
+    def _update(self, status, order_id, filled, quote, symbol, client_id, timestamp, raw) -> OrderUpdate:
+        filled, quote = _float(filled), _float(quote)
+        return OrderUpdate(str(order_id), self.STATUSES.get(status, NEW), filled,
+                           quote / filled if filled else 0.0, symbol, client_id, int(timestamp or 0), raw)
+
+    def parse(self, message: dict) -> List[OrderUpdate]:
+        if message.get('e') != 'executionReport':
+            return []
+        return [self._update(message['X'], message['i'], message['z'], message['Z'],
+                             message['s'], message['c'], message['E'], message)]
+
+    def fetch_order(self, order: TrackedOrder) -> Optional[OrderUpdate]:
+        data = self.client.get_order(symbol=order.symbol, orderId=order.order_id)
+        return self._update(data['status'], data['orderId'], data['executedQty'],
+                            data['cummulativeQuoteQty'], data['symbol'], data['clientOrderId'],
+                            data.get('updateTime'), data)
+
+    def close(self) -> None:
+        if self._keepalive is not None:
+            self._keepalive.cancel()
+        if self.listen_key:
+            try:
+                self.client.stream_close(self.listen_key)
+            except Exception as e:
+                logger.warning(f"Error closing Binance listen key: {e}")
+
+
+class BybitUserStream(UserStream):
+    venue = 'bybit'
+    ping_message = json.dumps({"op": "ping"})
+
+    STATUSES = {
+        'Created': NEW, 'New': NEW, 'Untriggered': NEW, 'Triggered': NEW,
+        'PartiallyFilled': PARTIALLY_FILLED, 'Filled': FILLED, 'Cancelled': CANCELED,
+        'PartiallyFilledCanceled': CANCELED, 'Deactivated': CANCELED, 'Rejected': REJECTED,
+    }
+
+    def __init__(self, api_key: str, api_secret: str, testnet: bool = False, category: str = 'linear'):
+        """
+        v5 private 'order' topic
+
+        Args:
+            api_key (str): Bybit API key
+            api_secret (str): Bybit API secret
+            testnet (bool): Whether to use testnet
+            category (str): Product category used for REST reconciliation
+        """
+        self.api_key = api_key
+        self.signer = HmacSigner(api_secret)
+        self.testnet = testnet
+        self.category = category
+        self.client = get_client('bybit', api_key, api_secret, testnet=testnet)
+        self.ws_url = "wss://stream-testnet.bybit.com/v5/private" if testnet else "wss://stream.bybit.com/v5/private"
+
+    async def handshake(self, ws) -> None:
+        expires = int((time.time() + 10) * 1000)
+        signature = self.signer.sign_hex(f"GET/realtime{expires}")
+        await ws.send(json.dumps({"op": "auth", "args": [self.api_key, expires, signature]}))
+        await _expect(ws, 'op', 'auth')
+        await ws.send(json.dumps({"op": "subscribe", "args": ["order"]}))
+
+    def _update(self, data: dict) -> OrderUpdate:
+        return OrderUpdate(data['orderId'], self.STATUSES.get(data['orderStatus'], NEW),
+                           _float(data.get('cumExecQty')), _float(data.get('avgPrice')), data.get('symbol', ''),
+                           data.get('orderLinkId', ''), int(data.get('updatedTime') or 0), data)
+
+    def parse(self, message: dict) -> List[OrderUpdate]:
+        if message.get('topic') != 'order':
+            return []
+        return [self._update(data) for data in message.get('data', [])]
+
+    def fetch_order(self, order: TrackedOrder) -> Optional[OrderUpdate]:
+        # The realtime endpoint also returns recently closed orders
+        response = self.client.get_open_orders(category=self.category, symbol=order.symbol, orderId=order.order_id)
+        orders = response.get('result', {}).get('list', [])
+        return self._update(orders[0]) if orders else None
+
+
+class OkxUserStream(UserStream):
+    venue = 'okx'
+    ws_url = "wss://ws.okx.com:8443/ws/v5/private"
+    ping_message = "ping"
+
+    STATUSES = {
+        'live': NEW, 'partially_filled': PARTIALLY_FILLED, 'filled': FILLED,
+        'canceled': CANCELED, 'mmp_canceled': CANCELED,
+    }
+
+    def __init__(self, api_key: str, api_secret: str, passphrase: str, inst_type: str = 'ANY'):
+        """
+        v5 private 'orders' channel; track orders with their instId (e.g. 'BTC-USDT')
+
+        Args:
+            api_key (str): OKX API key
+            api_secret (str): OKX API secret
+            passphrase (str): OKX API passphrase
+            inst_type (str): SPOT, SWAP, FUTURES, OPTION or ANY
+        """
+        self.api_key = api_key
+        self.passphrase = passphrase
+        self.signer = HmacSigner(api_secret)
+        self.inst_type = inst_type
+        self.exchange = get_client('okx', api_key, api_secret, passphrase)
+
+    async def handshake(self, ws) -> None:
+        timestamp = str(int(time.time()))
+        sign = self.signer.sign_base64(timestamp + 'GET/users/self/verify')
+        await ws.send(json.dumps({"op": "login", "args": [{
+            "apiKey": self.api_key, "passphrase": self.passphrase, "timestamp": timestamp, "sign": sign
+        }]}))
+        await _expect(ws, 'event', 'login')
+        await ws.send(json.dumps({"op": "subscribe", "args": [{"channel": "orders", "instType": self.inst_type}]}))
+
+    def _update(self, data: dict) -> OrderUpdate:
+        return OrderUpdate(data['ordId'], self.STATUSES.get(data['state'], NEW), _float(data.get('accFillSz')),
+                           _float(data.get('avgPx')), data.get('instId', ''), data.get('clOrdId', ''),
+                           int(data.get('uTime') or 0), data)
+
+    def parse(self, message: dict) -> List[OrderUpdate]:
+        if message.get('arg', {}).get('channel') != 'orders' or 'data' not in message:
+            return []
+        return [self._update(data) for data in message['data']]
+
+    def fetch_order(self, order: TrackedOrder) -> Optional[OrderUpdate]:
+        # Raw endpoint so the fields match the stream exactly
+        response = self.exchange.privateGetTradeOrder({'instId': order.symbol, 'ordId': order.order_id})
+        orders = response.get('data', [])
+        return self._update(orders[0]) if orders else None
+
+
+class BitgetUserStream(UserStream):
+    venue = 'bitget'
+    ws_url = "wss://ws.bitget.com/v2/ws/private"
+    ping_message = "ping"
+
+    STATUSES = {
+        'init': NEW, 'new': NEW, 'live': NEW, 'partial_fill': PARTIALLY_FILLED,
+        'partially_filled': PARTIALLY_FILLED, 'full_fill': FILLED, 'filled': FILLED,
+        'cancelled': CANCELED, 'canceled': CANCELED,
+    }
+
+    def __init__(self, api_key: str, api_secret: str, passphrase: str, inst_type: str = 'SPOT'):
+        """
+        v2 private 'orders' channel
+
+        Args:
+            api_key (str): Bitget API key
+            api_secret (str): Bitget API secret
+            passphrase (str): Bitget API passphrase
+            inst_type (str): 'SPOT' or 'USDT-FUTURES'
+        """
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.passphrase = passphrase
+        self.signer = HmacSigner(api_secret)
+        self.inst_type = inst_type
+        self._rest = None
+
+    async def handshake(self, ws) -> None:
+        timestamp = str(int(time.time()))
+        sign = self.signer.sign_base64(timestamp + 'GET/user/verify')
+        await ws.send(json.dumps({"op": "login", "args": [{
+            "apiKey": self.api_key, "passphrase": self.passphrase, "timestamp": timestamp, "sign": sign
+        }]}))
+        await _expect(ws, 'event', 'login')
+        await ws.send(json.dumps({"op": "subscribe", "args": [
+            {"instType": self.inst_type, "channel": "orders", "instId": "default"}
+        ]}))
+
+    def _update(self, data: dict) -> OrderUpdate:
+        status = data.get('status') or data.get('state')
+        filled = data.get('accBaseVolume') or data.get('filledQty') or data.get('fillQuantity')
+        avg_price = data.get('priceAvg') or data.get('fillPrice')
+        return OrderUpdate(str(data['orderId']), self.STATUSES.get(status, NEW), _float(filled), _float(avg_price),
+                           data.get('instId') or data.get('symbol', ''),
+                           data.get('clientOid') or data.get('clientOrderId', ''),
+                           int(data.get('uTime') or data.get('cTime') or 0), data)
+
+    def parse(self, message: dict) -> List[OrderUpdate]:
+        if message.get('arg', {}).get('channel') != 'orders' or 'data' not in message:
+            return []
+        return [self._update(data) for data in message['data']]
+
+    def fetch_order(self, order: TrackedOrder) -> Optional[OrderUpdate]:
+        if self._rest is None:
+            if self.inst_type == 'SPOT':
+                from crypto_exchange.bitget.dat_lenh_spot_bitget import BitgetSpotAPI
+                self._rest = BitgetSpotAPI(self.api_key, self.api_secret, self.passphrase)
+            else:
+                from crypto_exchange.bitget.dat_lenh_futures_bitget import BitgetFuturesAPI
+                self._rest = BitgetFuturesAPI(self.api_key, self.api_secret, self.passphrase)
+        if self.inst_type == 'SPOT':
+            data = self._rest.get_order_status(order.order_id, order.symbol).get('data') or []
+            data = data[0] if data else None
+        else:
+            data = self._rest.get_order_status(order.symbol, order.order_id).get('data')
+        return self._update(data) if data else None
+
+
+class MexcFuturesUserStream(UserStream):
+    venue = 'mexc'
+    ws_url = "wss://contract.mexc.com/edge"
+    ping_message = json.dumps({"method": "ping"})
+
+    # 1 uninformed, 2 uncompleted, 3 completed, 4 cancelled, 5 invalid
+    STATES = {1: NEW, 2: NEW, 3: FILLED, 4: CANCELED, 5: REJECTED}
+
+    def __init__(self, api_key: str, api_secret: str):
+        """
+        Contract private push (push.personal.order)
+
+        Args:
+            api_key (str): MEXC API key
+            api_secret (str): MEXC API secret
+        """
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.signer = HmacSigner(api_secret)
+        self._rest = None
+
+    async def handshake(self, ws) -> None:
+        req_time = str(int(time.time() * 1000))
+        await ws.send(json.dumps({"method": "login", "param": {
+            "apiKey": self.api_key, "reqTime": req_time, "signature": self.signer.sign_hex(self.api_key + req_time)
+        }}))
+        await _expect(ws, 'channel', 'rs.login')
+
+    def _update(self, data: dict) -> OrderUpdate:
+        status = self.STATES.get(int(data.get('state', 1)), NEW)
+        filled = _float(data.get('dealVol'))
+        if status == NEW and filled:
+            status = PARTIALLY_FILLED
+        return OrderUpdate(str(data['orderId']), status, filled, _float(data.get('dealAvgPrice')),
+                           data.get('symbol', ''), data.get('externalOid', ''),
+                           int(data.get('updateTime') or 0), data)
+
+    def parse(self, message: dict) -> List[OrderUpdate]:
+        if message.get('channel') != 'push.personal.order':
+            return []
+        return [self._update(message['data'])]
+
+    def fetch_order(self, order: TrackedOrder) -> Optional[OrderUpdate]:
+        if self._rest is None:
+            from crypto_exchange.mexc.dat_lenh_futures_mexc import MEXCFuturesAPI
+            self._rest = MEXCFuturesAPI(self.api_key, self.api_secret)
+        data = (self._rest.get_order_status(order.order_id, order.symbol) or {}).get('data')
+        return self._update(data) if data else None
+
+
+USER_STREAMS: Dict[str, type] = {
+    'binance': BinanceUserStream,
+    'bybit': BybitUserStream,
+    'okx': OkxUserStream,
+    'bitget': BitgetUserStream,
+    'mexc': MexcFuturesUserStream,
+}
+
+
+def _decode(raw) -> Optional[dict]:
+    try:
+        message = json.loads(raw)
+    except ValueError:
+        return None  # plain-text heartbeats such as "pong"
+    return message if isinstance(message, dict) else None
+
+
+async def reconcile(stream: UserStream, tracker: OrderTracker) -> int:
+    """
+    Refresh every open tracked order over REST
+
+    Fills that happened while the stream was down are not replayed by any
+    venue, so this runs after every (re)connect.
+
+    Returns:
+        int: Number of orders that changed
+    """
+    loop = asyncio.get_running_loop()
+    orders = [order for order in tracker.open_orders() if order.symbol]
+    results = await asyncio.gather(
+        *(loop.run_in_executor(None, stream.fetch_order, order) for order in orders),
+        return_exceptions=True
+    )
+    changed = 0
+    for order, result in zip(orders, results):
+        if isinstance(result, Exception):
+            logger.warning(f"{stream.venue} reconciliation failed for {order.order_id}: {result}")
+        elif result is not None:
+            changed += tracker.apply(result)
+    return changed
+
+
+async def _ping(ws, stream: UserStream) -> None:
+    while True:
+        await asyncio.sleep(stream.ping_interval)
+        await ws.send(stream.ping_message)
+
+
+async def run_user_stream(stream: UserStream, tracker: OrderTracker,
+                          connect: Optional[Callable[[str], Any]] = None,
+                          reconnect_delay: float = 1.0) -> None:
+    """
+    Feed tracker from the venue's private order stream until cancelled
+
+    Args:
+        stream (UserStream): Venue adapter
+        tracker (OrderTracker): State to update
+        connect (callable, optional): url -> async context manager yielding a
+            connection with send/recv and async iteration; defaults to
+            websockets.connect, override to point at a local stand-in
+        reconnect_delay (float): Seconds to wait before reconnecting after an error or a server close
+    """
+    reconnect_errors = (OSError, asyncio.TimeoutError)
+    if connect is None:
+        import websockets
+
+        reconnect_errors += (websockets.WebSocketException,)
+
+        def connect(url):
+            return websockets.connect(url, ping_interval=20)
+
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            try:
+                url = await loop.run_in_executor(None, stream.stream_url)
+                async with connect(url) as ws:
+                    await stream.handshake(ws)
+                    # Subscribed first so nothing falls between the REST answer and the stream
+                    await reconcile(stream, tracker)
+                    pinger = asyncio.ensure_future(_ping(ws, stream)) if stream.ping_message else None
+                    try:
+                        async for raw in ws:
+                            message = _decode(raw)
+                            if message is None:
+                                continue
+                            for update in stream.parse(message):
+                                tracker.apply(update)
+                    finally:
+                        if pinger is not None:
+                            pinger.cancel()
+                logger.warning(f"{stream.venue} user stream closed by server; reconnecting")
+            except reconnect_errors as e:
+                logger.warning(f"{stream.venue} user stream dropped: {e}")
+            # Also after a clean close, so a server that keeps hanging up is not hammered
+            await asyncio.sleep(reconnect_delay)
+    finally:
+        stream.close()
+
+
+if __name__ == "__main__":
+    import os
+
+    logging.basicConfig(level=logging.INFO)
+
+    async def main():
+        tracker = OrderTracker(on_change=lambda order: print(order.to_dict()))
+        stream = BybitUserStream(os.getenv('BYBIT_API_KEY'), os.getenv('BYBIT_API_SECRET'))
+        await run_user_stream(stream, tracker)
+
+    asyncio.run(main())
@@ -0,0 +1,195 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import pandas as pd
+from dotenv import load_dotenv
+
+from crypto_exchange.common.client_registry import get_client
+
+logger = logging.getLogger(__name__)
+
+BALANCE_COLUMNS = ['exchange', 'account', 'asset', 'free', 'locked', 'total']
+
+
+class BalanceSource(NamedTuple):
+    """One venue/account pair and the callable returning its balance rows"""
+    exchange: str
+    account: str
+    fetch: Callable[[], List[Dict]]
+
+
+def _lazy_client(*args) -> Callable[[], object]:
+    # Resolve the shared SDK client on first fetch: python-binance's Client pings the API when built
+    return lambda: get_client(*args)
+
+
+def _binance_sources(api_key, api_secret):
+    from crypto_exchange.binance.get_balance_binance import get_balance_rows
+
+    client = _lazy_client('binance', api_key, api_secret)
+    return [
+        BalanceSource('binance', account, lambda account=account: get_balance_rows(client(), account))
+        for account in ('spot', 'futures')
+    ]
+
+
+def _bybit_sources(api_key, api_secret):
+    from crypto_exchange.bybit.get_balance_bybit import get_balance_rows
+
+    client = _lazy_client('bybit', api_key, api_secret)
+    return [
+        BalanceSource('bybit', account, lambda account_type=account_type: get_balance_rows(client(), account_type))
+        for account, account_type in (('spot', 'SPOT'), ('futures', 'CONTRACT'))
+    ]
+
+
+def _okx_sources(api_key, api_secret, passphrase):
+    from crypto_exchange.okx.get_balance_okx import get_balance_rows
+
+    exchange = _lazy_client('okx', api_key, api_secret, passphrase)
+    return [
+        BalanceSource('okx', account, lambda account=account: get_balance_rows(exchange(), account))
+        for account in ('spot', 'futures')
+    ]
+
+
+def _bitget_sources(api_key, api_secret, passphrase):
+    from crypto_exchange.bitget.get_balance_bitget import get_balance_rows
+
+    client = _lazy_client('bitget', api_key, api_secret, passphrase)
+    return [
+        BalanceSource('bitget', account, lambda account=account: get_balance_rows(client(), account))
+        for account in ('spot', 'futures')
+    ]
+
+
+def _mexc_sources(api_key, api_secret):
+    from crypto_exchange.mexc.get_balance_mexc import MEXCAPI
+
+    mexc = MEXCAPI(api_key, api_secret)
+    return [
+        BalanceSource('mexc', account, lambda account=account: mexc.get_balance_rows(account))
+        for account in ('spot', 'futures')
+    ]
+
+
+# Venue -> (environment variables holding the credentials, source builder)
+_VENUES = {
+    'binance': (('BINANCE_API_KEY', 'BINANCE_API_SECRET'), _binance_sources),
+    'bybit': (('BYBIT_API_KEY', 'BYBIT_API_SECRET'), _bybit_sources),
+    'okx': (('OKX_API_KEY', 'OKX_API_SECRET', 'OKX_API_PASSPHRASE'), _okx_sources),
+    'bitget': (('BITGET_API_KEY', 'BITGET_API_SECRET', 'BITGET_API_PASSPHRASE'), _bitget_sources),
+    'mexc': (('MEXC_API_KEY', 'MEXC_API_SECRET'), _mexc_sources),
+}
+
+
+def sources_from_env() -> List[BalanceSource]:
+    """
+    Build balance sources for every venue whose credentials are set in the environment
+
+    Returns:
+        list: BalanceSource for the spot and futures account of each configured venue
+    """
+    load_dotenv()
+    sources = []
+    for venue, (env_names, build) in _VENUES.items():
+        credentials = [os.getenv(name) for name in env_names]
+        if all(credentials):
+            sources.extend(build(*credentials))
+        else:
+            logger.debug(f"Skipping {venue}: {', '.join(env_names)} not set")
+    return sources
+
+
+class PortfolioAggregator:
+    def __init__(self, sources: Optional[List[BalanceSource]] = None, ttl: float = 10.0,
+                 max_workers: Optional[int] = None):
+        """
+        Query every venue/account in parallel and merge the balances into one table
+
+        Args:
+            sources (list, optional): Balance sources, defaults to sources_from_env()
+            ttl (float): Seconds a fetched table is served from cache
+            max_workers (int, optional): Thread pool size, defaults to one per source
+        """
+        self.sources = sources if sources is not None else sources_from_env()
+        self.ttl = ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or max(1, len(self.sources)))
+        self._lock = threading.Lock()
+        self._cached: Optional[pd.DataFrame] = None
+        self._cached_at = 0.0
+        self.errors: Dict[str, str] = {}
+
+    def _fetch_source(self, source: BalanceSource) -> List[Dict]:
+        rows = source.fetch()
+        return [{'exchange': source.exchange, 'account': source.account, **row} for row in rows]
+
+    def refresh(self) -> pd.DataFrame:
+        """
+        Fetch every source now; wall time is bounded by the slowest venue
+
+        A failing venue is logged and recorded in self.errors instead of
+        failing the whole table.
+
+        Returns:
+            pd.DataFrame: Columns exchange, account, asset, free, locked, total
+        """
+        futures = [(source, self._executor.submit(self._fetch_source, source)) for source in self.sources]
+        rows = []
+        errors = {}
+        for source, future in futures:
+            try:
+                rows.extend(future.result())
+            except Exception as e:
+                key = f"{source.exchange}/{source.account}"
+                logger.error(f"Error getting {key} balance: {e}")
+                errors[key] = str(e)
+
+        table = pd.DataFrame(rows, columns=BALANCE_COLUMNS)
+        table = table.astype({'free': 'float64', 'locked': 'float64', 'total': 'float64'})
+        self.errors = errors
+        self._cached = table
+        self._cached_at = time.monotonic()
+        return table
+
+    def get_portfolio(self, max_age: Optional[float] = None) -> pd.DataFrame:
+        """
+        Get the unified balance table, served from cache while it is fresh
+
+        Concurrent callers during a refresh wait for it instead of starting their own.
+
+        Args:
+            max_age (float, optional): Override of the TTL for this call
+
+        Returns:
+            pd.DataFrame: Columns exchange, account, asset, free, locked, total
+        """
+        ttl = self.ttl if max_age is None else max_age
+        with self._lock:
+            if self._cached is not None and time.monotonic() - self._cached_at < ttl:
+                return self._cached
+            return self.refresh()
+
+    def totals_by_asset(self) -> pd.DataFrame:
+        """Sum free, locked and total per asset across every venue and account"""
+        return self.get_portfolio().groupby('asset')[['free', 'locked', 'total']].sum().reset_index()
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    aggregator = PortfolioAggregator(ttl=30)
+    start = time.perf_counter()
+    portfolio = aggregator.get_portfolio()
+    print(f"Fetched {len(aggregator.sources)} accounts in {time.perf_counter() - start:.2f}s")
+    print(portfolio.to_string(index=False))
+    print("\n=== Totals by asset ===")
+    print(aggregator.totals_by_asset().to_string(index=False))
+    for key, error in aggregator.errors.items():
+        print(f"{key}: {error}")
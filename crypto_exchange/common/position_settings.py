@@ -0,0 +1,99 @@
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PositionSettingsCache:
+    def __init__(self, venue: str):
+        """
+        Last leverage / margin mode the exchange acknowledged, per symbol
+
+        Strategies call set_leverage before every trade; with this cache the
+        request is only sent when the value actually changes. After a
+        rejection the entry is dropped, because the exchange state is then
+        unknown and the next call must go through.
+
+        Args:
+            venue (str): Name used in logs
+        """
+        self.venue = venue
+        self._settings: Dict[Tuple[str, Hashable], Any] = {}
+        self._lock = threading.Lock()
+        self.sent = 0
+        self.skipped = 0
+
+    def get(self, symbol: str, setting: Hashable) -> Any:
+        """Cached value, or None when unknown"""
+        return self._settings.get((symbol, setting))
+
+    def record(self, symbol: str, setting: Hashable, value: Any) -> None:
+        """Store a value known to be live on the exchange (e.g. read from a position)"""
+        with self._lock:
+            self._settings[(symbol, setting)] = value
+
+    def invalidate(self, symbol: Optional[str] = None, setting: Optional[Hashable] = None) -> None:
+        """Forget one setting, every setting of a symbol, or everything"""
+        with self._lock:
+            for key in list(self._settings):
+                if (symbol is None or key[0] == symbol) and (setting is None or key[1] == setting):
+                    del self._settings[key]
+
+    def update(self, symbol: str, setting: Hashable, value: Any, send: Callable[[], Any],
+               accepted: Callable[[Any], bool] = lambda response: True,
+               unchanged: Callable[[Exception], bool] = lambda error: False) -> Any:
+        """
+        Send a change unless the cached value already matches
+
+        Args:
+            symbol (str): Venue symbol
+            setting (hashable): e.g. 'leverage', 'margin_mode' or ('leverage', 'cross')
+            value: Desired value
+            send (callable): Makes the request; may raise or return a response
+            accepted (callable): Tells whether a returned response was a success
+            unchanged (callable): Tells whether an exception means "already set"
+
+        Returns:
+            The response of send(), or None when nothing was sent
+        """
+        if self.get(symbol, setting) == value:
+            self.skipped += 1
+            return None
+        self.sent += 1
+        try:
+            response = send()
+        except Exception as e:
+            if unchanged(e):
+                self.record(symbol, setting, value)
+                return None
+            self.invalidate(symbol, setting)
+            raise
+        if accepted(response):
+            self.record(symbol, setting, value)
+        else:
+            logger.warning(f"{self.venue} rejected {setting}={value} for {symbol}: {response}")
+            self.invalidate(symbol, setting)
+        return response
+
+
+_caches: Dict[Tuple[str, Optional[str]], PositionSettingsCache] = {}
+_lock = threading.Lock()
+
+
+def get_position_settings(venue: str, account: Optional[str] = None) -> PositionSettingsCache:
+    """
+    Shared cache for one venue account, so every trader on the same key agrees
+
+    Args:
+        venue (str): e.g. 'binance_futures', 'bybit', 'okx', 'bitget', 'mexc'
+        account (str, optional): API key (settings are per account)
+    """
+    key = (venue, account)
+    cache = _caches.get(key)
+    if cache is None:
+        with _lock:
+            cache = _caches.get(key)
+            if cache is None:
+                cache = _caches[key] = PositionSettingsCache(venue)
+    return cache
@@ -0,0 +1,318 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    def __init__(self, capacity: float, window: float):
+        """
+        Token bucket that hands out reservations instead of rejections
+
+        Tokens may go negative: each caller reserves its cost up front and is
+        told how long to wait, which queues callers in arrival order.
+
+        Args:
+            capacity (float): Tokens available per window (e.g. 6000 weight)
+            window (float): Window length in seconds (e.g. 60)
+        """
+        self.capacity = float(capacity)
+        self.rate = self.capacity / window
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, cost: float) -> float:
+        """Take cost tokens and return the seconds to wait before using them"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= cost
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def sync(self, used: Optional[float] = None, remaining: Optional[float] = None) -> None:
+        """Resynchronize with the exchange's own count (used or remaining)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            server_tokens = self.capacity - used if used is not None else remaining
+            # Only ever tighten: our own reservations may not have reached the server yet
+            if server_tokens is not None and server_tokens < self.tokens:
+                self.tokens = float(server_tokens)
+
+
+class RateLimiter:
+    def __init__(self, venue: str, weight_limit: Optional[Tuple[float, float]] = None,
+                 order_limit: Optional[Tuple[float, float]] = None,
+                 endpoint_weights: Optional[Mapping[str, float]] = None,
+                 order_endpoints: Iterable[str] = (),
+                 used_weight_headers: Iterable[str] = (),
+                 order_count_headers: Iterable[str] = (),
+                 remaining_headers: Iterable[str] = (),
+                 endpoint_limit_headers: Optional[Tuple[str, str]] = None,
+                 endpoint_window: float = 1.0,
+                 endpoint_limit: Optional[Tuple[float, float]] = None,
+                 endpoint_limits: Optional[Mapping[str, Tuple[float, float]]] = None,
+                 endpoint_remaining_headers: Iterable[str] = ()):
+        """
+        Client-side limiter for one venue with request-weight, order-count and per-endpoint buckets
+
+        Args:
+            venue (str): Name used in logs and metrics
+            weight_limit (tuple, optional): (weight, seconds) allowed per window
+                across the venue; None when the venue only limits per endpoint
+            order_limit (tuple, optional): (orders, seconds) allowed per window
+            endpoint_weights (dict, optional): Path -> request weight (default 1)
+            order_endpoints (iterable): Paths whose POSTs also count as orders
+            used_weight_headers (iterable): Response headers carrying used weight
+            order_count_headers (iterable): Response headers carrying the order count
+            remaining_headers (iterable): Response headers carrying remaining venue-wide requests
+            endpoint_limit_headers (tuple, optional): (limit, remaining) response
+                headers of a per-endpoint limit; each path gets its own bucket,
+                sized from the first response that carries them
+            endpoint_window (float): Window in seconds of the header-sized per-endpoint limits
+            endpoint_limit (tuple, optional): (requests, seconds) allowed per window
+                on every path, each path with its own bucket
+            endpoint_limits (dict, optional): Path -> (requests, seconds) overriding endpoint_limit
+            endpoint_remaining_headers (iterable): Response headers carrying the
+                remaining requests of the endpoint that was called
+        """
+        self.venue = venue
+        self.weight = TokenBucket(*weight_limit) if weight_limit else None
+        self.orders = TokenBucket(*order_limit) if order_limit else None
+        self.endpoint_weights = dict(endpoint_weights or {})
+        self.order_endpoints = tuple(order_endpoints)
+        self.used_weight_headers = tuple(h.lower() for h in used_weight_headers)
+        self.order_count_headers = tuple(h.lower() for h in order_count_headers)
+        self.remaining_headers = tuple(h.lower() for h in remaining_headers)
+        self.endpoint_limit_headers = (
+            tuple(h.lower() for h in endpoint_limit_headers) if endpoint_limit_headers else None
+        )
+        self.endpoint_window = endpoint_window
+        self.endpoint_limit = endpoint_limit
+        self.endpoint_limits = dict(endpoint_limits or {})
+        self.endpoint_remaining_headers = tuple(h.lower() for h in endpoint_remaining_headers)
+        self.endpoint_buckets: Dict[str, TokenBucket] = {}
+        self._endpoint_lock = threading.Lock()
+
+        self._metrics_lock = threading.Lock()
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.requests = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _reserve(self, path: str, method: str, weight: Optional[float]) -> float:
+        wait = 0.0
+        if self.weight is not None:
+            wait = self.weight.reserve(weight if weight is not None else self.endpoint_weights.get(path, 1))
+        if self.orders is not None and method != 'GET' and self.order_endpoints and path.startswith(self.order_endpoints):
+            wait = max(wait, self.orders.reserve(1))
+        endpoint = self._configured_bucket(path)
+        if endpoint is not None:
+            wait = max(wait, endpoint.reserve(1))
+        with self._metrics_lock:
+            self.requests += 1
+            if wait > 0:
+                self.throttled += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+                self.queue_depth += 1
+                self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        return wait
+
+    def _dequeue(self) -> None:
+        with self._metrics_lock:
+            self.queue_depth -= 1
+
+    def acquire(self, path: str, method: str = 'GET', weight: Optional[float] = None) -> float:
+        """
+        Block until the request may be sent
+
+        Args:
+            path (str): Endpoint path (e.g. '/api/v3/order')
+            method (str): HTTP method; non-GET requests to order endpoints count as orders
+            weight (float, optional): Override of the configured endpoint weight
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        wait = self._reserve(path, method, weight)
+        if wait > 0:
+            try:
+                time.sleep(wait)
+            finally:
+                self._dequeue()
+        return wait
+
+    async def acquire_async(self, path: str, method: str = 'GET', weight: Optional[float] = None) -> float:
+        """asyncio version of acquire(); waits without blocking the event loop"""
+        wait = self._reserve(path, method, weight)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self._dequeue()
+        return wait
+
+    def _endpoint_bucket(self, path: str, limit: float, window: float) -> TokenBucket:
+        bucket = self.endpoint_buckets.get(path)
+        if bucket is None or bucket.capacity != limit:
+            with self._endpoint_lock:
+                bucket = self.endpoint_buckets.get(path)
+                if bucket is None or bucket.capacity != limit:
+                    bucket = self.endpoint_buckets[path] = TokenBucket(limit, window)
+        return bucket
+
+    def _configured_bucket(self, path: str) -> Optional[TokenBucket]:
+        # Existing bucket of the path, else one from endpoint_limits / endpoint_limit
+        bucket = self.endpoint_buckets.get(path)
+        if bucket is None:
+            limit = self.endpoint_limits.get(path, self.endpoint_limit)
+            if limit is not None:
+                bucket = self._endpoint_bucket(path, *limit)
+        return bucket
+
+    def update_from_headers(self, headers: Mapping[str, str], path: Optional[str] = None) -> None:
+        """
+        Resynchronize the buckets from the exchange's usage headers
+
+        Args:
+            headers (mapping): Response headers
+            path (str, optional): Endpoint path of the request, needed for per-endpoint limits
+        """
+        lowered = {key.lower(): value for key, value in headers.items()}
+        try:
+            for name in self.used_weight_headers:
+                if name in lowered and self.weight is not None:
+                    self.weight.sync(used=float(lowered[name]))
+            for name in self.order_count_headers:
+                if name in lowered and self.orders is not None:
+                    self.orders.sync(used=float(lowered[name]))
+            for name in self.remaining_headers:
+                if name in lowered and self.weight is not None:
+                    self.weight.sync(remaining=float(lowered[name]))
+            if path is not None and self.endpoint_limit_headers is not None:
+                limit_name, remaining_name = self.endpoint_limit_headers
+                if limit_name in lowered and remaining_name in lowered:
+                    bucket = self._endpoint_bucket(path, float(lowered[limit_name]), self.endpoint_window)
+                    bucket.sync(remaining=float(lowered[remaining_name]))
+            for name in self.endpoint_remaining_headers:
+                if name in lowered and path is not None:
+                    bucket = self._configured_bucket(path)
+                    if bucket is not None:
+                        bucket.sync(remaining=float(lowered[name]))
+        except ValueError:
+            logger.debug(f"Unparseable rate limit header from {self.venue}: {lowered}")
+
+    def metrics(self) -> Dict[str, float]:
+        """Queue depth and wait statistics since start"""
+        with self._metrics_lock:
+            return {
+                'venue': self.venue,
+                'requests': self.requests,
+                'throttled': self.throttled,
+                'queue_depth': self.queue_depth,
+                'max_queue_depth': self.max_queue_depth,
+                'total_wait': self.total_wait,
+                'max_wait': self.max_wait,
+                'weight_tokens': self.weight.tokens if self.weight is not None else None,
+                'order_tokens': self.orders.tokens if self.orders is not None else None,
+            }
+
+
+# Published IP/account limits; weights list the endpoints this repo calls
+VENUE_LIMITS = {
+    'binance_spot': dict(
+        weight_limit=(6000, 60),
+        order_limit=(100, 10),
+        endpoint_weights={'/api/v3/klines': 2, '/api/v3/depth': 50, '/api/v3/account': 20,
+                          '/api/v3/order': 4, '/api/v3/exchangeInfo': 20},
+        order_endpoints=('/api/v3/order',),
+        used_weight_headers=('X-MBX-USED-WEIGHT-1M',),
+        order_count_headers=('X-MBX-ORDER-COUNT-10S',),
+    ),
+    'binance_futures': dict(
+        weight_limit=(2400, 60),
+        order_limit=(1200, 60),
+        endpoint_weights={'/fapi/v1/klines': 5, '/fapi/v1/depth': 20, '/fapi/v2/balance': 5,
+                          '/fapi/v2/positionRisk': 5, '/fapi/v1/batchOrders': 5, '/fapi/v1/exchangeInfo': 1},
+        order_endpoints=('/fapi/v1/order', '/fapi/v1/batchOrders'),
+        used_weight_headers=('X-MBX-USED-WEIGHT-1M',),
+        order_count_headers=('X-MBX-ORDER-COUNT-1M',),
+    ),
+    'bybit': dict(
+        weight_limit=(600, 5),
+        order_limit=(10, 1),
+        order_endpoints=('/v5/order/', '/spot/v3/private/order'),
+        # Bybit reports limit and remaining count per endpoint, per second
+        endpoint_limit_headers=('X-Bapi-Limit', 'X-Bapi-Limit-Status'),
+    ),
+    'mexc_spot': dict(
+        weight_limit=(500, 10),
+        order_limit=(5, 1),
+        endpoint_weights={'/api/v3/account': 10, '/api/v3/depth': 10},
+        order_endpoints=('/api/v3/order',),
+    ),
+    'mexc_futures': dict(
+        # Every contract endpoint has its own 20 requests per 2 seconds
+        endpoint_limit=(20, 2),
+    ),
+    'bitget': dict(
+        weight_limit=(6000, 60),
+        # Limits are per endpoint, and so is the remaining count Bitget reports
+        endpoint_limit=(20, 1),
+        endpoint_limits={'/api/mix/v1/order/placeOrder': (10, 1), '/api/spot/v1/trade/orders': (10, 1)},
+        endpoint_remaining_headers=('x-mbx-used-remain-limit',),
+    ),
+    'okx': dict(
+        # Public market data (candles, tickers) allows 40 requests per 2 seconds
+        weight_limit=(40, 2),
+        order_limit=(60, 2),
+        order_endpoints=('/api/v5/trade/',),
+    ),
+}
+
+HOST_VENUES = {
+    'api.binance.com': 'binance_spot',
+    'fapi.binance.com': 'binance_futures',
+    'api.bybit.com': 'bybit',
+    'api-testnet.bybit.com': 'bybit',
+    'api.mexc.com': 'mexc_spot',
+    'contract.mexc.com': 'mexc_futures',
+    'api.bitget.com': 'bitget',
+    'www.okx.com': 'okx',
+}
+
+_limiters: Dict[str, RateLimiter] = {}
+_lock = threading.Lock()
+
+
+def get_rate_limiter(venue: str) -> RateLimiter:
+    """Shared limiter for a venue key of VENUE_LIMITS, created on first use"""
+    limiter = _limiters.get(venue)
+    if limiter is None:
+        with _lock:
+            limiter = _limiters.get(venue)
+            if limiter is None:
+                limiter = RateLimiter(venue, **VENUE_LIMITS[venue])
+                _limiters[venue] = limiter
+    return limiter
+
+
+def limiter_for_url(url: str) -> Optional[RateLimiter]:
+    """Limiter for the venue serving url, or None for hosts without known limits"""
+    venue = HOST_VENUES.get(urlsplit(url).hostname or '')
+    return get_rate_limiter(venue) if venue else None
+
+
+def rate_limit_metrics() -> Dict[str, Dict[str, float]]:
+    """Metrics of every limiter created so far, keyed by venue"""
+    return {venue: limiter.metrics() for venue, limiter in list(_limiters.items())}
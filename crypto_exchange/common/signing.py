@@ -0,0 +1,67 @@
+import base64
+import hashlib
+from typing import Any, Callable, Mapping, Union
+
+Message = Union[str, bytes]
+
+
+def canonical_query(params: Mapping[str, Any]) -> bytes:
+    """
+    Sorted key=value&... query string, encoded once
+
+    Values are not URL-quoted, matching what the venues sign; use
+    urllib.parse.urlencode first for endpoints that sign the quoted form.
+
+    Args:
+        params (dict): Request parameters
+
+    Returns:
+        bytes: Canonical payload ready to sign
+    """
+    return '&'.join([f"{key}={params[key]}" for key in sorted(params)]).encode('utf-8')
+
+
+class HmacSigner:
+    def __init__(self, secret: Message, digestmod: Callable = hashlib.sha256):
+        """
+        HMAC signer that keeps the keyed inner and outer hash states
+
+        The key is padded and XORed once here; every signature then only
+        copies the two precomputed states instead of re-deriving them from
+        the secret, which is the dominant cost for short request payloads.
+
+        Args:
+            secret (str | bytes): API secret
+            digestmod (callable): hashlib constructor (default: sha256)
+        """
+        key = secret.encode('utf-8') if isinstance(secret, str) else bytes(secret)
+        inner = digestmod()
+        outer = digestmod()
+        block_size = inner.block_size
+        if len(key) > block_size:
+            key = digestmod(key).digest()
+        key = key.ljust(block_size, b'\0')
+        inner.update(bytes(b ^ 0x36 for b in key))
+        outer.update(bytes(b ^ 0x5C for b in key))
+        self._inner = inner
+        self._outer = outer
+
+    def digest(self, message: Message) -> bytes:
+        """Raw HMAC of message"""
+        inner = self._inner.copy()
+        inner.update(message.encode('utf-8') if isinstance(message, str) else message)
+        outer = self._outer.copy()
+        outer.update(inner.digest())
+        return outer.digest()
+
+    def sign_hex(self, message: Message) -> str:
+        """Hex encoded HMAC (Bybit, MEXC, Bitget futures)"""
+        return self.digest(message).hex()
+
+    def sign_base64(self, message: Message) -> str:
+        """Base64 encoded HMAC (Bitget spot, OKX)"""
+        return base64.b64encode(self.digest(message)).decode('ascii')
+
+    def sign_params_hex(self, params: Mapping[str, Any]) -> str:
+        """Hex HMAC of the canonical (sorted, unquoted) query of params"""
+        return self.digest(canonical_query(params)).hex()
@@ -0,0 +1,288 @@
+import logging
+import threading
+import time
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
+from typing import Callable, Dict, NamedTuple, Optional, Tuple, Union
+
+from crypto_exchange.common.client_registry import get_client
+from crypto_exchange.common.http_transport import get_session
+
+logger = logging.getLogger(__name__)
+
+Number = Union[float, int, str, Decimal]
+
+
+class OrderValidationError(ValueError):
+    """Order parameters the exchange would reject, caught before sending"""
+
+
+def _dec(value) -> Decimal:
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def format_decimal(value: Number) -> str:
+    """Plain decimal string for a request (str() of a Decimal can give '1E-7')"""
+    return format(_dec(value), 'f')
+
+
+def _round_to(value: Decimal, step: Decimal, rounding: str) -> Decimal:
+    if not step:
+        return value
+    return (value / step).to_integral_value(rounding=rounding) * step
+
+
+class SymbolFilters(NamedTuple):
+    """Trading rules of one symbol; quantities are in the venue's order units"""
+    symbol: str
+    tick_size: Decimal
+    step_size: Decimal
+    min_qty: Decimal = Decimal(0)
+    max_qty: Optional[Decimal] = None
+    min_notional: Decimal = Decimal(0)
+    multiplier: Decimal = Decimal(1)
+
+    def round_price(self, price: Number) -> Decimal:
+        """Nearest valid price"""
+        return _round_to(_dec(price), self.tick_size, ROUND_HALF_UP)
+
+    def round_qty(self, qty: Number) -> Decimal:
+        """Largest valid quantity not above qty (never rounds an order up)"""
+        return _round_to(_dec(qty), self.step_size, ROUND_DOWN)
+
+    def check(self, qty: Decimal, price: Optional[Decimal] = None) -> None:
+        """Raise OrderValidationError when a rounded order breaks a filter"""
+        if qty <= 0 or qty < self.min_qty:
+            raise OrderValidationError(f"{self.symbol}: quantity {qty} below minimum {self.min_qty}")
+        if self.max_qty is not None and qty > self.max_qty:
+            raise OrderValidationError(f"{self.symbol}: quantity {qty} above maximum {self.max_qty}")
+        if price is not None and price <= 0:
+            raise OrderValidationError(f"{self.symbol}: price {price} rounds to zero")
+        if price is not None and qty * price * self.multiplier < self.min_notional:
+            raise OrderValidationError(
+                f"{self.symbol}: notional {qty * price * self.multiplier} below minimum {self.min_notional}"
+            )
+
+
+class SymbolFilterCache:
+    def __init__(self, venue: str, loader: Callable[[], Dict[str, SymbolFilters]], refresh_interval: float = 3600.0):
+        """
+        Per-venue symbol rules, loaded once and refreshed in the background
+
+        The first lookup loads the whole instrument list; a daemon thread then
+        replaces it every refresh_interval seconds, so order paths only ever
+        do a dict lookup.
+
+        Args:
+            venue (str): Name used in logs
+            loader (callable): Returns {symbol: SymbolFilters} for the venue
+            refresh_interval (float): Seconds between background reloads
+        """
+        self.venue = venue
+        self.loader = loader
+        self.refresh_interval = refresh_interval
+        self.filters: Dict[str, SymbolFilters] = {}
+        self.loaded_at = 0.0
+        self.retry_delay = 30.0
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def refresh(self) -> None:
+        """Reload the instrument list now"""
+        filters = self.loader()
+        # Swap the whole dict so readers never see a half-built index
+        self.filters = filters
+        self.loaded_at = time.time()
+        logger.info(f"Loaded {len(filters)} {self.venue} symbol filters")
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Error refreshing {self.venue} symbol filters: {e}")
+
+    def _ensure_loaded(self) -> None:
+        if self.loaded_at or time.monotonic() < self._retry_at:
+            return
+        with self._lock:
+            if self.loaded_at or time.monotonic() < self._retry_at:
+                return
+            try:
+                self.refresh()
+            except Exception as e:
+                # Orders go out unvalidated rather than failing while the venue's metadata is unreachable
+                logger.warning(f"Error loading {self.venue} symbol filters: {e}")
+                self._retry_at = time.monotonic() + self.retry_delay
+                return
+            if self._thread is None and self.refresh_interval:
+                self._thread = threading.Thread(
+                    target=self._refresh_loop, name=f"{self.venue}-symbol-filters", daemon=True
+                )
+                self._thread.start()
+
+    def get(self, symbol: str) -> Optional[SymbolFilters]:
+        """
+        Filters of one symbol
+
+        Returns:
+            SymbolFilters | None: None when the venue does not list the symbol
+        """
+        self._ensure_loaded()
+        return self.filters.get(symbol)
+
+    def prepare(self, symbol: str, qty: Number, price: Optional[Number] = None,
+                reference_price: Optional[Number] = None) -> Tuple[Decimal, Optional[Decimal]]:
+        """
+        Round an order to the symbol's tick and step sizes and validate it
+
+        Args:
+            symbol (str): Venue symbol
+            qty (number): Order quantity
+            price (number, optional): Limit price
+            reference_price (number, optional): Price used for the minimum
+                notional check of market orders (e.g. last or mark price)
+
+        Returns:
+            tuple: (qty, price) as Decimals; unchanged when the symbol is unknown
+
+        Raises:
+            OrderValidationError: The exchange would reject the order
+        """
+        filters = self.get(symbol)
+        if filters is None:
+            logger.warning(f"No {self.venue} filters for {symbol}; sending unvalidated")
+            return _dec(qty), _dec(price) if price is not None else None
+        qty = filters.round_qty(qty)
+        price = filters.round_price(price) if price is not None else None
+        check_price = price if price is not None else (_dec(reference_price) if reference_price is not None else None)
+        filters.check(qty, check_price)
+        return qty, price
+
+    def round_price(self, symbol: str, price: Number) -> Decimal:
+        """Round a trigger or limit price; unchanged when the symbol is unknown"""
+        filters = self.get(symbol)
+        return filters.round_price(price) if filters is not None else _dec(price)
+
+    def close(self) -> None:
+        """Stop the background refresh"""
+        self._stop.set()
+
+
+def _get_json(url: str, params: Optional[dict] = None) -> dict:
+    response = get_session(url).get(url, params=params)
+    response.raise_for_status()
+    return response.json()
+
+
+def load_binance_futures() -> Dict[str, SymbolFilters]:
+    filters = {}
+    for info in _get_json("https://fapi.binance.com/fapi/v1/exchangeInfo")['symbols']:
+        by_type = {f['filterType']: f for f in info['filters']}
+        lot = by_type.get('LOT_SIZE', {})
+        filters[info['symbol']] = SymbolFilters(
+            symbol=info['symbol'],
+            tick_size=_dec(by_type['PRICE_FILTER']['tickSize']),
+            step_size=_dec(lot.get('stepSize', 0)),
+            min_qty=_dec(lot.get('minQty', 0)),
+            max_qty=_dec(lot['maxQty']) if 'maxQty' in lot else None,
+            min_notional=_dec(by_type.get('MIN_NOTIONAL', {}).get('notional', 0)),
+        )
+    return filters
+
+
+def load_bybit_linear(base_url: str = "https://api.bybit.com") -> Dict[str, SymbolFilters]:
+    filters = {}
+    cursor = ''
+    while True:
+        result = _get_json(f"{base_url}/v5/market/instruments-info",
+                           {"category": "linear", "limit": 1000, "cursor": cursor})['result']
+        for info in result['list']:
+            lot = info['lotSizeFilter']
+            filters[info['symbol']] = SymbolFilters(
+                symbol=info['symbol'],
+                tick_size=_dec(info['priceFilter']['tickSize']),
+                step_size=_dec(lot['qtyStep']),
+                min_qty=_dec(lot['minOrderQty']),
+                max_qty=_dec(lot['maxOrderQty']),
+                min_notional=_dec(lot.get('minNotionalValue', 0)),
+            )
+        cursor = result.get('nextPageCursor')
+        if not cursor:
+            return filters
+
+
+def load_bitget_mix(product_type: str = "umcbl") -> Dict[str, SymbolFilters]:
+    filters = {}
+    contracts = _get_json("https://api.bitget.com/api/mix/v1/market/contracts", {"productType": product_type})['data']
+    for info in contracts:
+        # Tick is priceEndStep units of the last price decimal
+        tick = _dec(info['priceEndStep']).scaleb(-int(info['pricePlace']))
+        filters[info['symbol']] = SymbolFilters(
+            symbol=info['symbol'],
+            tick_size=tick,
+            step_size=_dec(info['sizeMultiplier']),
+            min_qty=_dec(info['minTradeNum']),
+            min_notional=_dec(info.get('minTradeUSDT') or 0),
+        )
+    return filters
+
+
+def load_mexc_contracts() -> Dict[str, SymbolFilters]:
+    filters = {}
+    for info in _get_json("https://contract.mexc.com/api/v1/contract/detail")['data']:
+        # Volumes are whole contracts of contractSize base units each
+        filters[info['symbol']] = SymbolFilters(
+            symbol=info['symbol'],
+            tick_size=_dec(info['priceUnit']),
+            step_size=_dec(info['volUnit']),
+            min_qty=_dec(info['minVol']),
+            max_qty=_dec(info['maxVol']),
+            multiplier=_dec(info['contractSize']),
+        )
+    return filters
+
+
+def load_okx_swaps() -> Dict[str, SymbolFilters]:
+    # ccxt runs OKX in tick-size precision mode, so precision values are step sizes
+    exchange = get_client('okx', default_type='swap')
+    filters = {}
+    for symbol, market in exchange.load_markets(reload=True).items():
+        if not market.get('swap'):
+            continue
+        limits = market.get('limits', {})
+        filters[symbol] = SymbolFilters(
+            symbol=symbol,
+            tick_size=_dec(market['precision']['price']),
+            step_size=_dec(market['precision']['amount']),
+            min_qty=_dec(limits.get('amount', {}).get('min') or 0),
+            min_notional=_dec(limits.get('cost', {}).get('min') or 0),
+            multiplier=_dec(market.get('contractSize') or 1),
+        )
+    return filters
+
+
+LOADERS: Dict[str, Callable[[], Dict[str, SymbolFilters]]] = {
+    'binance_futures': load_binance_futures,
+    'bybit_linear': load_bybit_linear,
+    'bybit_linear_testnet': lambda: load_bybit_linear("https://api-testnet.bybit.com"),
+    'bitget_mix': load_bitget_mix,
+    'mexc_futures': load_mexc_contracts,
+    'okx_swap': load_okx_swaps,
+}
+
+_caches: Dict[str, SymbolFilterCache] = {}
+_lock = threading.Lock()
+
+
+def get_symbol_filters(venue: str) -> SymbolFilterCache:
+    """Shared cache for a venue key of LOADERS; nothing is fetched until the first lookup"""
+    cache = _caches.get(venue)
+    if cache is None:
+        with _lock:
+            cache = _caches.get(venue)
+            if cache is None:
+                cache = SymbolFilterCache(venue, LOADERS[venue])
+                _caches[venue] = cache
+    return cache
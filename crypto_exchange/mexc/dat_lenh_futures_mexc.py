@@ -1,25 +1,37 @@
 import requests
 import time
-import hmac
-import hashlib
 import json
-from typing import Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
+
+from crypto_exchange.common.batch_orders import place_concurrently
+from crypto_exchange.common.http_transport import get_session
+from crypto_exchange.common.position_settings import get_position_settings
+from crypto_exchange.common.signing import HmacSigner
+from crypto_exchange.common.symbol_filters import OrderValidationError, format_decimal, get_symbol_filters
+
+
+def order_rejection(response: Dict) -> Optional[str]:
+    """Rejection reason of a place_order() response, or None when it was accepted"""
+    if "error" in response:
+        return response["error"]
+    if response.get("success") is False:
+        return f"{response.get('code')}: {response.get('message')}"
+    return None
+
 
 class MEXCFuturesAPI:
     def __init__(self, api_key: str, api_secret: str):
         self.api_key = api_key
         self.api_secret = api_secret
         self.base_url = "https://contract.mexc.com"
+        self.session = get_session(self.base_url)
+        self.signer = HmacSigner(api_secret)
+        self.filters = get_symbol_filters('mexc_futures')
+        self.settings = get_position_settings('mexc', api_key)
         
     def _generate_signature(self, params: Dict) -> str:
         """Generate HMAC SHA256 signature for API requests"""
-        query_string = '&'.join([f"{k}={v}" for k, v in sorted(params.items())])
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        return self.signer.sign_params_hex(params)
 
     def _get_headers(self, params: Dict) -> Dict:
         """Generate headers for API requests"""
@@ -61,17 +73,23 @@ class MEXCFuturesAPI:
         """
         endpoint = "/api/v1/private/order/submit"
         url = f"{self.base_url}{endpoint}"
+
+        try:
+            quantity, price = self.filters.prepare(symbol, quantity, price)
+        except OrderValidationError as e:
+            print(f"Error placing order: {e}")
+            return {"error": str(e)}
         
         params = {
             "symbol": symbol,
             "side": side,
             "type": order_type,
-            "volume": str(quantity),
+            "volume": format_decimal(quantity),
             "position_mode": position_mode
         }
         
         if price is not None:
-            params["price"] = str(price)
+            params["price"] = format_decimal(price)
             
         if leverage is not None:
             params["leverage"] = str(leverage)
@@ -79,13 +97,29 @@ class MEXCFuturesAPI:
         headers = self._get_headers(params)
         
         try:
-            response = requests.post(url, headers=headers, json=params)
+            response = self.session.post(url, headers=headers, json=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"Error placing order: {e}")
             return {"error": str(e)}
 
+    def place_orders(self, batch: List[Dict[str, Any]], max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Place many futures orders concurrently
+
+        MEXC's contract batch endpoint is not generally available, so each
+        order is its own request but they are all in flight at once.
+
+        Args:
+            batch: Order dicts with the place_order argument names
+            max_workers: Maximum requests in flight
+
+        Returns:
+            One {'index', 'success', 'order', 'error'} dict per order, in batch order
+        """
+        return place_concurrently(lambda order: self.place_order(**order), batch, order_rejection, max_workers)
+
     def get_order_status(self, order_id: str, symbol: str) -> Dict:
         """
         Get status of a specific order
@@ -108,7 +142,7 @@ class MEXCFuturesAPI:
         headers = self._get_headers(params)
         
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, headers=headers, params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -137,13 +171,52 @@ class MEXCFuturesAPI:
         headers = self._get_headers(params)
         
         try:
-            response = requests.post(url, headers=headers, json=params)
+            response = self.session.post(url, headers=headers, json=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"Error canceling order: {e}")
             return {"error": str(e)}
 
+    def set_leverage(self, symbol: str, leverage: int, open_type: int = 1) -> Optional[Dict]:
+        """
+        Set leverage for both long and short positions, skipping the call when already set
+        
+        Args:
+            symbol: Trading pair (e.g., "BTC_USDT")
+            leverage: Leverage value (1-125)
+            open_type: 1 for isolated, 2 for cross margin
+            
+        Returns:
+            Dict with the long and short responses, or None when nothing was sent
+        """
+        endpoint = "/api/v1/private/position/change_leverage"
+        url = f"{self.base_url}{endpoint}"
+
+        def send() -> Dict:
+            responses = {}
+            for name, position_type in (("long", 1), ("short", 2)):
+                params = {
+                    "symbol": symbol,
+                    "leverage": leverage,
+                    "openType": open_type,
+                    "positionType": position_type
+                }
+                headers = self._get_headers(params)
+                response = self.session.post(url, headers=headers, json=params)
+                response.raise_for_status()
+                responses[name] = response.json()
+            return responses
+
+        try:
+            return self.settings.update(
+                symbol, ('leverage', open_type), leverage, send,
+                accepted=lambda responses: all(r.get("success") for r in responses.values())
+            )
+        except requests.exceptions.RequestException as e:
+            print(f"Error setting leverage: {e}")
+            return {"error": str(e)}
+
 # Example usage
 if __name__ == "__main__":
     # Replace with your actual API credentials
@@ -0,0 +1,155 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from crypto_exchange.common.async_http_transport import close_async_sessions, get_async_session
+from crypto_exchange.common.batch_orders import order_result
+from crypto_exchange.mexc.dat_lenh_futures_mexc import MEXCFuturesAPI, order_rejection
+
+class AsyncMEXCFuturesAPI(MEXCFuturesAPI):
+    """asyncio counterpart of MEXCFuturesAPI with the same method surface"""
+
+    async def _request(self, method: str, endpoint: str, params: Dict) -> Dict:
+        headers = self._get_headers(params)
+        session = get_async_session(self.base_url)
+        if method == "GET":
+            kwargs = {"params": params}
+        else:
+            kwargs = {"data": json.dumps(params)}
+        async with session.request(method, f"{self.base_url}{endpoint}", headers=headers, **kwargs) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: float,
+        price: Optional[float] = None,
+        leverage: Optional[int] = None,
+        position_mode: str = "isolated"
+    ) -> Dict:
+        """
+        Place a futures order on MEXC
+
+        Args:
+            symbol: Trading pair (e.g., "BTC_USDT")
+            side: "BUY" or "SELL"
+            order_type: "LIMIT" or "MARKET"
+            quantity: Order quantity
+            price: Price for limit orders
+            leverage: Leverage value (1-125)
+            position_mode: "isolated" or "cross"
+
+        Returns:
+            Dict containing order response
+        """
+        params = {
+            "symbol": symbol,
+            "side": side,
+            "type": order_type,
+            "volume": str(quantity),
+            "position_mode": position_mode
+        }
+
+        if price is not None:
+            params["price"] = str(price)
+
+        if leverage is not None:
+            params["leverage"] = str(leverage)
+
+        try:
+            return await self._request("POST", "/api/v1/private/order/submit", params)
+        except aiohttp.ClientError as e:
+            print(f"Error placing order: {e}")
+            return {"error": str(e)}
+
+    async def place_orders(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Place many futures orders concurrently, one request per order
+
+        Args:
+            batch: Order dicts with the place_order argument names
+
+        Returns:
+            One {'index', 'success', 'order', 'error'} dict per order, in batch order
+        """
+        async def place(order: Dict[str, Any]) -> Dict:
+            return await self.place_order(**order)
+
+        responses = await asyncio.gather(*[place(order) for order in batch], return_exceptions=True)
+        results = []
+        for index, response in enumerate(responses):
+            if isinstance(response, BaseException):
+                results.append(order_result(index, error=str(response)))
+            elif response is None:
+                results.append(order_result(index, error="No response"))
+            else:
+                results.append(order_result(index, response, order_rejection(response)))
+        return results
+
+    async def get_order_status(self, order_id: str, symbol: str) -> Dict:
+        """
+        Get status of a specific order
+
+        Args:
+            order_id: Order ID to check
+            symbol: Trading pair
+
+        Returns:
+            Dict containing order status
+        """
+        params = {
+            "order_id": order_id,
+            "symbol": symbol
+        }
+
+        try:
+            return await self._request("GET", "/api/v1/private/order/get", params)
+        except aiohttp.ClientError as e:
+            print(f"Error getting order status: {e}")
+            return {"error": str(e)}
+
+    async def cancel_order(self, order_id: str, symbol: str) -> Dict:
+        """
+        Cancel a specific order
+
+        Args:
+            order_id: Order ID to cancel
+            symbol: Trading pair
+
+        Returns:
+            Dict containing cancellation response
+        """
+        params = {
+            "order_id": order_id,
+            "symbol": symbol
+        }
+
+        try:
+            return await self._request("POST", "/api/v1/private/order/cancel", params)
+        except aiohttp.ClientError as e:
+            print(f"Error canceling order: {e}")
+            return {"error": str(e)}
+
+# Example usage
+if __name__ == "__main__":
+    async def main():
+        mexc = AsyncMEXCFuturesAPI("YOUR_API_KEY", "YOUR_API_SECRET")
+        try:
+            order_response = await mexc.place_order(
+                symbol="BTC_USDT",
+                side="BUY",
+                order_type="LIMIT",
+                quantity=0.01,
+                price=30000,
+                leverage=10
+            )
+            print("Order Response:", order_response)
+        finally:
+            await close_async_sessions()
+
+    asyncio.run(main())
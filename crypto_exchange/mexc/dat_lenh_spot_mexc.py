@@ -1,10 +1,11 @@
-import hmac
-import hashlib
 import time
 import requests
 import json
 from typing import Optional, Dict, Any
 
+from crypto_exchange.common.http_transport import get_session
+from crypto_exchange.common.signing import HmacSigner
+
 class MEXCSpotAPI:
     def __init__(self, api_key: str, api_secret: str):
         """
@@ -17,6 +18,8 @@ class MEXCSpotAPI:
         self.api_key = api_key
         self.api_secret = api_secret
         self.base_url = "https://api.mexc.com"
+        self.session = get_session(self.base_url)
+        self.signer = HmacSigner(api_secret)
         
     def _generate_signature(self, params: Dict[str, Any]) -> str:
         """
@@ -28,13 +31,7 @@ class MEXCSpotAPI:
         Returns:
             str: Generated signature
         """
-        query_string = '&'.join([f"{k}={v}" for k, v in sorted(params.items())])
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        return self.signer.sign_params_hex(params)
         
     def _get_headers(self, params: Dict[str, Any]) -> Dict[str, str]:
         """
@@ -92,7 +89,7 @@ class MEXCSpotAPI:
         headers = self._get_headers(params)
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 url,
                 params=params,
                 headers=headers
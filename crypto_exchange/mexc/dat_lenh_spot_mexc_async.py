@@ -0,0 +1,71 @@
+import asyncio
+import json
+from typing import Optional, Dict, Any
+
+import aiohttp
+
+from crypto_exchange.common.async_http_transport import close_async_sessions, get_async_session
+from crypto_exchange.mexc.dat_lenh_spot_mexc import MEXCSpotAPI
+
+class AsyncMEXCSpotAPI(MEXCSpotAPI):
+    """asyncio counterpart of MEXCSpotAPI with the same method surface"""
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: float,
+        price: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Place a spot order on MEXC
+
+        Args:
+            symbol (str): Trading pair (e.g., 'BTCUSDT')
+            side (str): Order side ('BUY' or 'SELL')
+            order_type (str): Order type ('LIMIT' or 'MARKET')
+            quantity (float): Order quantity
+            price (float, optional): Order price (required for LIMIT orders)
+
+        Returns:
+            dict: Order response from MEXC
+        """
+        endpoint = "/api/v3/order"
+
+        params = {
+            'symbol': symbol,
+            'side': side,
+            'type': order_type,
+            'quantity': quantity
+        }
+
+        if order_type == 'LIMIT':
+            if price is None:
+                raise ValueError("Price is required for LIMIT orders")
+            params['price'] = price
+
+        headers = self._get_headers(params)
+        # aiohttp only accepts str/int/float query values
+        query = {key: str(value) for key, value in params.items()}
+
+        try:
+            session = get_async_session(self.base_url)
+            async with session.post(f"{self.base_url}{endpoint}", params=query, headers=headers) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+        except aiohttp.ClientError as e:
+            print(f"Error placing order: {e}")
+            return None
+
+# Example usage
+if __name__ == "__main__":
+    async def main():
+        mexc = AsyncMEXCSpotAPI("your_api_key", "your_api_secret")
+        try:
+            order = await mexc.place_order("BTCUSDT", "BUY", "LIMIT", 0.001, 50000)
+            print(json.dumps(order, indent=2))
+        finally:
+            await close_async_sessions()
+
+    asyncio.run(main())
@@ -1,24 +1,20 @@
-import requests
 import time
-import hmac
-import hashlib
-import base64
 from urllib.parse import urlencode
 
+from crypto_exchange.common.http_transport import get_session
+from crypto_exchange.common.signing import HmacSigner
+
 class MEXCAPI:
     def __init__(self, api_key, api_secret):
         self.api_key = api_key
         self.api_secret = api_secret
         self.base_url = "https://api.mexc.com"
+        self.session = get_session(self.base_url)
+        self.signer = HmacSigner(api_secret)
         
     def _get_signature(self, params):
-        query_string = urlencode(params)
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        # Signed in insertion order and URL-quoted, exactly as sent
+        return self.signer.sign_hex(urlencode(params))
 
     def get_spot_balance(self):
         endpoint = "/api/v3/account"
@@ -37,7 +33,7 @@ class MEXCAPI:
         params["signature"] = signature
         url = f"{self.base_url}{endpoint}?{urlencode(params)}"
         
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
         return response.json()
 
     def get_futures_balance(self):
@@ -57,9 +53,34 @@ class MEXCAPI:
         params["signature"] = signature
         url = f"{self.base_url}{endpoint}?{urlencode(params)}"
         
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
         return response.json()
 
+    def get_balance_rows(self, account='spot'):
+        """
+        Get non-zero balances in the portfolio aggregator's row format
+
+        Args:
+            account (str): 'spot' or 'futures'
+
+        Returns:
+            list: Dicts with asset, free, locked and total
+        """
+        rows = []
+        if account == 'spot':
+            for asset in self.get_spot_balance().get('balances', []):
+                free = float(asset['free'])
+                locked = float(asset['locked'])
+                if free + locked > 0:
+                    rows.append({'asset': asset['asset'], 'free': free, 'locked': locked, 'total': free + locked})
+        else:
+            balance = self.get_futures_balance()
+            total = float(balance.get('totalWalletBalance', 0))
+            free = float(balance.get('availableBalance', 0))
+            if total > 0:
+                rows.append({'asset': 'USDT', 'free': free, 'locked': total - free, 'total': total})
+        return rows
+
 def main():
     # Replace with your actual API credentials
     api_key = "YOUR_API_KEY"
@@ -1,7 +1,10 @@
-import ccxt
 import time
 from typing import Dict, Optional
 
+from crypto_exchange.common.client_registry import get_client
+from crypto_exchange.common.position_settings import get_position_settings
+from crypto_exchange.common.symbol_filters import get_symbol_filters
+
 class OKXFuturesTrader:
     def __init__(self, api_key: str, api_secret: str, password: str):
         """
@@ -12,15 +15,10 @@ class OKXFuturesTrader:
             api_secret (str): OKX API secret
             password (str): OKX API password
         """
-        self.exchange = ccxt.okx({
-            'apiKey': api_key,
-            'secret': api_secret,
-            'password': password,
-            'enableRateLimit': True,
-            'options': {
-                'defaultType': 'swap',  # Use swap for futures trading
-            }
-        })
+        # Use swap for futures trading
+        self.exchange = get_client('okx', api_key, api_secret, password, default_type='swap')
+        self.filters = get_symbol_filters('okx_swap')
+        self.settings = get_position_settings('okx', api_key)
     
     def place_market_order(self, symbol: str, side: str, size: float) -> Dict:
         """
@@ -35,11 +33,12 @@ class OKXFuturesTrader:
             Dict: Order response
         """
         try:
+            size, _ = self.filters.prepare(symbol, size)
             order = self.exchange.create_order(
                 symbol=symbol,
                 type='market',
                 side=side,
-                amount=size
+                amount=float(size)
             )
             return order
         except Exception as e:
@@ -60,18 +59,64 @@ class OKXFuturesTrader:
             Dict: Order response
         """
         try:
+            size, price = self.filters.prepare(symbol, size, price)
             order = self.exchange.create_order(
                 symbol=symbol,
                 type='limit',
                 side=side,
-                amount=size,
-                price=price
+                amount=float(size),
+                price=float(price)
             )
             return order
         except Exception as e:
             print(f"Error placing limit order: {e}")
             return None
     
+    def set_leverage(self, symbol: str, leverage: int, margin_mode: str = 'cross') -> Dict:
+        """
+        Set leverage for one margin mode, skipping the call when it is already set
+        
+        Args:
+            symbol (str): Trading pair symbol (e.g., 'BTC/USDT:USDT')
+            leverage (int): Leverage value
+            margin_mode (str): 'cross' or 'isolated' (OKX keeps leverage per mode)
+            
+        Returns:
+            Dict: Response, or None when nothing was sent or on error
+        """
+        try:
+            return self.settings.update(
+                symbol, ('leverage', margin_mode), leverage,
+                lambda: self.exchange.set_leverage(leverage, symbol, params={'mgnMode': margin_mode})
+            )
+        except Exception as e:
+            print(f"Error setting leverage: {e}")
+            return None
+    
+    def set_margin_mode(self, symbol: str, margin_mode: str, leverage: int) -> Dict:
+        """
+        Set the margin mode, skipping the call when it is already set
+        
+        Args:
+            symbol (str): Trading pair symbol (e.g., 'BTC/USDT:USDT')
+            margin_mode (str): 'cross' or 'isolated'
+            leverage (int): Leverage to use in that mode
+            
+        Returns:
+            Dict: Response, or None when nothing was sent or on error
+        """
+        try:
+            response = self.settings.update(
+                symbol, 'margin_mode', margin_mode,
+                lambda: self.exchange.set_margin_mode(margin_mode, symbol, params={'lever': leverage})
+            )
+            if response is not None:
+                self.settings.record(symbol, ('leverage', margin_mode), leverage)
+            return response
+        except Exception as e:
+            print(f"Error setting margin mode: {e}")
+            return None
+    
     def get_position(self, symbol: str) -> Dict:
         """
         Get current position for a symbol
@@ -1,6 +1,11 @@
-import ccxt
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+
+from crypto_exchange.common.batch_orders import chunked, order_result, place_concurrently, run_concurrently
+from crypto_exchange.common.client_registry import get_client
+
+# Maximum orders per /api/v5/trade/batch-orders request
+BATCH_ORDER_LIMIT = 20
 
 class OKXSpotTrader:
     def __init__(self, api_key: str, api_secret: str, password: str):
@@ -12,12 +17,7 @@ class OKXSpotTrader:
             api_secret (str): Your OKX API secret
             password (str): Your OKX API password
         """
-        self.exchange = ccxt.okx({
-            'apiKey': api_key,
-            'secret': api_secret,
-            'password': password,
-            'enableRateLimit': True,
-        })
+        self.exchange = get_client('okx', api_key, api_secret, password)
         
     def place_spot_order(
         self,
@@ -61,6 +61,67 @@ class OKXSpotTrader:
             print(f"Error placing order: {str(e)}")
             raise
             
+    def place_orders(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Place many spot orders, 20 per batch request
+
+        Falls back to concurrent single orders when the ccxt version in use
+        does not expose OKX's batch endpoint.
+
+        Args:
+            batch (List[Dict[str, Any]]): Order dicts with the place_spot_order
+                argument names: symbol, side, order_type, amount, price
+
+        Returns:
+            List[Dict[str, Any]]: One {'index', 'success', 'order', 'error'} dict per order
+        """
+        if not self.exchange.has.get('createOrders'):
+            return place_concurrently(
+                lambda order: self.place_spot_order(**order),
+                batch,
+                is_error=lambda placed: None
+            )
+
+        # Entries without a limit price are reported here and never sent
+        results: List[Optional[Dict[str, Any]]] = [None] * len(batch)
+        entries = []
+        for index, order in enumerate(batch):
+            if order['order_type'] == 'limit' and order.get('price') is None:
+                results[index] = order_result(index, error="Price is required for limit orders")
+                continue
+            entries.append((index, {
+                'symbol': order['symbol'],
+                'type': order['order_type'],
+                'side': order['side'],
+                'amount': order['amount'],
+                'price': order.get('price'),
+            }))
+
+        chunks = list(chunked(entries, BATCH_ORDER_LIMIT))
+        responses = run_concurrently([
+            lambda chunk=chunk: self.exchange.create_orders([request for _, request in chunk])
+            for chunk in chunks
+        ])
+
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, Exception):
+                print(f"Error placing batch orders: {str(response)}")
+                for index, _ in chunk:
+                    results[index] = order_result(index, error=str(response))
+                continue
+            for i, (index, _) in enumerate(chunk):
+                if i >= len(response):
+                    results[index] = order_result(index, error="Not acknowledged")
+                    continue
+                placed = response[i]
+                # OKX reports per-order rejections with a non-zero sCode
+                info = placed.get('info') or {}
+                if info.get('sCode', '0') != '0':
+                    results[index] = order_result(index, error=f"{info.get('sCode')}: {info.get('sMsg')}")
+                else:
+                    results[index] = order_result(index, placed)
+        return results
+
     def get_order_status(self, order_id: str, symbol: str) -> Dict[str, Any]:
         """
         Get the status of an order
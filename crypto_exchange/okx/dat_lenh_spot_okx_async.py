@@ -0,0 +1,113 @@
+import asyncio
+from typing import Optional, Dict, Any
+
+import ccxt.async_support as ccxt_async
+
+class AsyncOKXSpotTrader:
+    def __init__(self, api_key: str, api_secret: str, password: str):
+        """
+        Initialize async OKX spot trader (asyncio counterpart of OKXSpotTrader)
+
+        Args:
+            api_key (str): Your OKX API key
+            api_secret (str): Your OKX API secret
+            password (str): Your OKX API password
+        """
+        self.exchange = ccxt_async.okx({
+            'apiKey': api_key,
+            'secret': api_secret,
+            'password': password,
+            'enableRateLimit': True,
+        })
+
+    async def close(self):
+        """Release the underlying aiohttp session"""
+        await self.exchange.close()
+
+    async def place_spot_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        amount: float,
+        price: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Place a spot order on OKX
+
+        Args:
+            symbol (str): Trading pair (e.g., 'BTC/USDT')
+            side (str): 'buy' or 'sell'
+            order_type (str): 'limit' or 'market'
+            amount (float): Amount to buy/sell
+            price (float, optional): Price for limit orders
+
+        Returns:
+            Dict[str, Any]: Order response from OKX
+        """
+        try:
+            params = {}
+            if order_type == 'limit':
+                if price is None:
+                    raise ValueError("Price is required for limit orders")
+                params['price'] = price
+
+            return await self.exchange.create_order(
+                symbol=symbol,
+                type=order_type,
+                side=side,
+                amount=amount,
+                params=params
+            )
+
+        except Exception as e:
+            print(f"Error placing order: {str(e)}")
+            raise
+
+    async def get_order_status(self, order_id: str, symbol: str) -> Dict[str, Any]:
+        """
+        Get the status of an order
+
+        Args:
+            order_id (str): Order ID to check
+            symbol (str): Trading pair
+
+        Returns:
+            Dict[str, Any]: Order status information
+        """
+        try:
+            return await self.exchange.fetch_order(order_id, symbol)
+        except Exception as e:
+            print(f"Error getting order status: {str(e)}")
+            raise
+
+    async def cancel_order(self, order_id: str, symbol: str) -> Dict[str, Any]:
+        """
+        Cancel an order
+
+        Args:
+            order_id (str): Order ID to cancel
+            symbol (str): Trading pair
+
+        Returns:
+            Dict[str, Any]: Cancellation response
+        """
+        try:
+            return await self.exchange.cancel_order(order_id, symbol)
+        except Exception as e:
+            print(f"Error canceling order: {str(e)}")
+            raise
+
+# Example usage
+if __name__ == "__main__":
+    async def main():
+        trader = AsyncOKXSpotTrader("your_api_key", "your_api_secret", "your_api_password")
+        try:
+            order = await trader.place_spot_order("BTC/USDT", "buy", "limit", 0.001, 50000)
+            print(f"Order placed successfully: {order}")
+            status = await trader.get_order_status(order['id'], "BTC/USDT")
+            print(f"Order status: {status}")
+        finally:
+            await trader.close()
+
+    asyncio.run(main())
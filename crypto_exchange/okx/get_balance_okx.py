@@ -1,7 +1,8 @@
-import ccxt
 import pandas as pd
 from datetime import datetime
 
+from crypto_exchange.common.client_registry import get_client
+
 def get_okx_balance(api_key, secret_key, passphrase):
     """
     Get spot and futures balance from OKX exchange
@@ -14,13 +15,8 @@ def get_okx_balance(api_key, secret_key, passphrase):
     Returns:
         tuple: (spot_balance_df, futures_balance_df)
     """
-    # Initialize OKX exchange
-    exchange = ccxt.okx({
-        'apiKey': api_key,
-        'secret': secret_key,
-        'password': passphrase,
-        'enableRateLimit': True,
-    })
+    # Shared OKX exchange instance
+    exchange = get_client('okx', api_key, secret_key, passphrase)
     
     # Get spot balance
     spot_balance = exchange.fetch_balance()
@@ -52,6 +48,29 @@ def get_okx_balance(api_key, secret_key, passphrase):
     
     return spot_balance_df, futures_balance_df
 
+def get_balance_rows(exchange, account='spot'):
+    """
+    Get non-zero balances in the portfolio aggregator's row format
+
+    Args:
+        exchange (ccxt.okx): OKX exchange instance
+        account (str): 'spot' or 'futures'
+
+    Returns:
+        list: Dicts with asset, free, locked and total
+    """
+    balance = exchange.fetch_balance({'type': 'futures'} if account == 'futures' else {})
+    rows = []
+    for currency, total in balance['total'].items():
+        if total and total > 0:
+            rows.append({
+                'asset': currency,
+                'free': balance['free'][currency] or 0.0,
+                'locked': balance['used'][currency] or 0.0,
+                'total': total
+            })
+    return rows
+
 if __name__ == "__main__":
     # Replace with your API credentials
     API_KEY = "your_api_key"
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from crypto_exchange.bitget.dat_lenh_futures_bitget_async import AsyncBitgetFuturesAPI
+from crypto_exchange.common.symbol_filters import OrderValidationError
+from crypto_exchange.mexc.dat_lenh_futures_mexc_async import AsyncMEXCFuturesAPI
+
+
+class FakeFilters:
+    def prepare(self, symbol, qty, price=None):
+        if qty <= 0:
+            raise OrderValidationError(f"{symbol}: quantity {qty} below minimum 0")
+        return Decimal(str(qty)), Decimal(str(price)) if price is not None else None
+
+
+class FakeMEXC(AsyncMEXCFuturesAPI):
+    def __init__(self):
+        super().__init__('key', 'secret')
+        self.sent = []
+
+    async def _request(self, method, endpoint, params):
+        self.sent.append(params)
+        await asyncio.sleep(0)
+        if params['symbol'] == 'DOWN_USDT':
+            raise OSError("connection reset")
+        if params['side'] == 'BAD':
+            return {"success": False, "code": 2005, "message": "Balance insufficient"}
+        return {"success": True, "code": 0, "data": len(self.sent)}
+
+
+def test_mexc_async_place_orders_awaits_every_order():
+    client = FakeMEXC()
+    batch = [
+        dict(symbol='BTC_USDT', side='BUY', order_type='LIMIT', quantity=0.01, price=30000),
+        dict(symbol='BTC_USDT', side='BAD', order_type='MARKET', quantity=0.01),
+        dict(symbol='DOWN_USDT', side='BUY', order_type='MARKET', quantity=1),
+        dict(symbol='BTC_USDT', sid='typo', order_type='MARKET', quantity=1),
+    ]
+    results = asyncio.run(client.place_orders(batch))
+
+    assert [r['index'] for r in results] == [0, 1, 2, 3]
+    assert results[0]['success'] and results[0]['order']['success']
+    assert results[1]['error'] == "2005: Balance insufficient"
+    assert results[2]['error'] == "connection reset"
+    assert not results[3]['success'] and 'sid' in results[3]['error']
+    assert len(client.sent) == 3
+
+
+class FakeBitget(AsyncBitgetFuturesAPI):
+    def __init__(self):
+        super().__init__('key', 'secret', 'passphrase')
+        self.filters = FakeFilters()
+        self.sent = []
+        self.account_threads = []
+
+    async def _request(self, method, endpoint, body=None, params=None):
+        self.sent.append((endpoint, body))
+        orders = body['orderDataList']
+        return {"code": "00000", "data": {
+            "orderInfo": [{"clientOid": o['clientOid'], "orderId": o['size']} for o in orders if o['side'] != 'bad'],
+            "failure": [{"clientOid": o['clientOid'], "errorMsg": "rejected"} for o in orders if o['side'] == 'bad'],
+        }}
+
+    def _post_account(self, endpoint, body):
+        self.account_threads.append(threading.current_thread())
+        return {"code": "00000"}
+
+
+def test_bitget_async_place_orders_uses_the_event_loop():
+    client = FakeBitget()
+    batch = [
+        dict(symbol='BTCUSDT_UMCBL', side='open_long', size=1, price=30000),
+        dict(symbol='ETHUSDT_UMCBL', side='open_long', size=2),
+        dict(symbol='BTCUSDT_UMCBL', side='bad', size=3, price=30000),
+        dict(symbol='BTCUSDT_UMCBL', side='open_long', size=0),
+    ]
+    results = asyncio.run(client.place_orders(batch))
+
+    assert [r['success'] for r in results] == [True, True, False, False]
+    assert results[0]['order']['orderId'] == '1'
+    assert results[2]['error'] == "rejected"
+    assert 'below minimum' in results[3]['error']
+    assert sorted(body['symbol'] for _, body in client.sent) == ['BTCUSDT_UMCBL', 'ETHUSDT_UMCBL']
+
+
+def test_bitget_async_settings_do_not_block_the_loop():
+    client = FakeBitget()
+
+    async def main():
+        first = await client.set_leverage('BTCUSDT_UMCBL', 10)
+        again = await client.set_leverage('BTCUSDT_UMCBL', 10)
+        mode = await client.set_margin_mode('BTCUSDT_UMCBL', 'cross')
+        return first, again, mode
+
+    first, again, mode = asyncio.run(main())
+    assert first == {"code": "00000"} and again is None and mode == {"code": "00000"}
+    assert len(client.account_threads) == 2
+    assert threading.main_thread() not in client.account_threads
@@ -0,0 +1,27 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from crypto_exchange.common import async_http_transport
+from crypto_exchange.common.async_http_transport import close_async_sessions, get_async_session
+
+
+def test_each_loop_gets_its_own_session():
+    async def session_of_this_loop(close):
+        session = get_async_session("https://api.bybit.com/v5/market/tickers")
+        assert get_async_session("https://API.bybit.com") is session
+        if close:
+            await close_async_sessions()
+            assert session.closed
+        return session, asyncio.get_running_loop()
+
+    first, first_loop = asyncio.run(session_of_this_loop(close=False))
+    second, second_loop = asyncio.run(session_of_this_loop(close=True))
+
+    assert second is not first
+    assert first_loop.is_closed()
+    # The loop that was never cleaned up is forgotten once another loop asks for a session
+    assert first_loop not in async_http_transport._sessions
+    assert second_loop not in async_http_transport._sessions
@@ -0,0 +1,72 @@
+import json
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from crypto_exchange.binance.backfill_klines_binance import KlineBackfiller, load_klines
+
+HOUR = 3_600_000
+
+
+def ms(year, month, day=1):
+    return int(datetime(year, month, day, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeKlineSession:
+    """Serves hourly candles up to and including the one forming now, like /api/v3/klines"""
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, params):
+        self.requests.append((params['startTime'], params['endTime']))
+        now = int(time.time() * 1000)
+        first = -(-params['startTime'] // HOUR) * HOUR
+        last = min(params['endTime'], now)
+        rows = [
+            [ts, "1.0", "2.0", "0.5", "1.5", "10.0", ts + HOUR - 1, "15.0", 3, "5.0", "7.5", "0"]
+            for ts in range(first, last + 1, HOUR)
+        ][:params['limit']]
+        return FakeResponse(json.dumps(rows).encode())
+
+
+def backfiller(tmp_path):
+    filler = KlineBackfiller(str(tmp_path))
+    filler.session = FakeKlineSession()
+    return filler
+
+
+def test_hole_between_backfills_is_fetched(tmp_path):
+    filler = backfiller(tmp_path)
+    filler.backfill('BTCUSDT', '1h', ms(2024, 1), ms(2024, 3) - 1)
+    filler.backfill('BTCUSDT', '1h', ms(2024, 6), ms(2024, 8) - 1)
+    assert filler.missing_ranges('BTCUSDT', '1h', ms(2024, 1), ms(2024, 8) - 1) == [(ms(2024, 3), ms(2024, 6) - 1)]
+
+    filler.session.requests.clear()
+    written = filler.backfill('BTCUSDT', '1h', ms(2024, 1), ms(2024, 8) - 1)
+    assert written == (ms(2024, 6) - ms(2024, 3)) // HOUR
+    assert all(ms(2024, 3) <= start and end < ms(2024, 6) for start, end in filler.session.requests)
+
+    timestamps = load_klines(str(tmp_path), 'BTCUSDT', '1h')['timestamp']
+    np.testing.assert_array_equal(timestamps, np.arange(ms(2024, 1), ms(2024, 8), HOUR))
+    assert filler.missing_ranges('BTCUSDT', '1h', ms(2024, 1), ms(2024, 8) - 1) == []
+
+
+def test_forming_candle_is_not_stored(tmp_path):
+    filler = backfiller(tmp_path)
+    now = int(time.time() * 1000)
+    forming = now - now % HOUR
+    filler.backfill('BTCUSDT', '1h', forming - 5 * HOUR)
+    filler.backfill('BTCUSDT', '1h', forming - 5 * HOUR, forming + HOUR)
+    timestamps = load_klines(str(tmp_path), 'BTCUSDT', '1h')['timestamp']
+    assert timestamps[-1] == forming - HOUR
+    assert len(timestamps) == 5
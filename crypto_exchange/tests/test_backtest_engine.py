@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from crypto_exchange.backtest.engine import (EXIT_END, EXIT_SIGNAL, EXIT_STOP_LOSS, EXIT_TAKE_PROFIT, LIMIT,
+                                             STOP_MARKET, run_backtest)
+from crypto_exchange.binance.getOHLCV_binance import KLINE_DTYPE
+
+MINUTE = 60_000
+NO_FEES = dict(taker_fee=0.0, maker_fee=0.0)
+
+
+def candles(*rows):
+    """KLINE_DTYPE candles from (open, high, low, close) rows, one minute apart"""
+    klines = np.zeros(len(rows), dtype=KLINE_DTYPE)
+    klines['timestamp'] = np.arange(len(rows)) * MINUTE
+    for name, column in zip(('open', 'high', 'low', 'close'), zip(*rows)):
+        klines[name] = column
+    return klines
+
+
+def signals(n, **bars):
+    out = np.zeros(n, dtype=np.int8)
+    for bar, side in bars.items():
+        out[int(bar[1:])] = side
+    return out
+
+
+@pytest.mark.parametrize('order_type, side, price, second_bar, expected', [
+    # Limit buy at 100: a gap down opens below it and fills at the open
+    (LIMIT, 1, 100.0, (98, 99, 97, 98), 98.0),
+    (LIMIT, 1, 100.0, (102, 103, 99, 101), 100.0),
+    # Limit sell at 100: a gap up fills at the open
+    (LIMIT, -1, 100.0, (103, 104, 102, 103), 103.0),
+    # Stop buy at 105: a gap through the stop fills at the worse open
+    (STOP_MARKET, 1, 105.0, (107, 108, 106, 107), 107.0),
+    (STOP_MARKET, 1, 105.0, (102, 106, 101, 104), 105.0),
+    # Stop sell at 95: a gap down fills at the open
+    (STOP_MARKET, -1, 95.0, (92, 93, 91, 92), 92.0),
+])
+def test_limit_and_stop_entries_fill_through_gaps(order_type, side, price, second_bar, expected):
+    klines = candles((100, 101, 99, 100), second_bar, (100, 101, 99, 100))
+    result = run_backtest(klines, signals(3, b0=side), order_type=order_type, entry_price=price, **NO_FEES)
+    assert len(result.trades) == 1
+    assert result.trades['entry_price'][0] == expected
+    assert result.trades['entry_time'][0] == MINUTE
+
+
+def test_entry_expires_after_order_ttl():
+    klines = candles((100, 101, 99, 100), (102, 103, 101, 102), (99, 100, 98, 99))
+    missed = run_backtest(klines, signals(3, b0=1), order_type=LIMIT, entry_price=100.0, **NO_FEES)
+    assert len(missed.trades) == 0
+    filled = run_backtest(klines, signals(3, b0=1), order_type=LIMIT, entry_price=100.0, order_ttl=2, **NO_FEES)
+    assert filled.trades['entry_time'][0] == 2 * MINUTE
+
+
+def test_stop_loss_wins_when_both_levels_are_in_one_candle():
+    klines = candles((100, 101, 99, 100), (100, 101, 99, 100), (100, 106, 94, 100), (100, 101, 99, 100))
+    result = run_backtest(klines, signals(4, b0=1), take_profit=105.0, stop_loss=95.0, **NO_FEES)
+    trade = result.trades[0]
+    assert trade['reason'] == EXIT_STOP_LOSS
+    assert trade['exit_price'] == 95.0
+    assert trade['exit_time'] == 2 * MINUTE
+
+
+@pytest.mark.parametrize('third_bar, reason, exit_price', [
+    ((90, 91, 89, 90), EXIT_STOP_LOSS, 90.0),      # gap through the stop exits at the worse open
+    ((107, 108, 106, 107), EXIT_TAKE_PROFIT, 107.0),  # gap through the target exits at the better open
+])
+def test_exits_fill_through_gaps(third_bar, reason, exit_price):
+    klines = candles((100, 101, 99, 100), (100, 101, 99, 100), third_bar, (100, 101, 99, 100))
+    trade = run_backtest(klines, signals(4, b0=1), take_profit=105.0, stop_loss=95.0, **NO_FEES).trades[0]
+    assert (trade['reason'], trade['exit_price']) == (reason, exit_price)
+
+
+def test_stop_hit_on_the_fill_candle_exits_at_the_stop():
+    klines = candles((100, 101, 99, 100), (100, 101, 90, 92), (92, 93, 91, 92))
+    trade = run_backtest(klines, signals(3, b0=1), stop_loss=95.0, **NO_FEES).trades[0]
+    assert trade['reason'] == EXIT_STOP_LOSS
+    assert trade['exit_price'] == 95.0
+    assert trade['entry_time'] == trade['exit_time'] == MINUTE
+
+
+def test_opposite_signal_reverses_and_equity_is_marked_to_market():
+    klines = candles(
+        (100, 101, 99, 100),
+        (100, 102, 99, 101),
+        (101, 103, 100, 102),
+        (103, 104, 101, 102),
+        (102, 102, 98, 99),
+    )
+    result = run_backtest(klines, signals(5, b0=1, b2=-1), initial_cash=1000.0, **NO_FEES)
+
+    long, short = result.trades
+    assert (long['side'], long['entry_price'], long['exit_price'], long['reason']) == (1, 100.0, 103.0, EXIT_SIGNAL)
+    assert (short['side'], short['entry_price'], short['exit_price'], short['reason']) == (-1, 103.0, 99.0, EXIT_END)
+    assert long['exit_time'] == short['entry_time'] == 3 * MINUTE
+    # Open positions are valued at each close; realized PnL lands on the exit candle
+    np.testing.assert_allclose(result.equity, [1000, 1001, 1002, 1004, 1007])
+    assert result.stats['trades'] == 2
+    assert result.stats['total_return'] == pytest.approx(0.007)
+
+
+def test_entry_fee_is_charged_while_the_position_is_open():
+    klines = candles((100, 101, 99, 100), (100, 102, 99, 101), (101, 103, 100, 103))
+    result = run_backtest(klines, signals(3, b0=1), qty=2.0, taker_fee=0.001, initial_cash=1000.0)
+    trade = result.trades[0]
+    assert trade['fees'] == pytest.approx(0.2)
+    assert trade['pnl'] == pytest.approx(2 * 3 - 0.2)
+    np.testing.assert_allclose(result.equity, [1000, 1000 + 2 * 1 - 0.2, 1000 + 2 * 3 - 0.2])
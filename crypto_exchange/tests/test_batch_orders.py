@@ -0,0 +1,36 @@
+from crypto_exchange.okx import dat_lenh_spot_okx
+from crypto_exchange.okx.dat_lenh_spot_okx import OKXSpotTrader
+
+
+class FakeOKX:
+    has = {'createOrders': True}
+
+    def __init__(self):
+        self.sent = []
+
+    def create_orders(self, requests):
+        self.sent.append(requests)
+        return [
+            {'id': str(len(self.sent)), 'info': {'sCode': '51008', 'sMsg': 'Insufficient balance'}}
+            if request['amount'] > 1 else {'id': str(len(self.sent)), 'info': {'sCode': '0'}}
+            for request in requests
+        ]
+
+
+def test_okx_limit_entry_without_price_does_not_abort_the_batch(monkeypatch):
+    exchange = FakeOKX()
+    monkeypatch.setattr(dat_lenh_spot_okx, 'get_client', lambda *args: exchange)
+    trader = OKXSpotTrader('key', 'secret', 'password')
+    batch = [
+        dict(symbol='BTC/USDT', side='buy', order_type='limit', amount=0.001, price=50000),
+        dict(symbol='BTC/USDT', side='buy', order_type='limit', amount=0.001),
+        dict(symbol='ETH/USDT', side='sell', order_type='market', amount=2),
+        dict(symbol='ETH/USDT', side='sell', order_type='market', amount=0.1),
+    ]
+    results = trader.place_orders(batch)
+
+    assert [r['index'] for r in results] == [0, 1, 2, 3]
+    assert [r['success'] for r in results] == [True, False, False, True]
+    assert results[1]['error'] == "Price is required for limit orders"
+    assert results[2]['error'] == "51008: Insufficient balance"
+    assert [request['symbol'] for request in exchange.sent[0]] == ['BTC/USDT', 'ETH/USDT', 'ETH/USDT']
@@ -0,0 +1,49 @@
+import numpy as np
+
+from crypto_exchange.binance.getOHLCV_binance import KLINE_DTYPE
+from crypto_exchange.common.candle_feeds import CandleSeries, resample
+
+MINUTE = 60_000
+
+
+def minutes(n, start=0):
+    klines = np.zeros(n, dtype=KLINE_DTYPE)
+    klines['timestamp'] = start + np.arange(n) * MINUTE
+    klines['open'] = 100 + np.arange(n)
+    klines['high'] = klines['open'] + 2
+    klines['low'] = klines['open'] - 1
+    klines['close'] = klines['open'] + 1
+    klines['volume'] = 10.0
+    return klines
+
+
+def test_streamed_buckets_match_resample():
+    klines = minutes(12)
+    series = CandleSeries('BTCUSDT', ('5m',))
+    for record in klines.tolist():
+        series.on_candle(*record[:5], record[5] / 2, closed=False)  # forming update first
+        series.on_candle(*record, closed=True)
+    np.testing.assert_array_equal(series['5m'], resample(klines, '5m'))
+
+
+def test_closed_minute_fed_twice_is_merged_once():
+    klines = minutes(3)
+    series = CandleSeries('BTCUSDT', ('5m',))
+    for record in klines[:2].tolist():
+        series.on_candle(*record, closed=True)
+    series.on_candle(*klines[1].tolist(), closed=True)
+    assert series['5m']['volume'][-1] == 20.0
+
+    # History overlapping what the stream already delivered
+    series.load_history(klines, now_ms=10 * MINUTE)
+    assert series['5m']['volume'][-1] == 30.0
+    assert len(series['1m']) == 3
+
+
+def test_repeated_last_minute_keeps_closed_bucket():
+    klines = minutes(5)
+    series = CandleSeries('BTCUSDT', ('5m',))
+    for record in klines.tolist():
+        series.on_candle(*record, closed=True)
+    series.on_candle(*klines[-1].tolist(), closed=True)
+    np.testing.assert_array_equal(series['5m'], resample(klines, '5m'))
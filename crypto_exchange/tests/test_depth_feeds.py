@@ -0,0 +1,145 @@
+import asyncio
+import json
+import os
+import zlib
+
+from crypto_exchange.common.depth_feeds import BinanceDepthSync, BitgetDepthSync, replay_frames, run_depth_stream
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'binance_btcusdt_depth.jsonl')
+
+# The session recorded in FIXTURE: the first snapshot is older than the buffered diffs
+FRAMES = [
+    {"e": "depthUpdate", "E": 1, "s": "BTCUSDT", "U": 101, "u": 103,
+     "b": [["100.00", "1.0"]], "a": [["101.00", "2.0"]]},
+    {"e": "depthUpdate", "E": 2, "s": "BTCUSDT", "U": 104, "u": 106,
+     "b": [["100.00", "1.5"], ["99.50", "3.0"]], "a": []},
+    {"e": "depthUpdate", "E": 3, "s": "BTCUSDT", "U": 107, "u": 108,
+     "b": [], "a": [["101.00", "0"], ["101.50", "4.0"]]},
+    {"e": "depthUpdate", "E": 4, "s": "BTCUSDT", "U": 109, "u": 109,
+     "b": [["99.00", "5.0"]], "a": []},
+]
+SNAPSHOTS = [
+    {"lastUpdateId": 95, "bids": [["99.00", "1.0"]], "asks": [["102.00", "1.0"]]},
+    {"lastUpdateId": 104, "bids": [["100.00", "1.0"], ["99.00", "1.0"]],
+     "asks": [["101.00", "2.0"], ["102.00", "1.0"]]},
+]
+FINAL_BIDS = [(100.0, 1.5), (99.5, 3.0), (99.0, 5.0)]
+FINAL_ASKS = [(101.5, 4.0), (102.0, 1.0)]
+
+
+class ScriptedBinanceSync(BinanceDepthSync):
+    def __init__(self, snapshots):
+        super().__init__('BTCUSDT')
+        self.snapshots = list(snapshots)
+        self.fetches = 0
+
+    def fetch_snapshot(self):
+        self.fetches += 1
+        return self.snapshots.pop(0) if len(self.snapshots) > 1 else self.snapshots[0]
+
+
+class FakeSocket:
+    def __init__(self, frames):
+        self.frames = [json.dumps(frame) for frame in frames]
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(message)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0)
+        if not self.frames:
+            raise OSError("connection reset")
+        return self.frames.pop(0)
+
+
+def connect_once(socket):
+    class Connect:
+        async def __aenter__(self):
+            return socket
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+    opened = []
+
+    def connect(url):
+        opened.append(url)
+        return Connect()
+
+    return connect, opened
+
+
+async def stream_until_drained(sync, socket, **kwargs):
+    connect, opened = connect_once(socket)
+    task = asyncio.ensure_future(run_depth_stream(sync, connect=connect, reconnect_delay=60, **kwargs))
+    while len(opened) < 1 or socket.frames:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.01)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+def test_replay_fixture_rebuilds_book():
+    updates = []
+    sync = replay_frames(FIXTURE, BinanceDepthSync('BTCUSDT'), on_update=lambda book: updates.append(book.update_id))
+    assert sync.synced
+    assert sync.book.update_id == 109
+    assert sync.book.depth(10) == (FINAL_BIDS, FINAL_ASKS)
+    assert updates == [106, 108, 109]
+
+
+def test_recorder_writes_what_replay_reads(tmp_path):
+    path = str(tmp_path / 'depth.jsonl')
+    sync = ScriptedBinanceSync(SNAPSHOTS)
+    asyncio.run(stream_until_drained(sync, FakeSocket(FRAMES), record_path=path, snapshot_retry=0))
+    assert sync.book.depth(10) == (FINAL_BIDS, FINAL_ASKS)
+
+    def strip_time(file_path):
+        with open(file_path, encoding='utf-8') as f:
+            return [{key: value for key, value in json.loads(line).items() if key != 't'} for line in f]
+
+    assert strip_time(path) == strip_time(FIXTURE)
+
+
+def test_stale_snapshot_is_not_refetched_on_every_frame():
+    sync = ScriptedBinanceSync(SNAPSHOTS[:1])  # always stale
+    asyncio.run(stream_until_drained(sync, FakeSocket(FRAMES), snapshot_retry=10))
+    assert sync.fetches == 1
+    assert not sync.synced
+
+
+def bitget_frame(action, seq, bids, asks, checksum=None):
+    data = {"bids": bids, "asks": asks, "seq": seq, "ts": "0"}
+    if checksum is not None:
+        data["checksum"] = checksum
+    return {"action": action, "arg": {"instType": "SPOT", "channel": "books", "instId": "BTCUSDT"}, "data": [data]}
+
+
+def bitget_checksum(bids, asks):
+    fields = []
+    for i in range(max(len(bids), len(asks))):
+        if i < len(bids):
+            fields.extend(bids[i])
+        if i < len(asks):
+            fields.extend(asks[i])
+    checksum = zlib.crc32(':'.join(fields).encode())
+    return checksum - (1 << 32) if checksum >= 1 << 31 else checksum
+
+
+def test_bitget_checksum_catches_lost_frame():
+    sync = BitgetDepthSync('BTCUSDT')
+    sync.on_message(bitget_frame('snapshot', 10, [["100.0", "1"]], [["101.0", "1"]]))
+    book_after_two = ([["100.5", "2"], ["100.0", "1"]], [["101.0", "1"]])
+
+    # Frame 11 adds 100.5 and is verified against the checksum
+    assert sync.on_message(bitget_frame('update', 11, [["100.5", "2"]], [], bitget_checksum(*book_after_two)))
+
+    # Frame 12 is lost; frame 13's checksum covers a level we never saw
+    expected = ([["100.5", "2"], ["100.0", "1"]], [["100.8", "3"], ["101.0", "1"]])
+    assert not sync.on_message(bitget_frame('update', 13, [], [], bitget_checksum(*expected)))
+    assert sync.needs_resubscribe
+    assert sync.resyncs == 1
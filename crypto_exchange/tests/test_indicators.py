@@ -0,0 +1,103 @@
+import math
+
+import numpy as np
+import pytest
+
+from crypto_exchange.common import indicators
+
+NAN = math.nan
+DAY = 86_400_000
+HOUR = 3_600_000
+
+# Short fixed series shared by the incremental-vs-vectorized checks
+CLOSES = [10.0, 11.0, 12.5, 12.0, 13.0, 12.0, 11.5, 13.5, 14.0, 13.0, 15.0, 14.5]
+HIGHS = [c + 0.5 for c in CLOSES]
+LOWS = [c - 1.0 for c in CLOSES]
+VOLUMES = [3.0, 1.0, 2.0, 5.0, 4.0, 1.0, 2.0, 3.0, 6.0, 2.0, 1.0, 4.0]
+TIMESTAMPS = [DAY - 4 * HOUR + i * HOUR for i in range(len(CLOSES))]
+
+
+def assert_series(actual, expected):
+    actual, expected = np.asarray(actual, dtype=float), np.asarray(expected, dtype=float)
+    np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
+    np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=1e-12)
+
+
+def stream(indicator, *columns):
+    return [indicator.update(*row) for row in zip(*columns)]
+
+
+def test_nan_warm_up():
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert_series(indicators.sma(values, 3), [NAN, NAN, 2.0, 3.0, 4.0])
+    assert_series(stream(indicators.SMA(3), values), [NAN, NAN, 2.0, 3.0, 4.0])
+    # alpha = 0.5, seeded with the mean of the first three
+    assert_series(indicators.ema(values, 3), [NAN, NAN, 2.0, 3.0, 4.0])
+    assert_series(stream(indicators.EMA(3), values), [NAN, NAN, 2.0, 3.0, 4.0])
+    # ema() of indicator output starts counting at the first valid value
+    assert_series(indicators.ema([NAN, NAN] + values, 3), [NAN, NAN, NAN, NAN, 2.0, 3.0, 4.0])
+    assert_series(indicators.sma(values[:2], 3), [NAN, NAN])
+
+
+def test_period_one_is_the_input():
+    assert_series(indicators.sma(CLOSES, 1), CLOSES)
+    assert_series(indicators.ema(CLOSES, 1), CLOSES)
+    assert_series(stream(indicators.SMA(1), CLOSES), CLOSES)
+    assert_series(stream(indicators.EMA(1), CLOSES), CLOSES)
+
+
+def test_rsi_of_flat_series_is_fifty():
+    flat = [100.0] * 20
+    expected = [NAN] * 14 + [50.0] * 6
+    assert_series(indicators.rsi(flat, 14), expected)
+    assert_series(stream(indicators.RSI(14), flat), expected)
+
+
+def test_vwap_resets_every_session():
+    prices = [10.0, 20.0, 30.0, 40.0]
+    volumes = [1.0, 1.0, 2.0, 2.0]
+    timestamps = [DAY - 2 * HOUR, DAY - HOUR, DAY, DAY + HOUR]
+    expected = [10.0, 15.0, 30.0, 35.0]
+    assert_series(indicators.vwap(prices, prices, prices, volumes, timestamps), expected)
+    assert_series(stream(indicators.VWAP(), prices, prices, prices, volumes, timestamps), expected)
+
+    running = [10.0, 15.0, 22.5, 170.0 / 6]
+    assert_series(indicators.vwap(prices, prices, prices, volumes, timestamps, session_ms=None), running)
+    assert_series(stream(indicators.VWAP(session_ms=None), prices, prices, prices, volumes, timestamps), running)
+
+
+def test_atr_and_bollinger_small_cases():
+    high, low, close = [10.0, 11.0, 12.0, 10.0], [8.0, 9.0, 10.0, 7.0], [9.0, 10.0, 11.0, 8.0]
+    # True ranges 2, 2, 2, 4; Wilder average over two from the second candle on
+    assert_series(indicators.atr(high, low, close, 2), [NAN, NAN, 2.0, 3.0])
+    assert_series(stream(indicators.ATR(2), high, low, close), [NAN, NAN, 2.0, 3.0])
+
+    middle, upper, lower = indicators.bollinger_bands([1.0, 3.0, 5.0], 2, 2.0)
+    assert_series(middle, [NAN, 2.0, 4.0])
+    assert_series(upper, [NAN, 4.0, 6.0])
+    assert_series(lower, [NAN, 0.0, 2.0])
+
+
+@pytest.mark.parametrize('name, vectorized, incremental, columns', [
+    ('sma', lambda: indicators.sma(CLOSES, 4), indicators.SMA(4), (CLOSES,)),
+    ('ema', lambda: indicators.ema(CLOSES, 4), indicators.EMA(4), (CLOSES,)),
+    ('rsi', lambda: indicators.rsi(CLOSES, 4), indicators.RSI(4), (CLOSES,)),
+    ('atr', lambda: indicators.atr(HIGHS, LOWS, CLOSES, 4), indicators.ATR(4), (HIGHS, LOWS, CLOSES)),
+    ('vwap', lambda: indicators.vwap(HIGHS, LOWS, CLOSES, VOLUMES, TIMESTAMPS), indicators.VWAP(),
+     (HIGHS, LOWS, CLOSES, VOLUMES, TIMESTAMPS)),
+])
+def test_incremental_matches_vectorized(name, vectorized, incremental, columns):
+    assert_series(stream(incremental, *columns), vectorized())
+
+
+def test_bands_and_macd_incremental_match_vectorized():
+    bands = stream(indicators.BollingerBands(4), CLOSES)
+    for expected, column in zip(indicators.bollinger_bands(CLOSES, 4), zip(*bands)):
+        assert_series(column, expected)
+
+    line, signal, histogram = indicators.macd(CLOSES, 3, 5, 2)
+    assert_series(line, indicators.ema(CLOSES, 3) - indicators.ema(CLOSES, 5))
+    assert_series(signal, indicators.ema(line, 2))
+    streamed = stream(indicators.MACD(3, 5, 2), CLOSES)
+    assert_series([value[1] for value in streamed], signal)
+    assert_series([value[2] for value in streamed], histogram)
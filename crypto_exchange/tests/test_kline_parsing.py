@@ -0,0 +1,35 @@
+import json
+
+import numpy as np
+import pytest
+
+from crypto_exchange.binance.getOHLCV_binance import format_klines, parse_klines_array
+
+ROWS = [
+    [1704067200000, "42000.10", "42050.00", "41990.5", "42010.00000000", "12.5",
+     1704067259999, "525125.0", 310, "6.0", "252060.0", "0"],
+    [1704067260000, "42010.00", "42020.00", "42000.0", "42001.00000000", "1e-3",
+     1704067319999, "42.0", 2, "0.0005", "21.0", "0"],
+]
+
+
+def test_matches_list_of_dicts():
+    payload = json.dumps(ROWS).encode()
+    records = parse_klines_array(payload)
+    dicts = format_klines(ROWS)
+    assert list(records['timestamp']) == [1704067200000, 1704067260000]
+    for name in ('open', 'high', 'low', 'close', 'volume'):
+        np.testing.assert_array_equal(records[name], [k[name] for k in dicts])
+    assert len(parse_klines_array(b'[]')) == 0
+
+
+@pytest.mark.parametrize('payload', [
+    json.dumps([ROWS[0][:5] + ["12.5x"] + ROWS[0][6:]]),
+    json.dumps([ROWS[0], ROWS[1][:11]]),
+    json.dumps([ROWS[0][:8]]),
+    json.dumps(ROWS)[:-20],
+    '{"code": -1121, "msg": "Invalid symbol."}',
+])
+def test_malformed_payload_raises(payload):
+    with pytest.raises(ValueError):
+        parse_klines_array(payload)
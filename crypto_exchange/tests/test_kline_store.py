@@ -0,0 +1,123 @@
+import multiprocessing
+import threading
+import time
+
+import numpy as np
+
+from crypto_exchange.binance.getOHLCV_binance import KLINE_DTYPE
+from crypto_exchange.common.kline_store import MIN_GROWTH, KlineFile, KlineStore
+
+MINUTE = 60_000
+
+
+def candles(first, count):
+    """Minute candles whose prices and volume are derived from their position"""
+    klines = np.zeros(count, dtype=KLINE_DTYPE)
+    index = np.arange(first, first + count)
+    klines['timestamp'] = index * MINUTE
+    for name in ('open', 'high', 'low', 'close'):
+        klines[name] = index
+    klines['volume'] = index * 2
+    return klines
+
+
+def watch(path, total, started=None):
+    """Read while a writer appends; returns (reads, error or None)"""
+    reader = KlineFile(path)
+    reads = 0
+    while True:
+        records = reader.records()
+        reads += 1
+        if started is not None:
+            started.set()
+        index = np.arange(len(records))
+        if not (np.array_equal(records['timestamp'], index * MINUTE)
+                and np.array_equal(records['close'], index)
+                and np.array_equal(records['volume'], index * 2)):
+            return reads, f"inconsistent view of {len(records)} records"
+        if len(records) >= total:
+            return reads, None
+
+
+def watch_in_process(path, total, started, queue):
+    queue.put(watch(path, total, started))
+
+
+def append_in_chunks(path, total, chunk=997):
+    writer = KlineFile(path)
+    for first in range(0, total, chunk):
+        writer.append(candles(first, min(chunk, total - first)))
+        time.sleep(0.001)  # give the reader a chance to run between appends
+    return writer
+
+
+def test_overlapping_appends_are_deduplicated(tmp_path):
+    kline_file = KlineFile(str(tmp_path / 'BTCUSDT' / '1m.klines'))
+    assert kline_file.append(candles(0, 10)) == 10
+    assert kline_file.append(candles(5, 10)) == 5
+    assert kline_file.append(candles(0, 15)) == 0
+    # Unsorted input with repeats is sorted and deduplicated first
+    assert kline_file.append(np.concatenate([candles(17, 3), candles(15, 4)])) == 5
+    np.testing.assert_array_equal(kline_file.records(), candles(0, 20))
+
+
+def test_read_bounds_are_inclusive(tmp_path):
+    store = KlineStore(str(tmp_path))
+    store.append('btcusdt', '1m', candles(0, 10))
+
+    def read(start, end):
+        return list(store.read('BTCUSDT', '1m', start, end)['timestamp'] // MINUTE)
+
+    assert read(2 * MINUTE, 4 * MINUTE) == [2, 3, 4]
+    assert read(2 * MINUTE + 1, 4 * MINUTE - 1) == [3]
+    assert read(None, MINUTE) == [0, 1]
+    assert read(8 * MINUTE, None) == [8, 9]
+    assert read(-MINUTE, 100 * MINUTE) == list(range(10))
+    assert read(20 * MINUTE, 30 * MINUTE) == []
+    assert len(store.read('ETHUSDT', '1m')) == 0
+    assert not store.read('BTCUSDT', '1m').flags.writeable
+
+
+def test_reopened_file_continues_where_it_stopped(tmp_path):
+    path = str(tmp_path / '1m.klines')
+    KlineFile(path).append(candles(0, 100))
+
+    reopened = KlineFile(path)
+    assert len(reopened) == 100
+    assert reopened.last_timestamp == 99 * MINUTE
+    assert reopened.append(candles(50, 100)) == 50
+    np.testing.assert_array_equal(KlineFile(path).records(), candles(0, 150))
+
+
+def test_reader_thread_sees_only_whole_records_across_a_grow(tmp_path):
+    path = str(tmp_path / '1m.klines')
+    total = 2 * MIN_GROWTH + 1000
+    KlineFile(path).append(candles(0, 1))
+    result = []
+    reader = threading.Thread(target=lambda: result.append(watch(path, total)))
+    reader.start()
+    writer = append_in_chunks(path, total)
+    reader.join(timeout=60)
+
+    reads, error = result[0]
+    assert error is None
+    assert reads > 1
+    assert writer._capacity >= total > MIN_GROWTH
+
+
+def test_reader_process_sees_only_whole_records_across_a_grow(tmp_path):
+    path = str(tmp_path / '1m.klines')
+    total = 2 * MIN_GROWTH + 1000
+    KlineFile(path).append(candles(0, 1))
+    context = multiprocessing.get_context('spawn')
+    started, queue = context.Event(), context.Queue()
+    reader = context.Process(target=watch_in_process, args=(path, total, started, queue))
+    reader.start()
+    assert started.wait(timeout=60)
+    append_in_chunks(path, total)
+    reads, error = queue.get(timeout=60)
+    reader.join(timeout=60)
+
+    assert error is None
+    assert reads > 1
+    np.testing.assert_array_equal(KlineFile(path).records(), candles(0, total))
@@ -0,0 +1,168 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from crypto_exchange.common.order_tracker import (
+    CANCELED, FILLED, NEW, PARTIALLY_FILLED, OrderTracker, OrderUpdate, UserStream, run_user_stream
+)
+
+
+def frame(order_id, status, filled=0.0):
+    return json.dumps({"topic": "order", "id": order_id, "status": status, "filled": filled})
+
+
+class FakeStream(UserStream):
+    venue = 'fake'
+    ws_url = 'wss://fake'
+
+    def __init__(self, rest=None):
+        self.rest = rest or {}  # order_id -> (status, filled) returned by fetch_order
+        self.fetched = []
+        self.closed = False
+
+    def parse(self, message):
+        if message.get('topic') != 'order':
+            return []
+        return [OrderUpdate(message['id'], message['status'], message['filled'])]
+
+    def fetch_order(self, order):
+        self.fetched.append(order.order_id)
+        if order.order_id not in self.rest:
+            return None
+        status, filled = self.rest[order.order_id]
+        return OrderUpdate(order.order_id, status, filled, raw={})
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSocket:
+    def __init__(self, frames, error=None):
+        self.frames = list(frames)
+        self.error = error
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(message)
+
+    async def recv(self):
+        return self.frames.pop(0)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0)
+        if self.frames:
+            return self.frames.pop(0)
+        if self.error is not None:
+            raise self.error
+        raise StopAsyncIteration  # clean close by the server
+
+
+class FakeConnect:
+    """connect() stand-in handing out scripted sockets, then hanging like an idle connection"""
+
+    def __init__(self, *sockets):
+        self.sockets = list(sockets)
+        self.opened = []
+
+    def __call__(self, url):
+        return self
+
+    async def __aenter__(self):
+        self.opened.append(time.monotonic())
+        if not self.sockets:
+            await asyncio.Event().wait()
+        return self.sockets.pop(0)
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+async def run_until(tracker, stream, connect, order_id, reconnect_delay=0.0, timeout=1.0):
+    task = asyncio.ensure_future(run_user_stream(stream, tracker, connect, reconnect_delay))
+    try:
+        return await tracker.wait(order_id, timeout)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+def test_fill_wakes_waiter():
+    async def main():
+        tracker = OrderTracker()
+        tracker.track('1', 'BTCUSDT')
+        stream = FakeStream()
+        connect = FakeConnect(FakeSocket([frame('1', NEW), frame('1', PARTIALLY_FILLED, 0.4),
+                                          frame('1', FILLED, 1.0)]))
+        order = await run_until(tracker, stream, connect, '1')
+        assert order.status == FILLED
+        assert order.filled_qty == 1.0
+        assert stream.closed
+
+    asyncio.run(main())
+
+
+def test_stale_frames_do_not_move_order_backwards():
+    tracker = OrderTracker()
+    assert tracker.apply(OrderUpdate('1', PARTIALLY_FILLED, 0.5, raw={}))
+    assert not tracker.apply(OrderUpdate('1', NEW, 0.0, raw={}))
+    assert not tracker.apply(OrderUpdate('1', PARTIALLY_FILLED, 0.3, raw={}))
+    assert tracker.apply(OrderUpdate('1', CANCELED, 0.5, raw={}))
+    assert not tracker.apply(OrderUpdate('1', FILLED, 1.0, raw={}))
+    assert tracker.get('1').status == CANCELED
+
+
+def test_reconnects_after_drop():
+    async def main():
+        tracker = OrderTracker()
+        tracker.track('1', 'BTCUSDT')
+        connect = FakeConnect(FakeSocket([frame('1', PARTIALLY_FILLED, 0.5)], error=OSError("reset")),
+                              FakeSocket([frame('1', FILLED, 1.0)]))
+        order = await run_until(tracker, FakeStream(), connect, '1')
+        assert order.status == FILLED
+        assert len(connect.opened) == 2
+
+    asyncio.run(main())
+
+
+def test_waits_before_reconnecting_after_clean_close():
+    async def main():
+        tracker = OrderTracker()
+        tracker.track('1', 'BTCUSDT')
+        connect = FakeConnect(FakeSocket([]), FakeSocket([frame('1', FILLED, 1.0)]))
+        await run_until(tracker, FakeStream(), connect, '1', reconnect_delay=0.05)
+        assert connect.opened[1] - connect.opened[0] >= 0.05
+
+    asyncio.run(main())
+
+
+def test_reconcile_applies_fill_the_stream_never_sent():
+    async def main():
+        tracker = OrderTracker()
+        tracker.track('1', 'BTCUSDT')
+        tracker.track('2')  # no symbol: cannot be looked up
+        stream = FakeStream(rest={'1': (FILLED, 2.0)})
+        connect = FakeConnect(FakeSocket([]))
+        order = await run_until(tracker, stream, connect, '1')
+        assert order.status == FILLED
+        assert order.filled_qty == 2.0
+        assert stream.fetched == ['1']
+
+    asyncio.run(main())
+
+
+def test_wait_times_out_and_returns_terminal_order_at_once():
+    async def main():
+        tracker = OrderTracker()
+        tracker.track('1', 'BTCUSDT')
+        with pytest.raises(asyncio.TimeoutError):
+            await tracker.wait('1', timeout=0.01)
+        tracker.apply(OrderUpdate('1', CANCELED))
+        order = await tracker.wait('1', timeout=0)
+        assert order.status == CANCELED
+
+    asyncio.run(main())
@@ -0,0 +1,30 @@
+import importlib
+
+import pytest
+
+from crypto_exchange.common import portfolio
+
+BUILDERS = [
+    ('binance', 'crypto_exchange.binance.get_balance_binance', portfolio._binance_sources, ('key', 'secret')),
+    ('bybit', 'crypto_exchange.bybit.get_balance_bybit', portfolio._bybit_sources, ('key', 'secret')),
+    ('okx', 'crypto_exchange.okx.get_balance_okx', portfolio._okx_sources, ('key', 'secret', 'pass')),
+    ('bitget', 'crypto_exchange.bitget.get_balance_bitget', portfolio._bitget_sources, ('key', 'secret', 'pass')),
+]
+
+
+@pytest.mark.parametrize('venue, module_name, build, credentials', BUILDERS)
+def test_sources_build_clients_on_first_fetch(monkeypatch, venue, module_name, build, credentials):
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        pytest.skip(f"{venue} SDK not installed: {e}")
+    built = []
+    monkeypatch.setattr(portfolio, 'get_client', lambda *args: built.append(args) or f"{venue} client")
+    monkeypatch.setattr(module, 'get_balance_rows', lambda client, account: [(client, account)])
+
+    sources = build(*credentials)
+    assert built == []
+
+    rows = sources[0].fetch()
+    assert rows[0][0] == f"{venue} client"
+    assert built == [(venue,) + credentials]
@@ -0,0 +1,35 @@
+from crypto_exchange.common.rate_limiter import VENUE_LIMITS, RateLimiter
+
+
+def test_bybit_endpoint_limit_does_not_throttle_other_endpoints():
+    limiter = RateLimiter('bybit', **VENUE_LIMITS['bybit'])
+    limiter.update_from_headers({'X-Bapi-Limit': '10', 'X-Bapi-Limit-Status': '0'}, '/v5/order/create')
+
+    assert limiter.weight.tokens == limiter.weight.capacity
+    assert limiter.acquire('/v5/market/tickers') == 0.0
+    assert limiter._reserve('/v5/order/create', 'POST', None) > 0
+
+
+def test_endpoint_headers_without_path_are_ignored():
+    limiter = RateLimiter('bybit', **VENUE_LIMITS['bybit'])
+    limiter.update_from_headers({'X-Bapi-Limit': '10', 'X-Bapi-Limit-Status': '0'})
+    assert limiter.endpoint_buckets == {}
+
+
+def test_bitget_remaining_count_only_throttles_its_endpoint():
+    limiter = RateLimiter('bitget', **VENUE_LIMITS['bitget'])
+    limiter.update_from_headers({'x-mbx-used-remain-limit': '0'}, '/api/mix/v1/order/placeOrder')
+
+    assert limiter.weight.tokens == limiter.weight.capacity
+    assert limiter.acquire('/api/mix/v1/market/ticker') == 0.0
+    assert limiter.endpoint_buckets['/api/mix/v1/order/placeOrder'].capacity == 10
+    assert limiter._reserve('/api/mix/v1/order/placeOrder', 'POST', None) > 0
+
+
+def test_mexc_futures_endpoints_have_separate_buckets():
+    limiter = RateLimiter('mexc_futures', **VENUE_LIMITS['mexc_futures'])
+    waits = [limiter._reserve('/api/v1/private/order/submit', 'POST', None) for _ in range(21)]
+
+    assert waits[:20] == [0.0] * 20 and waits[20] > 0
+    assert limiter.acquire('/api/v1/private/order/cancel', 'POST') == 0.0
+    assert limiter.metrics()['weight_tokens'] is None
@@ -1,10 +1,161 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import OperationFailure
+from pymongo.monitoring import ConnectionPoolListener
 from dotenv import load_dotenv
+from typing import Any, Dict, Optional
+import asyncio
+import logging
 import os
+import threading
 
 load_dotenv()  # đọc biến môi trường từ .env (nếu có)
 
+logger = logging.getLogger(__name__)
+
 MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017")
+DB_NAME = os.getenv("MONGO_DB", "fastapi_db")
+
+# Index cần có cho từng collection; tạo lúc khởi động bằng ensure_indexes()
+INDEXES = {
+    "users": [IndexModel([("id", ASCENDING)], unique=True, name="id_unique")],
+}
+
+
+def client_options_from_env() -> Dict[str, Any]:
+    """Cấu hình connection pool của Motor/PyMongo, đọc từ biến môi trường"""
+    options = {
+        "maxPoolSize": int(os.getenv("MONGO_MAX_POOL_SIZE", "100")),
+        "minPoolSize": int(os.getenv("MONGO_MIN_POOL_SIZE", "10")),
+        "maxIdleTimeMS": int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "300000")),
+        "waitQueueTimeoutMS": int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "2000")),
+        "serverSelectionTimeoutMS": int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000")),
+        "connectTimeoutMS": int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "5000")),
+        "socketTimeoutMS": int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", "10000")),
+    }
+    # Ví dụ "zstd,snappy,zlib"; zstd/snappy cần cài thêm package tương ứng
+    compressors = os.getenv("MONGO_COMPRESSORS")
+    if compressors:
+        options["compressors"] = compressors
+    return options
+
+
+class PoolMetrics(ConnectionPoolListener):
+    """Đếm trạng thái connection pool qua các event của PyMongo (được gọi từ nhiều thread)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.max_pool_size = 0
+        self.open = 0
+        self.checked_out = 0
+        self.waiting = 0
+        self.max_checked_out = 0
+        self.max_waiting = 0
+        self.checkouts = 0
+        self.checkout_failures = 0
+        self.pool_clears = 0
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self.pool_clears += 1
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        with self._lock:
+            self.open += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.open -= 1
+
+    def connection_check_out_started(self, event):
+        with self._lock:
+            self.waiting += 1
+            self.max_waiting = max(self.max_waiting, self.waiting)
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self.waiting -= 1
+            self.checkout_failures += 1
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            self.waiting -= 1
+            self.checked_out += 1
+            self.checkouts += 1
+            self.max_checked_out = max(self.max_checked_out, self.checked_out)
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.checked_out -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_pool_size": self.max_pool_size,
+                "open": self.open,
+                "checked_out": self.checked_out,
+                "waiting": self.waiting,
+                "utilization": self.checked_out / self.max_pool_size if self.max_pool_size else 0.0,
+                "max_checked_out": self.max_checked_out,
+                "max_waiting": self.max_waiting,
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "pool_clears": self.pool_clears,
+            }
+
+
+pool_metrics = PoolMetrics()
+_client: Optional[AsyncIOMotorClient] = None
+
+
+async def connect() -> AsyncIOMotorClient:
+    """Tạo client (gọi trong lifespan lúc khởi động) và mở sẵn minPoolSize connection"""
+    global _client
+    if _client is not None:
+        return _client
+    options = client_options_from_env()
+    pool_metrics.max_pool_size = options["maxPoolSize"]
+    client = AsyncIOMotorClient(MONGO_URL, event_listeners=[pool_metrics], **options)
+    # Ping song song để request đầu tiên không phải chờ bắt tay TCP/TLS và xác thực
+    warm = max(1, int(os.getenv("MONGO_WARM_CONNECTIONS", str(options["minPoolSize"]))))
+    await asyncio.gather(*(client.admin.command("ping") for _ in range(warm)))
+    _client = client
+    logger.info(f"MongoDB connected, {pool_metrics.open} connection(s) open")
+    return client
+
+
+async def close() -> None:
+    """Đóng client (gọi trong lifespan lúc tắt)"""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+
+
+def get_db() -> AsyncIOMotorDatabase:
+    if _client is None:
+        raise RuntimeError("MongoDB client is not connected; call connect() first (done by the app lifespan)")
+    return _client[DB_NAME]
+
 
-client = AsyncIOMotorClient(MONGO_URL)
-db = client["fastapi_db"]
\ No newline at end of file
+async def ensure_indexes(database: Optional[AsyncIOMotorDatabase] = None) -> None:
+    database = database if database is not None else get_db()
+    for collection, indexes in INDEXES.items():
+        try:
+            # create_indexes không làm gì nếu index đã tồn tại với cùng định nghĩa
+            await database[collection].create_indexes(indexes)
+        except OperationFailure as e:
+            # Ví dụ: dữ liệu cũ có id trùng nên không tạo được unique index; vẫn cho app chạy
+            logger.error(f"Could not create indexes on {collection}: {e}")
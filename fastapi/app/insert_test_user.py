@@ -1,11 +1,16 @@
 import asyncio
-from database import db
+from database import close, connect, get_db
 
 async def insert_user():
-    await db["users"].insert_one({
-        "id": 1,
-        "name": "Chồng yêu",
-        "email": "chongyeu@example.com"
-    })
+    await connect()
+    try:
+        # upsert: chạy lại nhiều lần không tạo user trùng id (collection có unique index trên id)
+        await get_db()["users"].update_one(
+            {"id": 1},
+            {"$set": {"name": "Chồng yêu", "email": "chongyeu@example.com"}},
+            upsert=True,
+        )
+    finally:
+        await close()
 
-asyncio.run(insert_user())
\ No newline at end of file
+asyncio.run(insert_user())
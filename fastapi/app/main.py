@@ -1,6 +1,25 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from app.database import close, connect, ensure_indexes, pool_metrics
 from app.routers import user
 
-app = FastAPI()
 
-app.include_router(user.router)
\ No newline at end of file
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await connect()
+    await ensure_indexes()
+    try:
+        yield
+    finally:
+        await close()
+
+
+app = FastAPI(lifespan=lifespan)
+
+app.include_router(user.router)
+
+
+@app.get("/metrics/db")
+async def read_db_pool_metrics():
+    return pool_metrics.snapshot()
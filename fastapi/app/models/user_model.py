@@ -1,6 +1,15 @@
-from pydantic import BaseModel
+from typing import List
+
+from pydantic import BaseModel, Field
+
+MAX_BATCH_IDS = 1000
+
 
 class User(BaseModel):
     id: int
     name: str
-    email: str
\ No newline at end of file
+    email: str
+
+
+class UserBatchRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=MAX_BATCH_IDS)
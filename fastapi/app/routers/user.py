@@ -1,8 +1,19 @@
 from fastapi import APIRouter
-from app.services.user_service import get_user_info
+from app.models.user_model import UserBatchRequest
+from app.services.user_loader import user_loader
+from app.services.user_service import get_user_info, get_users_info, user_cache
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
+@router.get("/cache/stats")
+async def read_user_cache_stats():
+    return {**user_cache.stats(), "loader": user_loader.stats()}
+
+@router.post("/batch")
+async def read_users_batch(request: UserBatchRequest):
+    # Tối đa MAX_BATCH_IDS user, đã qua cache nên trả về một lần là đủ
+    return await get_users_info(request.ids)
+
 @router.get("/{user_id}")
 async def read_user(user_id: int):
-    return await get_user_info(user_id)
\ No newline at end of file
+    return await get_user_info(user_id)
@@ -0,0 +1,288 @@
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+_MISSING = object()
+
+
+class LRUTTLCache:
+    """Cache trong tiến trình: giới hạn số phần tử (LRU) và thời gian sống (TTL) cho từng key"""
+
+    def __init__(self, max_size: int = 10_000):
+        self.max_size = max_size
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return _MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class InMemorySharedCache:
+    """Thay thế tầng cache dùng chung (Redis) khi test hoặc chạy local"""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[float, str]] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return entry[1]
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+
+    async def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        return [await self.get(key) for key in keys]
+
+    async def set_many(self, items: List[Tuple[str, str, float]]) -> None:
+        for key, value, ttl in items:
+            await self.set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+
+class RedisSharedCache:
+    """Tầng cache dùng chung giữa các worker, qua redis.asyncio"""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url)
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self._redis.get(key)
+        return value.decode() if value is not None else None
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        await self._redis.set(key, value, px=int(ttl * 1000))
+
+    async def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        values = await self._redis.mget(keys)
+        return [value.decode() if value is not None else None for value in values]
+
+    async def set_many(self, items: List[Tuple[str, str, float]]) -> None:
+        # Một round trip cho cả lô
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, value, ttl in items:
+                pipe.set(key, value, px=int(ttl * 1000))
+            await pipe.execute()
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(key)
+
+
+def shared_cache_from_env() -> Optional[RedisSharedCache]:
+    # Chỉ bật tầng dùng chung khi có REDIS_URL và đã cài redis
+    url = os.getenv("REDIS_URL")
+    if not url:
+        return None
+    try:
+        return RedisSharedCache(url)
+    except ImportError:
+        return None
+
+
+class ReadThroughCache:
+    def __init__(
+        self,
+        loader: Callable[[Any], Awaitable[Any]],
+        namespace: str,
+        load_many: Optional[Callable[[List[Any]], Awaitable[Dict[Any, Any]]]] = None,
+        ttl: float = 60.0,
+        negative_ttl: float = 10.0,
+        max_size: int = 10_000,
+        is_negative: Callable[[Any], bool] = lambda value: value is None,
+        shared: Optional[Any] = None,
+        encode: Callable[[Any], Any] = lambda value: value,
+        decode: Callable[[Any], Any] = lambda data: data,
+    ):
+        """
+        Đọc qua cache: local LRU/TTL -> tầng dùng chung (tùy chọn) -> loader
+
+        - Kết quả "không tìm thấy" (is_negative) cũng được cache, với negative_ttl ngắn hơn
+        - Nhiều request cùng key trong lúc đang tải chỉ gọi loader một lần (single-flight)
+        - encode/decode chuyển giá trị sang dạng JSON được cho tầng dùng chung
+        - load_many (tùy chọn) tải nhiều key trong một lần, dùng cho get_many()
+        """
+        self.loader = loader
+        self.namespace = namespace
+        self.load_many = load_many
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.is_negative = is_negative
+        self.local = LRUTTLCache(max_size)
+        self.shared = shared
+        self.encode = encode
+        self.decode = decode
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.counters = {
+            "hits": 0,
+            "negative_hits": 0,
+            "shared_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "errors": 0,
+        }
+
+    def _shared_key(self, key: Hashable) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _store_local(self, key: Hashable, value: Any) -> float:
+        ttl = self.negative_ttl if self.is_negative(value) else self.ttl
+        self.local.set(key, value, ttl)
+        return ttl
+
+    async def get(self, key: Hashable) -> Any:
+        value = self.local.get(key)
+        if value is not _MISSING:
+            self.counters["negative_hits" if self.is_negative(value) else "hits"] += 1
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            # Tải trong task riêng: request đầu tiên bị hủy không làm hỏng các request đang chờ chung
+            task = asyncio.ensure_future(self._fetch(key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._finish(key, done))
+        else:
+            self.counters["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            self.counters["errors"] += 1
+
+    async def _fetch(self, key: Hashable) -> Any:
+        if self.shared is not None:
+            data = await self.shared.get(self._shared_key(key))
+            if data is not None:
+                self.counters["shared_hits"] += 1
+                value = self.decode(json.loads(data))
+                self._store_local(key, value)
+                return value
+
+        self.counters["misses"] += 1
+        value = await self.loader(key)
+        ttl = self._store_local(key, value)
+        if self.shared is not None:
+            await self.shared.set(self._shared_key(key), json.dumps(self.encode(value)), ttl)
+        return value
+
+    async def get_many(self, keys: List[Hashable]) -> List[Any]:
+        """Như get() cho nhiều key, giữ đúng thứ tự; các key chưa có được tải bằng một lần load_many"""
+        if self.load_many is None:
+            return list(await asyncio.gather(*(self.get(key) for key in keys)))
+
+        values: Dict[Hashable, Any] = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            value = self.local.get(key)
+            if value is _MISSING:
+                missing.append(key)
+            else:
+                self.counters["negative_hits" if self.is_negative(value) else "hits"] += 1
+                values[key] = value
+
+        # Key đang được tải dở (bởi get() hoặc get_many() khác) thì chờ kết quả đó thay vì tải lại
+        waiting = [key for key in missing if key in self._inflight]
+        pending = [asyncio.shield(self._inflight[key]) for key in waiting]
+        missing = [key for key in missing if key not in self._inflight]
+        self.counters["coalesced"] += len(waiting)
+
+        task = None
+        if missing:
+            # Đăng ký từng key vào _inflight trước khi await, để các request đồng thời chờ chung lần tải này
+            loop = asyncio.get_running_loop()
+            task = asyncio.ensure_future(self._fetch_many(missing))
+            futures = {}
+            for key in missing:
+                future = futures[key] = self._inflight[key] = loop.create_future()
+                future.add_done_callback(lambda done, key=key: self._finish(key, done))
+            task.add_done_callback(lambda done: self._resolve(futures, done))
+
+        if pending:
+            values.update(zip(waiting, await asyncio.gather(*pending)))
+        if task is not None:
+            values.update(await asyncio.shield(task))
+
+        return [values[key] for key in keys]
+
+    @staticmethod
+    def _resolve(futures: Dict[Hashable, asyncio.Future], task: asyncio.Task) -> None:
+        for key, future in futures.items():
+            if future.done():
+                continue
+            if task.cancelled():
+                future.cancel()
+            elif task.exception() is not None:
+                future.set_exception(task.exception())
+            else:
+                future.set_result(task.result()[key])
+
+    async def _fetch_many(self, missing: List[Hashable]) -> Dict[Hashable, Any]:
+        values: Dict[Hashable, Any] = {}
+        if self.shared is not None:
+            cached = await self.shared.get_many([self._shared_key(key) for key in missing])
+            for key, data in zip(missing, cached):
+                if data is not None:
+                    self.counters["shared_hits"] += 1
+                    values[key] = self.decode(json.loads(data))
+                    self._store_local(key, values[key])
+            missing = [key for key in missing if key not in values]
+
+        if missing:
+            self.counters["misses"] += len(missing)
+            loaded = await self.load_many(missing)
+            stored = []
+            for key in missing:
+                values[key] = loaded[key]
+                ttl = self._store_local(key, values[key])
+                if self.shared is not None:
+                    stored.append((self._shared_key(key), json.dumps(self.encode(values[key])), ttl))
+            if stored:
+                await self.shared.set_many(stored)
+        return values
+
+    async def invalidate(self, key: Hashable) -> None:
+        """Gọi sau khi ghi dữ liệu của key vào DB"""
+        self.local.delete(key)
+        if self.shared is not None:
+            await self.shared.delete(self._shared_key(key))
+
+    def stats(self) -> Dict[str, Any]:
+        hits = sum(self.counters[name] for name in ("hits", "negative_hits", "shared_hits", "coalesced"))
+        lookups = hits + self.counters["misses"]
+        return {
+            **self.counters,
+            "size": len(self.local),
+            "hit_ratio": hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,110 @@
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, List, Optional, TypeVar
+
+from app.database import get_db
+from app.models.user_model import User
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+NOT_FOUND_NAME = "Không tìm thấy"
+
+# Chỉ lấy các field của User (bỏ _id và field thừa) để giảm dữ liệu trả về từ Mongo
+USER_PROJECTION = {"_id": 0, **{field: 1 for field in User.model_fields}}
+
+
+class DataLoader(Generic[K, V]):
+    def __init__(
+        self,
+        batch_load: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        max_batch_size: int = 100,
+        max_wait: float = 0.0,
+    ):
+        """
+        Gom các load() đồng thời thành một lần batch_load
+
+        - max_wait = 0: gom các request đến trong cùng một vòng event loop (per tick)
+        - max_wait > 0: chờ thêm tối đa max_wait giây để gom được lô lớn hơn
+        - Đủ max_batch_size key thì gửi ngay, không chờ
+        """
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._pending: Dict[K, asyncio.Future] = {}
+        self._timer: Optional[asyncio.Handle] = None
+        self.counters = {"loads": 0, "batches": 0, "max_batch": 0}
+
+    async def load(self, key: K) -> V:
+        self.counters["loads"] += 1
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                if self.max_wait > 0:
+                    self._timer = loop.call_later(self.max_wait, self._dispatch)
+                else:
+                    # call_soon chạy sau các coroutine đã sẵn sàng trong vòng này, nên gom được cả tick
+                    self._timer = loop.call_soon(self._dispatch)
+        # shield: một request bị hủy không hủy kết quả chung của các request khác
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            self.counters["batches"] += 1
+            self.counters["max_batch"] = max(self.counters["max_batch"], len(batch))
+            asyncio.ensure_future(self._run(batch))
+
+    async def _run(self, batch: Dict[K, asyncio.Future]) -> None:
+        results: Dict[K, V] = {}
+        error: Optional[BaseException] = None
+        try:
+            results = await self.batch_load(list(batch))
+        except asyncio.CancelledError:
+            error = RuntimeError("batch load was cancelled")
+            raise
+        except Exception as e:
+            error = e
+        finally:
+            # Future nào cũng phải được giải quyết, nếu không các request đang chờ sẽ treo mãi
+            for key, future in batch.items():
+                if future.done():
+                    continue
+                if error is None and key in results:
+                    future.set_result(results[key])
+                    continue
+                future.set_exception(error or KeyError(f"batch_load returned no value for {key!r}"))
+                future.exception()  # không ai chờ thì cũng không cảnh báo
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "pending": len(self._pending),
+            "avg_batch": self.counters["loads"] / self.counters["batches"] if self.counters["batches"] else 0.0,
+        }
+
+
+def not_found_user(user_id: int) -> User:
+    return User(id=user_id, name=NOT_FOUND_NAME, email="na")
+
+
+async def load_users(user_ids: List[int]) -> Dict[int, User]:
+    # Một query $in cho cả lô thay vì một find_one cho mỗi id
+    users = {user_id: not_found_user(user_id) for user_id in user_ids}
+    async for user_data in get_db()["users"].find({"id": {"$in": user_ids}}, USER_PROJECTION):
+        users[user_data["id"]] = User(**user_data)
+    return users
+
+
+user_loader: DataLoader[int, User] = DataLoader(
+    load_users,
+    max_batch_size=int(os.getenv("USER_LOADER_MAX_BATCH", "100")),
+    max_wait=float(os.getenv("USER_LOADER_MAX_WAIT_MS", "0")) / 1000,
+)
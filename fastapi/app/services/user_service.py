@@ -1,8 +1,29 @@
-from app.database import db
+import os
+from typing import List
+
 from app.models.user_model import User
+from app.services.cache import ReadThroughCache, shared_cache_from_env
+from app.services.user_loader import NOT_FOUND_NAME, load_users, user_loader
+
+user_cache = ReadThroughCache(
+    # Cache miss đi qua DataLoader: các miss đồng thời được gom thành một query $in
+    user_loader.load,
+    namespace="user",
+    load_many=load_users,
+    ttl=float(os.getenv("USER_CACHE_TTL", "60")),
+    negative_ttl=float(os.getenv("USER_CACHE_NEGATIVE_TTL", "10")),
+    max_size=int(os.getenv("USER_CACHE_SIZE", "10000")),
+    is_negative=lambda user: user.name == NOT_FOUND_NAME,
+    shared=shared_cache_from_env(),
+    encode=lambda user: user.model_dump(),
+    decode=lambda data: User(**data),
+)
+
 
 async def get_user_info(user_id: int) -> User:
-    user_data = await db["users"].find_one({"id": user_id})
-    if user_data:
-        return User(**user_data)
-    return User(id=user_id, name="Không tìm thấy", email="na")
\ No newline at end of file
+    return await user_cache.get(user_id)
+
+
+async def get_users_info(user_ids: List[int]) -> List[User]:
+    """Giữ đúng thứ tự (và id lặp lại) của user_ids; id không tồn tại nhận user NOT_FOUND_NAME"""
+    return await user_cache.get_many(user_ids)
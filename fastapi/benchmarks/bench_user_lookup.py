@@ -0,0 +1,72 @@
+"""
+Độ trễ tra cứu user trên MongoDB local: không index vs index trên id vs index + projection
+
+Seed N user (kèm một field lớn để thấy tác dụng của projection) vào database
+riêng "fastapi_bench", rồi đo p50/p99 của find_one({"id": ...}) với id ngẫu nhiên.
+
+Chạy từ thư mục fastapi (cần MongoDB local hoặc MONGO_URL):
+    python -m benchmarks.bench_user_lookup [n_users] [n_lookups]
+"""
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.database import INDEXES, client_options_from_env
+from app.services.user_loader import USER_PROJECTION
+
+BATCH = 10_000
+
+
+def percentile(samples, q):
+    return statistics.quantiles(samples, n=100)[q - 1]
+
+
+async def seed(collection, n_users):
+    await collection.drop()
+    padding = "x" * 2_000  # field không có trong model User
+    for start in range(0, n_users, BATCH):
+        await collection.insert_many([
+            {"id": i, "name": f"user {i}", "email": f"user{i}@example.com", "profile": padding}
+            for i in range(start, min(start + BATCH, n_users))
+        ])
+
+
+async def measure(collection, ids, projection=None):
+    samples = []
+    for user_id in ids:
+        start = time.perf_counter()
+        await collection.find_one({"id": user_id}, projection)
+        samples.append((time.perf_counter() - start) * 1000)
+    return percentile(samples, 50), percentile(samples, 99)
+
+
+async def main():
+    n_users = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    n_lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    client = AsyncIOMotorClient(os.getenv("MONGO_URL", "mongodb://localhost:27017"), **client_options_from_env())
+    collection = client["fastapi_bench"]["users"]
+    try:
+        print(f"seeding {n_users:,} users ...")
+        await seed(collection, n_users)
+        ids = [random.randrange(n_users) for _ in range(n_lookups)]
+
+        results = {"collection scan": await measure(collection, ids[:max(20, n_lookups // 20)])}
+        await collection.create_indexes(INDEXES["users"])
+        results["index on id"] = await measure(collection, ids)
+        results["index + projection"] = await measure(collection, ids, USER_PROJECTION)
+
+        print(f"{'':22s} {'p50 ms':>8s} {'p99 ms':>8s}")
+        for name, (p50, p99) in results.items():
+            print(f"{name:22s} {p50:8.3f} {p99:8.3f}")
+    finally:
+        await client.drop_database("fastapi_bench")
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,138 @@
+import asyncio
+import json
+
+from app.services.cache import InMemorySharedCache, ReadThroughCache
+
+
+class Source:
+    """Stand-in for load_users: records every call and blocks until released"""
+
+    def __init__(self, missing=()):
+        self.missing = set(missing)
+        self.calls = []
+        self.many_calls = []
+        self.release = asyncio.Event()
+
+    def value(self, key):
+        return None if key in self.missing else f"user {key}"
+
+    async def load(self, key):
+        self.calls.append(key)
+        await self.release.wait()
+        return self.value(key)
+
+    async def load_many(self, keys):
+        self.many_calls.append(list(keys))
+        await self.release.wait()
+        return {key: self.value(key) for key in keys}
+
+
+def make_cache(source, **kwargs):
+    return ReadThroughCache(source.load, namespace="user", load_many=source.load_many, **kwargs)
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_concurrent_gets_share_one_load():
+    async def main():
+        source = Source()
+        cache = make_cache(source)
+        waiters = [asyncio.ensure_future(cache.get(1)) for _ in range(5)]
+        await settle()
+        source.release.set()
+        values = await asyncio.gather(*waiters)
+        assert values == ["user 1"] * 5
+        assert source.calls == [1]
+        assert cache.counters["coalesced"] == 4
+        assert await cache.get(1) == "user 1"
+        assert cache.counters["hits"] == 1
+
+    asyncio.run(main())
+
+
+def test_negative_results_expire_after_negative_ttl():
+    async def main():
+        source = Source(missing={2})
+        source.release.set()
+        cache = make_cache(source, ttl=60, negative_ttl=0.05)
+        assert await cache.get(1) == "user 1"
+        assert await cache.get(2) is None
+        assert await cache.get(2) is None
+        assert cache.counters["negative_hits"] == 1
+        await asyncio.sleep(0.1)
+        assert await cache.get(2) is None
+        assert await cache.get(1) == "user 1"
+        assert source.calls == [1, 2, 2]
+
+    asyncio.run(main())
+
+
+def test_get_many_waits_for_a_get_already_loading():
+    async def main():
+        source = Source()
+        cache = make_cache(source)
+        single = asyncio.ensure_future(cache.get(1))
+        await settle()
+        many = asyncio.ensure_future(cache.get_many([1, 2, 1]))
+        await settle()
+        # And a get() arriving now waits for the get_many load of key 2
+        late = asyncio.ensure_future(cache.get(2))
+        await settle()
+        source.release.set()
+        assert await many == ["user 1", "user 2", "user 1"]
+        assert await single == "user 1"
+        assert await late == "user 2"
+        assert source.calls == [1]
+        assert source.many_calls == [[2]]
+
+    asyncio.run(main())
+
+
+def test_cancelled_first_caller_does_not_fail_the_others():
+    async def main():
+        source = Source()
+        cache = make_cache(source)
+        first = asyncio.ensure_future(cache.get(1))
+        await settle()
+        second = asyncio.ensure_future(cache.get(1))
+        many = asyncio.ensure_future(cache.get_many([3]))
+        await settle()
+        batched = asyncio.ensure_future(cache.get(3))
+        await settle()
+        first.cancel()
+        many.cancel()
+        await settle()
+        source.release.set()
+        assert await second == "user 1"
+        assert await batched == "user 3"
+        assert first.cancelled() and many.cancelled()
+        assert source.calls == [1]
+        assert await cache.get(1) == "user 1"
+
+    asyncio.run(main())
+
+
+def test_shared_tier_serves_other_workers():
+    async def main():
+        shared = InMemorySharedCache()
+        source = Source(missing={2})
+        source.release.set()
+        worker_a = make_cache(source, shared=shared, negative_ttl=0.05)
+        worker_b = make_cache(source, shared=shared, negative_ttl=0.05)
+        assert await worker_a.get_many([1, 2]) == ["user 1", None]
+        assert json.loads(await shared.get("user:1")) == "user 1"
+
+        assert await worker_b.get(1) == "user 1"
+        assert await worker_b.get_many([2]) == [None]
+        assert worker_b.counters["shared_hits"] == 2
+        assert source.calls == [] and source.many_calls == [[1, 2]]
+
+        await asyncio.sleep(0.1)
+        assert await shared.get("user:2") is None
+        await worker_a.invalidate(1)
+        assert await shared.get("user:1") is None
+
+    asyncio.run(main())
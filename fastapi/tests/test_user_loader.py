@@ -0,0 +1,100 @@
+import asyncio
+
+from app.models.user_model import User
+from app.services import user_service
+from app.services.user_loader import NOT_FOUND_NAME, DataLoader, not_found_user
+
+
+class BatchSource:
+    def __init__(self, missing=(), error=None):
+        self.missing = set(missing)
+        self.error = error
+        self.batches = []
+
+    async def __call__(self, keys):
+        self.batches.append(list(keys))
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return {key: key * 10 for key in keys if key not in self.missing}
+
+
+def test_loads_in_one_tick_share_a_batch():
+    async def main():
+        source = BatchSource()
+        loader = DataLoader(source)
+        assert await asyncio.gather(*(loader.load(key) for key in (1, 2, 1, 3))) == [10, 20, 10, 30]
+        assert source.batches == [[1, 2, 3]]
+        assert loader.stats()["loads"] == 4
+
+    asyncio.run(main())
+
+
+def test_full_batch_is_dispatched_without_waiting():
+    async def main():
+        source = BatchSource()
+        loader = DataLoader(source, max_batch_size=2, max_wait=0.2)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        waiters = [asyncio.ensure_future(loader.load(key)) for key in range(5)]
+        await asyncio.gather(*waiters[:4])
+        assert loop.time() - started < 0.1
+        assert source.batches == [[0, 1], [2, 3]]
+        assert await waiters[4] == 40
+        assert loop.time() - started >= 0.2
+        assert source.batches[-1] == [4]
+
+    asyncio.run(main())
+
+
+def test_max_wait_collects_loads_across_ticks():
+    async def main():
+        source = BatchSource()
+        loader = DataLoader(source, max_wait=0.1)
+        first = asyncio.ensure_future(loader.load(1))
+        await asyncio.sleep(0.02)
+        second = asyncio.ensure_future(loader.load(2))
+        assert await asyncio.gather(first, second) == [10, 20]
+        assert source.batches == [[1, 2]]
+
+    asyncio.run(main())
+
+
+def test_missing_keys_and_errors_resolve_every_waiter():
+    async def main():
+        source = BatchSource(missing={2})
+        loader = DataLoader(source)
+        results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+        assert results[0] == 10
+        assert isinstance(results[1], KeyError)
+
+        failing = DataLoader(BatchSource(error=ConnectionError("mongo down")))
+        results = await asyncio.gather(failing.load(1), failing.load(2), return_exceptions=True)
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+    asyncio.run(main())
+
+
+def test_get_users_info_with_load_users_stubbed(monkeypatch):
+    stored = {1: User(id=1, name="An", email="an@example.com")}
+    calls = []
+
+    async def load_users(user_ids):
+        calls.append(list(user_ids))
+        return {user_id: stored.get(user_id) or not_found_user(user_id) for user_id in user_ids}
+
+    monkeypatch.setattr(user_service.user_loader, "batch_load", load_users)
+    monkeypatch.setattr(user_service.user_cache, "load_many", load_users)
+    user_service.user_cache.local.clear()
+
+    async def main():
+        users = await user_service.get_users_info([1, 2, 1])
+        assert [user.id for user in users] == [1, 2, 1]
+        assert users[0].name == "An" and users[1].name == NOT_FOUND_NAME
+        assert (await user_service.get_user_info(2)).name == NOT_FOUND_NAME
+        assert calls == [[1, 2]]
+
+    try:
+        asyncio.run(main())
+    finally:
+        user_service.user_cache.local.clear()